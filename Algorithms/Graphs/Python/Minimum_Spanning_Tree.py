@@ -0,0 +1,279 @@
+"""
+Minimum Spanning Tree Implementation
+
+A minimum spanning tree (MST) of a weighted undirected graph connects all
+its vertices with the smallest possible total edge weight. If the graph is
+disconnected, the result is a minimum spanning forest: one tree per
+connected component.
+
+This module provides the two classic greedy algorithms:
+- Kruskal: take the edges from lightest to heaviest, keeping an edge when
+  it joins two different trees. A UnionFind tracks the trees. The edges of
+  a Graph are sorted in memory; a plain edge iterable is sorted with
+  `external_sort` or streamed in already sorted order, so edge lists much
+  larger than memory can be processed.
+- Prim: grow one tree from a start vertex, always adding the lightest edge
+  leaving the tree, found with a binary heap.
+
+Both work on the `Graph` class and on graph views (weighted graphs store
+(vertex, weight) tuples; unweighted edges count as weight 1) and return the tree either as a
+new Graph or as an iterator of (vertex, vertex, weight) edges.
+"""
+
+import heapq
+from operator import itemgetter
+
+from Algorithms.Sorting.Python.External_Merge_Sort import external_sort
+from Data_Structures.Graphs.Python.Graphs import Graph
+from Data_Structures.Union_Find.Python.Union_Find import UnionFind
+
+
+def _check_undirected(graph):
+    """
+    Reject directed graphs, for which spanning trees are not defined here.
+
+    Args:
+        graph: The Graph.
+
+    Raises:
+        ValueError: If the graph is directed.
+    """
+    if graph.directed:
+        raise ValueError("Minimum spanning trees require an undirected graph")
+
+
+def _is_weighted(graph):
+    """
+    Check if a graph stores (vertex, weight) tuples.
+
+    Args:
+        graph: The Graph.
+
+    Returns:
+        bool: True if the graph is weighted.
+    """
+    return any(neighbors and isinstance(neighbors[0], tuple)
+               for neighbors in graph.adjacency.values())
+
+
+def _indexed_edges(graph, vertices):
+    """
+    List every undirected edge of a graph once, using vertex indices.
+
+    Args:
+        graph: The Graph.
+        vertices: The vertices, in index order.
+
+    Returns:
+        list: (weight, first index, second index) tuples with first < second.
+    """
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    edges = []
+    for i, neighbors in enumerate(graph.adjacency.values()):
+        # Each edge is stored on both endpoints: keep it once, and skip self-loops
+        if neighbors and isinstance(neighbors[0], tuple):
+            edges.extend([(weight, i, j) for neighbor, weight in neighbors
+                          if (j := index[neighbor]) > i])
+        else:
+            edges.extend([(1, i, j) for neighbor in neighbors if (j := index[neighbor]) > i])
+    return edges
+
+
+def _to_graph(graph, edges, weighted):
+    """
+    Build the tree of a graph as a new graph of the same class (a plain
+    Graph for graph views).
+
+    Tree edges are unique, so they are appended to the adjacency lists
+    directly instead of going through add_edge, which scans for duplicates.
+
+    Args:
+        graph: The original Graph (all its vertices are kept).
+        edges: The tree edges as (vertex, vertex, weight) tuples.
+        weighted: Store the weights in the new graph.
+
+    Returns:
+        Graph: The spanning tree or forest.
+    """
+    tree = (type(graph) if isinstance(graph, Graph) else Graph)(directed=False)
+    adjacency = tree.adjacency
+    for vertex in graph.adjacency:
+        adjacency[vertex] = []
+    for u, v, weight in edges:
+        if weighted:
+            adjacency[u].append((v, weight))
+            adjacency[v].append((u, weight))
+        else:
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+    return tree
+
+
+def kruskal_edges(source, presorted=False):
+    """
+    Find the edges of a minimum spanning forest with Kruskal's algorithm.
+
+    The edges of a Graph are listed and sorted in memory, which takes O(E)
+    memory on top of the graph itself. An iterable of edges is sorted with
+    `external_sort`, which spills runs of 100,000 edges to temporary files,
+    so only about one run is held at a time (the vertices must then be
+    picklable). With `presorted=True` the edges are not sorted at all.
+
+    Args:
+        source: A Graph, or an iterable of (vertex, vertex, weight) edges.
+        presorted: For an iterable, whether the edges already come in
+            ascending order of weight. Sorted edges are streamed through
+            without being stored, so the memory used is only the UnionFind
+            over the vertices (default: False).
+
+    Yields:
+        tuple: The (vertex, vertex, weight) edges of the forest, in
+            ascending order of weight.
+
+    Raises:
+        ValueError: If the graph is directed.
+    """
+    if hasattr(source, "adjacency"):
+        _check_undirected(source)
+        vertices = list(source.adjacency)
+        edges = _indexed_edges(source, vertices)
+        edges.sort()
+        forest = UnionFind(range(len(vertices)))
+        for weight, i, j in edges:
+            if forest.count == 1:
+                return  # Everything is connected: no later edge can be used
+            if forest.union(i, j):
+                yield vertices[i], vertices[j], weight
+        return
+
+    if not presorted:
+        source = external_sort(source, key=itemgetter(2))
+    forest = UnionFind()
+    for u, v, weight in source:
+        forest.add(u)
+        forest.add(v)
+        if forest.union(u, v):
+            yield u, v, weight
+
+
+def kruskal(graph):
+    """
+    Build a minimum spanning forest of a graph with Kruskal's algorithm.
+
+    Args:
+        graph: An undirected Graph.
+
+    Returns:
+        Graph: A new undirected graph with all the vertices and the edges of
+            the forest (weighted if the original graph is).
+
+    Raises:
+        ValueError: If the graph is directed.
+    """
+    return _to_graph(graph, kruskal_edges(graph), _is_weighted(graph))
+
+
+def prim_edges(graph, start=None):
+    """
+    Find the edges of a minimum spanning forest with Prim's algorithm.
+
+    The tree grows from `start`; when its component is exhausted, a new
+    tree grows from the next unvisited vertex, so disconnected graphs give
+    a forest.
+
+    The heap holds candidate edges leaving the tree. A candidate is only
+    pushed if it is lighter than the best one already pushed for its far
+    end, and stale candidates (whose far end joined the tree first) are
+    skipped when popped, so the algorithm runs in O(E log V) time.
+
+    Args:
+        graph: An undirected Graph.
+        start: Optional vertex to grow the first tree from (default: the
+            first vertex of the graph).
+
+    Yields:
+        tuple: The (parent, vertex, weight) edges of the forest, in the
+            order the vertices join the tree.
+
+    Raises:
+        ValueError: If the graph is directed.
+        KeyError: If the start vertex is not in the graph.
+    """
+    _check_undirected(graph)
+    vertices = list(graph.adjacency)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    if start is not None and start not in index:
+        raise KeyError(f"Vertex '{start}' not found")
+    # Neighbor lists as (weight, index) pairs, so heap entries compare numbers only
+    neighbors = []
+    for entries in graph.adjacency.values():
+        if entries and isinstance(entries[0], tuple):
+            neighbors.append([(weight, index[vertex]) for vertex, weight in entries])
+        else:
+            neighbors.append([(1, index[vertex]) for vertex in entries])
+
+    visited = bytearray(len(vertices))
+    best = [None] * len(vertices)  # Lightest candidate edge pushed so far, per vertex
+    roots = range(len(vertices)) if start is None else [index[start], *range(len(vertices))]
+    for root in roots:
+        if visited[root]:
+            continue
+        visited[root] = 1
+        heap = [(weight, root, j) for weight, j in neighbors[root]]
+        heapq.heapify(heap)
+        while heap:
+            weight, i, j = heapq.heappop(heap)
+            if visited[j]:
+                continue  # Stale candidate: j joined the tree through a lighter edge
+            visited[j] = 1
+            yield vertices[i], vertices[j], weight
+            for weight, k in neighbors[j]:
+                # Only push candidates lighter than k's current best one
+                if not visited[k] and (best[k] is None or weight < best[k]):
+                    best[k] = weight
+                    heapq.heappush(heap, (weight, j, k))
+
+
+def prim(graph, start=None):
+    """
+    Build a minimum spanning forest of a graph with Prim's algorithm.
+
+    Args:
+        graph: An undirected Graph.
+        start: Optional vertex to grow the first tree from.
+
+    Returns:
+        Graph: A new undirected graph with all the vertices and the edges of
+            the forest (weighted if the original graph is).
+
+    Raises:
+        ValueError: If the graph is directed.
+        KeyError: If the start vertex is not in the graph.
+    """
+    return _to_graph(graph, prim_edges(graph, start), _is_weighted(graph))
+
+
+# Example usage
+if __name__ == "__main__":
+    # A small road network: weights are construction costs
+    roads = Graph()
+    for a, b, cost in [("A", "B", 4), ("A", "C", 1), ("B", "C", 2), ("B", "D", 5),
+                       ("C", "D", 8), ("D", "E", 3), ("C", "E", 9)]:
+        roads.add_edge(a, b, cost)
+    print("Road network:")
+    print(roads)
+
+    print("\nStep 1: Kruskal (edges from lightest to heaviest)")
+    for edge in kruskal_edges(roads):
+        print("  Take", edge)
+    tree = kruskal(roads)
+    print("Total cost:", sum(weight for _, _, weight in tree.get_edges()))
+
+    print("\nStep 2: Prim from 'E' (growing one tree with a heap)")
+    for edge in prim_edges(roads, start="E"):
+        print("  Add", edge)
+    print("Total cost:", sum(weight for _, _, weight in prim(roads, start="E").get_edges()))
+
+    print("\nStep 3: Kruskal over a stream of edges sorted by weight")
+    stream = iter([("x", "y", 1), ("y", "z", 2), ("x", "z", 3), ("z", "w", 4)])
+    print("  Tree edges:", list(kruskal_edges(stream, presorted=True)))
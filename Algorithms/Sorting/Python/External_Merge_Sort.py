@@ -0,0 +1,226 @@
+"""
+External Merge Sort Implementation
+
+External merge sort sorts data that doesn't fit in memory:
+1. The input is read in runs of at most `run_size` elements. Each run is
+   sorted in memory and spilled to a temporary file.
+2. The sorted runs are merged with a heap (a k-way merge), which only needs
+   one buffered block per run in memory at a time.
+
+If there are more runs than `fan_in`, they are merged in several passes so
+the number of open files stays bounded.
+
+Runs are stored in a compact binary format: raw fixed-width values
+(`array.array`) when a numeric `typecode` is given, pickled blocks of
+values otherwise.
+
+For sorting a LinkedList in memory, use `LinkedList.sort`, an in-place
+bottom-up merge sort that relinks nodes and needs no auxiliary array.
+"""
+
+import heapq
+import os
+import pickle
+import tempfile
+from array import array
+from itertools import islice
+
+BLOCK_SIZE = 4096  # Values per block written to or read from a run file
+
+
+def _write_run(values, typecode, temp_dir):
+    """
+    Spill a sorted run to an anonymous temporary file.
+
+    Args:
+        values: The sorted values (an iterable).
+        typecode: `array` type code for raw fixed-width storage, or None to
+            store pickled blocks.
+        temp_dir: Directory for the file (None for the system default).
+
+    Returns:
+        file: The run file, positioned at its start.
+    """
+    run = tempfile.TemporaryFile(dir=temp_dir)
+    iterator = iter(values)
+    while True:
+        block = list(islice(iterator, BLOCK_SIZE))
+        if not block:
+            break
+        if typecode is None:
+            pickle.dump(block, run, pickle.HIGHEST_PROTOCOL)
+        else:
+            array(typecode, block).tofile(run)
+    run.seek(0)
+    return run
+
+
+def _read_run(run, typecode):
+    """
+    Stream the values of a run file block by block, closing it at the end.
+
+    Args:
+        run: A run file written by _write_run.
+        typecode: The type code the run was written with, or None.
+
+    Yields:
+        The values of the run, in order.
+    """
+    try:
+        if typecode is None:
+            while True:
+                try:
+                    block = pickle.load(run)
+                except EOFError:
+                    return
+                yield from block
+        else:
+            itemsize = array(typecode).itemsize
+            while True:
+                data = run.read(BLOCK_SIZE * itemsize)
+                if not data:
+                    return
+                yield from array(typecode, data)
+    finally:
+        run.close()
+
+
+def external_sort(iterable, key=None, reverse=False, run_size=100_000,
+                  typecode=None, fan_in=64, temp_dir=None):
+    """
+    Sort an iterable of any size using bounded memory.
+
+    The input is consumed lazily and the sorted values are produced lazily,
+    so neither has to fit in memory; at most about `run_size` values plus
+    one block per merged run are held at once. The sort is stable.
+
+    Args:
+        iterable: The values to sort (e.g. a generator, a file, an Array,
+            a LinkedList or a MappedArray).
+        key: Optional function extracting a comparison key.
+        reverse: If True, sort in descending order.
+        run_size: Maximum number of values sorted in memory at once
+            (default: 100,000).
+        typecode: Optional `array` type code (e.g. 'q' or 'd') to spill runs
+            as raw fixed-width numbers instead of pickled blocks.
+        fan_in: Maximum number of runs merged at once (default: 64).
+        temp_dir: Directory for the run files (default: the system default).
+
+    Yields:
+        The values in sorted order.
+
+    Raises:
+        ValueError: If run_size is not positive or fan_in is less than 2.
+    """
+    if run_size <= 0:
+        raise ValueError("Run size must be positive")
+    if fan_in < 2:
+        raise ValueError("Fan-in must be at least 2")
+
+    iterator = iter(iterable)
+    runs = []
+    readers = []
+    try:
+        while True:
+            chunk = list(islice(iterator, run_size))
+            if not chunk:
+                break
+            chunk.sort(key=key, reverse=reverse)
+            if not runs and len(chunk) < run_size:
+                yield from chunk  # Everything fit in memory: no spilling needed
+                return
+            runs.append(_write_run(chunk, typecode, temp_dir))
+            del chunk
+
+        # Merge passes until the remaining runs can be merged at once.
+        # Consecutive runs are merged in order, which keeps the sort stable.
+        while len(runs) > fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), fan_in):
+                readers = [_read_run(run, typecode) for run in runs[start:start + fan_in]]
+                merged = heapq.merge(*readers, key=key, reverse=reverse)
+                merged_runs.append(_write_run(merged, typecode, temp_dir))
+            readers = []
+            runs = merged_runs
+
+        readers = [_read_run(run, typecode) for run in runs]
+        yield from heapq.merge(*readers, key=key, reverse=reverse)
+    finally:
+        for reader in readers:
+            reader.close()  # Closes the run files of partly read runs
+        for run in runs:
+            run.close()
+
+
+def sort_file(input_path, output_path, key=None, reverse=False, run_size=100_000,
+              fan_in=64, temp_dir=None):
+    """
+    Sort the lines of a text file into another file using bounded memory.
+
+    Args:
+        input_path: The file to sort.
+        output_path: Where to write the sorted lines (may be the input file).
+        key: Optional function extracting a comparison key from a line
+            (without its line ending).
+        reverse: If True, sort in descending order.
+        run_size: Maximum number of lines sorted in memory at once.
+        fan_in: Maximum number of runs merged at once.
+        temp_dir: Directory for the run files (default: next to the output).
+
+    Returns:
+        int: The number of lines written.
+    """
+    if temp_dir is None:
+        temp_dir = os.path.dirname(os.path.abspath(output_path))
+    with open(input_path, encoding="utf-8") as source:
+        lines = (line.rstrip("\n") for line in source)
+        ordered = external_sort(lines, key=key, reverse=reverse, run_size=run_size,
+                                fan_in=fan_in, temp_dir=temp_dir)
+        # Write next to the output and rename, so sorting a file in place is safe
+        handle, partial_path = tempfile.mkstemp(dir=temp_dir)
+        count = 0
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as target:
+                for line in ordered:
+                    target.write(line)
+                    target.write("\n")
+                    count += 1
+        except BaseException:
+            os.remove(partial_path)
+            raise
+    os.replace(partial_path, output_path)
+    return count
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(42)
+
+    # Sort a stream of numbers that is processed in runs of 1000
+    print("Step 1: Sorting 10,000 integers in runs of 1,000 (raw 64-bit run files)")
+    numbers = [rng.randrange(1_000_000) for _ in range(10_000)]
+    ordered = list(external_sort(iter(numbers), run_size=1000, typecode='q'))
+    print("Smallest:", ordered[:5])
+    print("Sorted correctly:", ordered == sorted(numbers))
+
+    # Any picklable values work; the sort is stable
+    print("\nStep 2: Sorting records by a key, with a multi-pass merge")
+    records = [(rng.choice("ABCDE"), i) for i in range(5000)]
+    by_letter = list(external_sort(records, key=lambda record: record[0],
+                                   run_size=100, fan_in=4))
+    print("First records:", by_letter[:3])
+    print("Stable:", by_letter == sorted(records, key=lambda record: record[0]))
+
+    # Sort the lines of a text file
+    print("\nStep 3: Sorting a text file")
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "words.txt")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(["pear", "apple", "fig", "banana", "cherry"]) + "\n")
+    sort_file(path, path, run_size=2)
+    with open(path, encoding="utf-8") as file:
+        print("Sorted lines:", file.read().split())
+    os.remove(path)
+    os.rmdir(directory)
@@ -0,0 +1 @@
+"""Sorting algorithms."""
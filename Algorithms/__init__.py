@@ -0,0 +1 @@
+"""Algorithm implementations."""
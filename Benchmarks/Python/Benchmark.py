@@ -0,0 +1,603 @@
+"""
+Benchmark Suite
+
+A reproducible benchmark harness for every data structure in the toolkit.
+
+Each benchmark builds its input with a seeded workload generator (outside of
+the timed region), runs a few warmup rounds, then times several repeats and
+records the minimum, median and mean. The peak memory of one extra run is
+measured with tracemalloc. Results can be written to JSON and compared against
+a saved baseline to catch performance regressions.
+
+Usage:
+    python Benchmark.py --list
+    python Benchmark.py --sizes 1000,100000 --output results.json
+    python Benchmark.py --baseline baseline.json --threshold 0.10
+    python Benchmark.py --filter HashTable --sizes 10000000
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Make the toolkit importable when running from a source checkout
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from Data_Structures import (  # noqa: E402
+    Array, ArrayStack, BloomFilter, Deque, Graph, HashTable, LinkedList, LinkedListStack,
+)
+
+
+DEFAULT_SIZES = (1_000, 100_000)
+SEED = 12345
+
+
+# Workload generators
+
+def random_ints(size, seed=SEED, upper=None):
+    """
+    Generate a reproducible list of random integers.
+
+    Args:
+        size: Number of integers.
+        seed: Random seed.
+        upper: Exclusive upper bound (default: 4 * size).
+
+    Returns:
+        list: The integers.
+    """
+    rng = random.Random(seed)
+    upper = upper or max(1, 4 * size)
+    return [rng.randrange(upper) for _ in range(size)]
+
+
+def random_keys(size, seed=SEED):
+    """
+    Generate a reproducible list of distinct string keys.
+
+    Args:
+        size: Number of keys.
+        seed: Random seed.
+
+    Returns:
+        list: The keys, shuffled.
+    """
+    keys = [f"key-{i}" for i in range(size)]
+    random.Random(seed).shuffle(keys)
+    return keys
+
+
+def random_edges(vertices, edges, seed=SEED, weighted=False):
+    """
+    Generate a reproducible list of random edges.
+
+    Args:
+        vertices: Number of vertices (numbered 0 .. vertices - 1).
+        edges: Number of edges.
+        seed: Random seed.
+        weighted: If True, each edge gets an integer weight in [1, 100].
+
+    Returns:
+        list: Tuples (v1, v2) or (v1, v2, weight).
+    """
+    rng = random.Random(seed)
+    vertices = max(2, vertices)
+    if weighted:
+        return [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100))
+                for _ in range(edges)]
+    return [(rng.randrange(vertices), rng.randrange(vertices)) for _ in range(edges)]
+
+
+def build_array(values):
+    """Return an Array holding `values`."""
+    array = Array()
+    for value in values:
+        array.push(value)
+    return array
+
+
+def build_linked_list(values):
+    """Return a LinkedList holding `values`."""
+    linked_list = LinkedList()
+    linked_list.extend(values)
+    return linked_list
+
+
+def build_hash_table(keys):
+    """Return a HashTable with one bucket per key, mapping each key to itself."""
+    table = HashTable(size=max(1, len(keys)))
+    for key in keys:
+        table.insert(key, key)
+    return table
+
+
+def build_graph(edges):
+    """Return an undirected Graph with the given edges."""
+    graph = Graph()
+    for edge in edges:
+        graph.add_edge(*edge)
+    return graph
+
+
+# Benchmark registry
+
+BENCHMARKS = {}
+
+
+def benchmark(name, max_size=None):
+    """
+    Register a benchmark.
+
+    The decorated function receives the input size, performs all setup and
+    returns a zero-argument callable: only that callable is timed.
+
+    Args:
+        name: Unique benchmark name, "<Structure>.<operation>".
+        max_size: Largest size the benchmark is run with (None means no limit),
+            for operations that are quadratic or otherwise too slow.
+    """
+    def register(factory):
+        BENCHMARKS[name] = (factory, max_size)
+        return factory
+    return register
+
+
+@benchmark("Array.push")
+def bench_array_push(size):
+    """Push `size` integers onto an empty Array."""
+    values = random_ints(size)
+    array = Array()
+    push = array.push
+
+    def run():
+        for value in values:
+            push(value)
+    return run
+
+
+@benchmark("Array.get")
+def bench_array_get(size):
+    """Read `size` random positions of an Array."""
+    array = build_array(random_ints(size))
+    indices = random_ints(size, seed=SEED + 1, upper=size)
+    get = array.get
+
+    def run():
+        for index in indices:
+            get(index)
+    return run
+
+
+@benchmark("Array.search_miss", max_size=1_000_000)
+def bench_array_search(size):
+    """Search an Array five times for a missing value."""
+    array = build_array(random_ints(size))
+
+    def run():
+        for _ in range(5):
+            array.search(-1)
+    return run
+
+
+@benchmark("Array.insert_front", max_size=100_000)
+def bench_array_insert(size):
+    """Insert 100 elements at the front of an Array."""
+    array = build_array(random_ints(size))
+
+    def run():
+        for i in range(100):
+            array.insert(0, i)
+    return run
+
+
+@benchmark("Array.delete_front", max_size=100_000)
+def bench_array_delete(size):
+    """Delete 100 elements from the front of an Array."""
+    array = build_array(random_ints(size + 100))
+
+    def run():
+        for _ in range(100):
+            array.delete(0)
+    return run
+
+
+@benchmark("LinkedList.append")
+def bench_linked_list_append(size):
+    """Append `size` integers to an empty LinkedList."""
+    values = random_ints(size)
+    linked_list = LinkedList()
+    append = linked_list.append
+
+    def run():
+        for value in values:
+            append(value)
+    return run
+
+
+@benchmark("LinkedList.lookup", max_size=1_000_000)
+def bench_linked_list_lookup(size):
+    """Look up 100 random positions of a LinkedList."""
+    linked_list = build_linked_list(random_ints(size))
+    indices = random_ints(100, seed=SEED + 1, upper=size)
+
+    def run():
+        for index in indices:
+            linked_list.lookup(index)
+    return run
+
+
+@benchmark("LinkedList.find_miss")
+def bench_linked_list_find(size):
+    """Search a LinkedList once for a missing value."""
+    linked_list = build_linked_list(random_ints(size))
+
+    def run():
+        linked_list.find(-1)
+    return run
+
+
+@benchmark("LinkedList.pop_first")
+def bench_linked_list_pop_first(size):
+    """Remove every element of a LinkedList from the front."""
+    linked_list = build_linked_list(random_ints(size))
+
+    def run():
+        for _ in range(size):
+            linked_list.pop_first()
+    return run
+
+
+@benchmark("Stack_Array.push_pop")
+def bench_array_stack(size):
+    """Push then pop `size` integers on the array-based Stack."""
+    values = random_ints(size)
+    stack = ArrayStack()
+
+    def run():
+        for value in values:
+            stack.push(value)
+        for _ in range(size):
+            stack.pop()
+    return run
+
+
+@benchmark("Stack_LinkedList.push_pop")
+def bench_linked_list_stack(size):
+    """Push then pop `size` integers on the linked-list Stack."""
+    values = random_ints(size)
+    stack = LinkedListStack()
+
+    def run():
+        for value in values:
+            stack.push(value)
+        for _ in range(size):
+            stack.pop()
+    return run
+
+
+@benchmark("Deque.push_pop")
+def bench_deque(size):
+    """Enqueue then dequeue `size` integers on the ring-buffer Deque."""
+    values = random_ints(size)
+    queue = Deque()
+
+    def run():
+        for value in values:
+            queue.push_back(value)
+        for _ in range(size):
+            queue.pop_front()
+    return run
+
+
+@benchmark("HashTable.insert")
+def bench_hash_table_insert(size):
+    """Insert `size` distinct keys into a HashTable with `size` buckets."""
+    keys = random_keys(size)
+    table = HashTable(size=max(1, size))
+    insert = table.insert
+
+    def run():
+        for key in keys:
+            insert(key, key)
+    return run
+
+
+@benchmark("HashTable.get_hit")
+def bench_hash_table_get(size):
+    """Read every key of a HashTable in random order."""
+    keys = random_keys(size)
+    table = build_hash_table(keys)
+    lookups = random_keys(size, seed=SEED + 1)
+    get = table.get
+
+    def run():
+        for key in lookups:
+            get(key)
+    return run
+
+
+@benchmark("HashTable.contains_miss")
+def bench_hash_table_miss(size):
+    """Check `size` missing keys with HashTable.contains."""
+    table = build_hash_table(random_keys(size))
+    misses = [f"missing-{i}" for i in range(size)]
+    contains = table.contains
+
+    def run():
+        for key in misses:
+            contains(key)
+    return run
+
+
+@benchmark("HashTable.contains_miss_bloom")
+def bench_hash_table_miss_bloom(size):
+    """Check `size` missing keys with HashTable.contains behind a BloomFilter."""
+    keys = random_keys(size)
+    table = HashTable(size=size, bloom_filter=BloomFilter(size))
+    for key in keys:
+        table.insert(key, key)
+    misses = [f"missing-{i}" for i in range(size)]
+    contains = table.contains
+
+    def run():
+        for key in misses:
+            contains(key)
+    return run
+
+
+@benchmark("Graph.add_edge")
+def bench_graph_add_edge(size):
+    """Add `size` unweighted edges between `size / 4` vertices."""
+    edges = random_edges(size // 4, size)
+    graph = Graph()
+    add_edge = graph.add_edge
+
+    def run():
+        for v1, v2 in edges:
+            add_edge(v1, v2)
+    return run
+
+
+@benchmark("Graph.add_weighted_edge")
+def bench_graph_add_weighted_edge(size):
+    """Add `size` weighted edges between `size / 4` vertices."""
+    edges = random_edges(size // 4, size, weighted=True)
+    graph = Graph()
+    add_edge = graph.add_edge
+
+    def run():
+        for v1, v2, weight in edges:
+            add_edge(v1, v2, weight)
+    return run
+
+
+@benchmark("Graph.get_neighbors")
+def bench_graph_neighbors(size):
+    """Call get_neighbors for `size` random vertices."""
+    graph = build_graph(random_edges(size // 4, size))
+    vertices = random_ints(size, seed=SEED + 1, upper=max(2, size // 4))
+    get_neighbors = graph.get_neighbors
+
+    def run():
+        for vertex in vertices:
+            get_neighbors(vertex)
+    return run
+
+
+@benchmark("Graph.get_edges", max_size=10_000)
+def bench_graph_edges(size):
+    """List every edge of a graph with `size` edges."""
+    graph = build_graph(random_edges(size // 4, size))
+
+    def run():
+        graph.get_edges()
+    return run
+
+
+@benchmark("Graph.remove_vertex", max_size=1_000_000)
+def bench_graph_remove_vertex(size):
+    """Remove 10 vertices from a graph with `size` edges."""
+    graph = build_graph(random_edges(size // 4, size))
+    victims = graph.get_vertices()[:10]
+
+    def run():
+        for vertex in victims:
+            graph.remove_vertex(vertex)
+    return run
+
+
+# Harness
+
+def time_benchmark(factory, size, repeat, warmup):
+    """
+    Time a benchmark, rebuilding its input before every run.
+
+    The garbage collector is disabled inside the timed region so its pauses
+    don't add noise to the measurements.
+
+    Args:
+        factory: The registered benchmark function.
+        size: Input size.
+        repeat: Number of timed runs.
+        warmup: Number of untimed runs before timing.
+
+    Returns:
+        list: Elapsed seconds of each timed run.
+    """
+    timings = []
+    for round_number in range(warmup + repeat):
+        run = factory(size)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if round_number >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def measure_peak_memory(factory, size):
+    """
+    Measure the peak traced memory of one setup-and-run cycle.
+
+    Args:
+        factory: The registered benchmark function.
+        size: Input size.
+
+    Returns:
+        int: Peak bytes allocated while building the input and running.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run = factory(size)
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_suite(names, sizes, repeat, warmup, memory=True):
+    """
+    Run the selected benchmarks.
+
+    Args:
+        names: Benchmark names to run.
+        sizes: Input sizes.
+        repeat: Timed runs per benchmark and size.
+        warmup: Untimed runs per benchmark and size.
+        memory: If True, also measure peak memory.
+
+    Returns:
+        dict: Results as {name: {size (as str): stats}}.
+    """
+    results = {}
+    for name in names:
+        factory, max_size = BENCHMARKS[name]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            timings = time_benchmark(factory, size, repeat, warmup)
+            stats = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.fmean(timings),
+                "repeat": repeat,
+            }
+            if memory:
+                stats["peak_memory"] = measure_peak_memory(factory, size)
+            results.setdefault(name, {})[str(size)] = stats
+            memory_text = (f"{stats['peak_memory'] / 2**20:10.1f} MiB"
+                           if memory else "")
+            print(f"{name:<28} {size:>10,} {stats['min'] * 1000:12.3f} ms "
+                  f"{stats['median'] * 1000:12.3f} ms {memory_text}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline, using the minimum time of each run.
+
+    Args:
+        results: Results of the current run.
+        baseline: Results loaded from a previous run.
+        threshold: Allowed slowdown as a fraction (0.10 means 10 %).
+
+    Returns:
+        list: (name, size, ratio) for every regression above the threshold.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<28} {'size':>10} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, by_size in results.items():
+        for size, stats in by_size.items():
+            old = baseline.get(name, {}).get(size)
+            if old is None:
+                continue
+            ratio = stats["min"] / old["min"] if old["min"] else float("inf")
+            flag = "  REGRESSION" if ratio > 1 + threshold else ""
+            print(f"{name:<28} {int(size):>10,} {old['min'] * 1000:12.3f} "
+                  f"{stats['min'] * 1000:12.3f} {100 * (ratio - 1):+7.1f}%{flag}")
+            if flag:
+                regressions.append((name, int(size), ratio))
+    return regressions
+
+
+def main():
+    """Parse the command line, run the suite and report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--list", action="store_true",
+                        help="list the available benchmarks and exit")
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks whose name contains this text")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated input sizes, up to 10000000 "
+                             "(default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed runs per benchmark (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed warmup runs per benchmark (default: 1)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc peak-memory measurement")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown before flagging a regression "
+                             "(default: 0.10)")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, max_size) in BENCHMARKS.items():
+            limit = f" (sizes up to {max_size:,})" if max_size else ""
+            print(f"{name}{limit}")
+        return 0
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(f"{'benchmark':<28} {'size':>10} {'min':>15} {'median':>15} {'peak memory':>14}")
+    results = run_suite(names, sizes, args.repeat, args.warmup, not args.no_memory)
+
+    if args.output:
+        document = {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "repeat": args.repeat,
+                "warmup": args.warmup,
+                "seed": SEED,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,21 @@
 Array Implementation using dictionaries.
 Unlike traditional arrays, this implementation uses a dictionary for storage, allowing for
 dynamic resizing while maintaining O(1) access time.
+
+Sub-ranges can be taken without copying as ArrayView objects, and arrays can be
+cloned in O(1) with copy-on-write.
 """
 
+import sys
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+
+
 class Array:
     """
     A custom Array implementation using Python dictionaries.
@@ -15,6 +28,7 @@ class Array:
         length (int): The number of elements in the array.
         data (dict): Dictionary storing the array elements with indices as keys.
     """
+    _shared = False  # True while `data` may be shared with a clone
     
     def __init__(self):
         """
@@ -32,7 +46,103 @@ class Array:
         Returns:
             str: String representation of the array's internal state.
         """
-        return str(self.__dict__)
+        return str({"length": self.length, "data": self.data})
+
+    def __len__(self):
+        """
+        Allow using len(array).
+        
+        Returns:
+            int: The number of elements in the array.
+        """
+        return self.length
+
+    def __iter__(self):
+        """
+        Yield the elements in order.
+        
+        Yields:
+            The array elements, from index 0.
+        """
+        return map(self.data.__getitem__, range(self.length))
+
+    def __getitem__(self, index):
+        """
+        Get an element, or a zero-copy view of a slice.
+        
+        Args:
+            index: An index, or a slice (e.g. array[2:10:2]).
+            
+        Returns:
+            The element at the index, or an ArrayView of the slice.
+            
+        Raises:
+            KeyError: If the index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return ArrayView(self, range(self.length)[index])
+        return self.data[index]
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Build an array from an iterable in a single pass.
+        
+        Args:
+            iterable: The elements, in order.
+            
+        Returns:
+            Array: A new array holding the elements.
+        """
+        array = cls()
+        array.data = dict(enumerate(iterable))
+        array.length = len(array.data)
+        return array
+
+    def to_list(self):
+        """
+        Return the elements as a Python list.
+        
+        Returns:
+            list: The elements, in order.
+        """
+        return list(self)
+
+    def view(self, start=None, stop=None, step=None):
+        """
+        Return a zero-copy view of a range of elements.
+        
+        Args:
+            start: First index (default: 0).
+            stop: End index, exclusive (default: the array length).
+            step: Stride between elements (default: 1).
+            
+        Returns:
+            ArrayView: A view of array[start:stop:step].
+        """
+        return self[start:stop:step]
+
+    def clone(self):
+        """
+        Return a copy of the array in O(1) time, using copy-on-write.
+        
+        The clone shares the element storage with this array. Whichever of
+        the two is modified first copies the storage at that point, so
+        arrays that are only read are never copied.
+        
+        Returns:
+            Array: The clone.
+        """
+        clone = type(self)()
+        clone.data = self.data
+        clone.length = self.length
+        clone._shared = self._shared = True
+        return clone
+
+    def _detach(self):
+        """Take a private copy of shared storage before modifying it."""
+        self.data = dict(self.data)
+        self._shared = False
 
     def get(self, index):
         """
@@ -56,6 +166,8 @@ class Array:
         Args:
             item: The element to add to the array.
         """
+        if self._shared:
+            self._detach()
         self.data[self.length] = item
         self.length += 1
 
@@ -70,6 +182,8 @@ class Array:
             KeyError: If the array is empty.
         """
         last_item = self.data[self.length - 1]
+        if self._shared:
+            self._detach()
         del self.data[self.length - 1]
         self.length -= 1
         return last_item
@@ -91,10 +205,11 @@ class Array:
             KeyError: If the index is out of bounds.
         """
         deleted_item = self.data[index]
+        if self._shared:
+            self._detach()
         
         # Shift all elements to the left
-        for i in range(index, self.length - 1):
-            self.data[i] = self.data[i + 1]
+        self._shift_left(self.data, index, self.length)
             
         # Remove the last element
         del self.data[self.length - 1]
@@ -118,10 +233,11 @@ class Array:
         """
         if index < 0 or index > self.length:
             raise IndexError("Array index out of bounds")
+        if self._shared:
+            self._detach()
             
         # Shift all elements to the right
-        for i in range(self.length, index, -1):
-            self.data[i] = self.data[i - 1]
+        self._shift_right(self.data, index, self.length)
             
         # Insert the new element
         self.data[index] = item
@@ -137,11 +253,208 @@ class Array:
         Returns:
             int: The index of the first occurrence of the item, or -1 if not found.
         """
-        for i in range(self.length):
-            if self.data[i] == item:
+        return self._index_search(self.data, item, self.length)
+
+    # Element loops, overridden with C versions in _accelerated.Array
+
+    @staticmethod
+    def _shift_left(data, index, length):
+        """
+        Move the elements after `index` one position to the left.
+
+        Args:
+            data (dict): The element storage.
+            index (int): The position to overwrite.
+            length (int): The number of elements.
+        """
+        for i in range(index, length - 1):
+            data[i] = data[i + 1]
+
+    @staticmethod
+    def _shift_right(data, index, length):
+        """
+        Move the elements from `index` on one position to the right.
+
+        Args:
+            data (dict): The element storage.
+            index (int): The position to free.
+            length (int): The number of elements.
+        """
+        for i in range(length, index, -1):
+            data[i] = data[i - 1]
+
+    @staticmethod
+    def _index_search(data, item, length):
+        """
+        Find the first position holding an item.
+
+        Args:
+            data (dict): The element storage.
+            item: The item to search for.
+            length (int): The number of elements.
+
+        Returns:
+            int: The first matching position, or -1 if not found.
+        """
+        for i in range(length):
+            if data[i] == item:
                 return i
         return -1
 
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the array, counting each object once.
+
+        Storage shared with a clone is counted in full by both arrays.
+
+        Args:
+            deep: If True, include everything the elements reference
+                (default: True).
+
+        Returns:
+            MemoryUsage: Overhead bytes (the array object, the storage
+                dictionary and its integer index keys) and payload bytes
+                (the elements).
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        sizeof = usage.sizeof
+        payload_sizeof = usage.payload_sizeof
+        usage.overhead["object"] = sizeof(self) + sizeof(vars(self))
+        usage.overhead["dictionary"] = sizeof(self.data)
+        indices = elements = 0
+        for index, element in self.data.items():
+            elements += payload_sizeof(element)  # First, in case an element is its own index
+            indices += sizeof(index)
+        usage.overhead["indices"] = indices
+        usage.payload["elements"] = elements
+        return usage
+
+
+class ArrayView:
+    """
+    A zero-copy view of a range of an Array.
+    
+    The view stores only its parent and the range of parent indices it
+    covers (offset, length and stride), and reads the parent's storage on
+    access, so creating and slicing views never copies elements. Views are
+    read-only and always show the parent's current contents; use copy() to
+    get an independent Array.
+    
+    Attributes:
+        parent (Array): The array being viewed.
+        indices (range): The parent indices covered by the view.
+    """
+    
+    def __init__(self, parent, indices):
+        """
+        Initialize a view of `parent` at the given indices.
+        
+        Args:
+            parent (Array): The array to view.
+            indices (range): The parent indices covered by the view.
+        """
+        self.parent = parent
+        self.indices = indices
+
+    @property
+    def length(self):
+        """int: The number of elements in the view."""
+        return len(self.indices)
+
+    def __len__(self):
+        """
+        Allow using len(view).
+        
+        Returns:
+            int: The number of elements in the view.
+        """
+        return len(self.indices)
+
+    def __str__(self):
+        """
+        Return a string representation of the view.
+        
+        Returns:
+            str: The elements of the view.
+        """
+        return f"ArrayView({self.to_list()})"
+
+    def get(self, index):
+        """
+        Retrieve an element at the specified index of the view.
+        
+        Args:
+            index (int): The index of the element within the view.
+            
+        Returns:
+            The element at the specified index.
+            
+        Raises:
+            KeyError: If the index is out of bounds.
+        """
+        if not 0 <= index < len(self.indices):
+            raise KeyError(index)
+        return self.parent.data[self.indices[index]]
+
+    def __getitem__(self, index):
+        """
+        Get an element, or a view of a slice of this view.
+        
+        Args:
+            index: An index, or a slice.
+            
+        Returns:
+            The element at the index, or an ArrayView of the slice.
+            
+        Raises:
+            KeyError: If the index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return ArrayView(self.parent, self.indices[index])
+        return self.get(index)
+
+    def __iter__(self):
+        """
+        Yield the elements of the view in order.
+        
+        Yields:
+            The elements of the view.
+        """
+        return map(self.parent.data.__getitem__, self.indices)
+
+    def search(self, item):
+        """
+        Search for an item in the view.
+        
+        Args:
+            item: The item to search for.
+            
+        Returns:
+            int: The index (within the view) of the first occurrence of the item, or -1 if not found.
+        """
+        for i, element in enumerate(self):
+            if element == item:
+                return i
+        return -1
+
+    def to_list(self):
+        """
+        Return the elements of the view as a Python list.
+        
+        Returns:
+            list: The elements, in order.
+        """
+        return list(self)
+
+    def copy(self):
+        """
+        Copy the elements of the view into a new Array.
+        
+        Returns:
+            Array: A new array holding the elements of the view.
+        """
+        return type(self.parent).from_iterable(self)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -193,4 +506,23 @@ if __name__ == "__main__":
     # Show the internal structure 
     print("\nStep 8: Internal structure of the array")
     print(f"Length: {my_array.length}")
-    print(f"Data dictionary: {my_array.data}")
\ No newline at end of file
+    print(f"Data dictionary: {my_array.data}")
+    
+    # Build from an iterable and take zero-copy views
+    print("\nStep 9: Views and copy-on-write clones")
+    numbers = Array.from_iterable(range(10))
+    evens = numbers[::2]
+    print(f"Even positions (view): {evens}")
+    print(f"Every other even position (view of a view): {evens[::2].to_list()}")
+    
+    snapshot = numbers.clone()
+    print(f"Clone shares storage: {snapshot.data is numbers.data}")
+    numbers.push(10)
+    print(f"After pushing to the original, clone shares storage: {snapshot.data is numbers.data}")
+    print(f"Original: {numbers.to_list()}")
+    print(f"Clone: {snapshot.to_list()}")
+
+    # Measure the storage dictionary, not just the elements
+    print("\nStep 10: Memory usage")
+    words = Array.from_iterable(f"word{i}" for i in range(1000))
+    print(words.memory_usage())
\ No newline at end of file
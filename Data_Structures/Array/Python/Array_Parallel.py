@@ -0,0 +1,379 @@
+"""
+Parallel Array Operations
+
+This module runs map, filter, reduce and sort over an Array on several
+processes with `concurrent.futures.ProcessPoolExecutor`. The array is split
+into chunks that the workers process independently:
+- map / filter / reduce: each worker processes one chunk, and the partial
+  results are combined in chunk order.
+- sort: each worker sorts one chunk (a run), and the sorted runs are combined
+  with a k-way merge (`heapq.merge`).
+
+Arrays of plain numbers (all ints that fit in 64 bits, or all floats) are
+copied once into a `multiprocessing.shared_memory` block, and the workers
+read their chunk from it instead of receiving a pickled copy; sorting
+happens in place in the shared block. Other arrays are sent to the workers
+as pickled chunks.
+
+Functions passed to the executor must be picklable: module-level
+functions, builtins, `operator` functions or `functools.partial` objects
+(not lambdas or nested functions).
+"""
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import reduce
+from itertools import chain
+from multiprocessing import shared_memory
+
+try:
+    from .Array import Array
+except ImportError:  # Run as a script rather than as part of the package
+    from Array import Array
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_MISSING = object()
+
+
+def _numeric_typecode(values):
+    """
+    Find an `array` type code that stores all values exactly.
+
+    Args:
+        values (list): The values.
+
+    Returns:
+        str or None: 'q' if all values are ints that fit in 64 bits, 'd' if
+            all are floats, None otherwise.
+    """
+    if not values:
+        return None
+    if all(type(value) is int for value in values):
+        if _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+            return 'q'
+        return None
+    if all(type(value) is float for value in values):
+        return 'd'
+    return None
+
+
+def _attach(name):
+    """
+    Attach to an existing shared memory block from a worker.
+
+    The worker must not take ownership of the block: the parent unlinks it.
+
+    Args:
+        name: The name of the block.
+
+    Returns:
+        SharedMemory: The attached block.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        # Workers share the parent's resource tracker, which already tracks
+        # the block, so attaching doesn't register a second owner
+        return shared_memory.SharedMemory(name=name)
+
+
+@contextmanager
+def _open_chunk(chunk):
+    """
+    Give a worker access to the values of its chunk.
+
+    Args:
+        chunk: Either a list of values, or a (block name, type code, start,
+            stop) tuple describing a slice of a shared memory block.
+
+    Yields:
+        list or memoryview: The values of the chunk. A memoryview is writable
+            and backed by the shared block.
+    """
+    if isinstance(chunk, list):
+        yield chunk
+        return
+    name, typecode, start, stop = chunk
+    block = _attach(name)
+    try:
+        with block.buf.cast(typecode) as values, values[start:stop] as view:
+            yield view
+    finally:
+        block.close()
+
+
+def _map_chunk(chunk, function):
+    """Worker: apply `function` to every value of a chunk."""
+    with _open_chunk(chunk) as values:
+        return list(map(function, values))
+
+
+def _filter_chunk(chunk, predicate):
+    """Worker: keep the values of a chunk for which `predicate` is true."""
+    with _open_chunk(chunk) as values:
+        return list(filter(predicate, values))
+
+
+def _reduce_chunk(chunk, function):
+    """Worker: reduce the values of a chunk (a non-empty chunk) with `function`."""
+    with _open_chunk(chunk) as values:
+        return reduce(function, values)
+
+
+def _sort_chunk(chunk, key, reverse):
+    """
+    Worker: sort a chunk.
+
+    Shared-memory chunks are sorted in place and None is returned; list
+    chunks are returned sorted.
+    """
+    with _open_chunk(chunk) as values:
+        ordered = sorted(values, key=key, reverse=reverse)
+        if isinstance(values, list):
+            return ordered
+        values[:] = array(values.format, ordered)
+        return None
+
+
+class ParallelExecutor:
+    """
+    Runs map, filter, reduce and sort over Arrays on a process pool.
+
+    The pool is created on first use and reused by later operations; close
+    the executor (or use it as a context manager) to shut the pool down.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int or None): Elements per chunk, or None to split each
+            array into 4 chunks per worker.
+        shared_memory (bool): Whether numeric arrays are passed to the
+            workers through shared memory.
+    """
+    def __init__(self, workers=None, chunk_size=None, shared_memory=True):
+        """
+        Initialize a ParallelExecutor.
+
+        Args:
+            workers: Number of worker processes (default: the CPU count).
+            chunk_size: Elements per chunk (default: 4 chunks per worker).
+            shared_memory: Pass numeric arrays through shared memory instead
+                of pickling them (default: True).
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers must be positive")
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.shared_memory = shared_memory
+        self._pool = None
+
+    def _executor(self):
+        """
+        Return the process pool, creating it on first use.
+
+        Returns:
+            ProcessPoolExecutor: The pool.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _bounds(self, length):
+        """
+        Split [0, length) into chunks.
+
+        Args:
+            length: Number of elements.
+
+        Returns:
+            list: (start, stop) pairs covering the range in order.
+        """
+        size = self.chunk_size or max(1, -(-length // (self.workers * 4)))
+        return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+    @contextmanager
+    def _chunks(self, values):
+        """
+        Describe the chunks of `values` for the workers.
+
+        Numeric values are copied into a shared memory block that lives
+        until the `with` block exits.
+
+        Args:
+            values (list): The values to split.
+
+        Yields:
+            tuple: (list of chunk descriptors, the shared block or None).
+        """
+        bounds = self._bounds(len(values))
+        typecode = _numeric_typecode(values) if self.shared_memory else None
+        if typecode is None:
+            yield [values[start:stop] for start, stop in bounds], None
+            return
+        packed = array(typecode, values)
+        block = shared_memory.SharedMemory(create=True, size=len(packed) * packed.itemsize)
+        try:
+            block.buf[:len(packed) * packed.itemsize] = memoryview(packed).cast('B')
+            del packed
+            yield [(block.name, typecode, start, stop) for start, stop in bounds], block
+        finally:
+            block.close()
+            block.unlink()
+
+    def _run(self, worker, values, *args):
+        """
+        Run a worker function over every chunk of `values`.
+
+        Args:
+            worker: The module-level worker function.
+            values (list): The values to process.
+            *args: Extra arguments passed to every call.
+
+        Returns:
+            list: The result of each chunk, in order.
+        """
+        with self._chunks(values) as (chunks, _):
+            return list(self._executor().map(worker, chunks, *([arg] * len(chunks) for arg in args)))
+
+    def map(self, array, function):
+        """
+        Apply a function to every element, in parallel.
+
+        Args:
+            array: The Array (or ArrayView) to process.
+            function: A picklable function of one element.
+
+        Returns:
+            Array: The results, in the order of the elements.
+        """
+        results = self._run(_map_chunk, array.to_list(), function)
+        return Array.from_iterable(chain.from_iterable(results))
+
+    def filter(self, array, predicate):
+        """
+        Keep the elements for which a predicate is true, in parallel.
+
+        Args:
+            array: The Array (or ArrayView) to process.
+            predicate: A picklable function of one element.
+
+        Returns:
+            Array: The elements that passed, in their original order.
+        """
+        results = self._run(_filter_chunk, array.to_list(), predicate)
+        return Array.from_iterable(chain.from_iterable(results))
+
+    def reduce(self, array, function, initial=_MISSING):
+        """
+        Combine all elements with a binary function, in parallel.
+
+        Each chunk is reduced by a worker, then the partial results are
+        reduced in order, so `function` must be associative (e.g. addition,
+        `max`), but doesn't need to be commutative.
+
+        Args:
+            array: The Array (or ArrayView) to process.
+            function: A picklable associative function of two arguments.
+            initial: Optional value placed before the elements.
+
+        Returns:
+            The reduced value.
+
+        Raises:
+            TypeError: If the array is empty and no initial value is given.
+        """
+        partials = self._run(_reduce_chunk, array.to_list(), function)
+        if initial is _MISSING:
+            return reduce(function, partials)
+        return reduce(function, partials, initial)
+
+    def sort(self, array, key=None, reverse=False):
+        """
+        Sort the elements, in parallel.
+
+        Workers sort the chunks into runs (numeric runs in place in shared
+        memory), then the runs are combined with a k-way heap merge. The
+        sort is stable.
+
+        Args:
+            array: The Array (or ArrayView) to sort.
+            key: Optional picklable function computing the sort key.
+            reverse: Sort in descending order (default: False).
+
+        Returns:
+            Array: A new sorted Array.
+        """
+        values = array.to_list()
+        with self._chunks(values) as (chunks, block):
+            runs = list(self._executor().map(_sort_chunk, chunks,
+                                             [key] * len(chunks), [reverse] * len(chunks)))
+            if block is None:
+                return Array.from_iterable(heapq.merge(*runs, key=key, reverse=reverse))
+            typecode = chunks[0][1]
+            with block.buf.cast(typecode) as shared:
+                runs = [shared[start:stop] for _, _, start, stop in chunks]
+                try:
+                    return Array.from_iterable(heapq.merge(*runs, key=key, reverse=reverse))
+                finally:
+                    for run in runs:
+                        run.release()
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        """
+        Use the executor as a context manager.
+
+        Returns:
+            ParallelExecutor: The executor itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Shut down the worker processes when leaving the `with` block."""
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import math
+    import operator
+    import random
+    from functools import partial
+
+    rng = random.Random(7)
+    numbers = Array.from_iterable(rng.randrange(1000) for _ in range(100_000))
+    print(f"Array of {numbers.length} random integers")
+
+    with ParallelExecutor(workers=4) as executor:
+        print("\nStep 1: Parallel map (square roots)")
+        roots = executor.map(numbers, math.sqrt)
+        print("First roots:", [round(root, 2) for root in roots.view(0, 5)])
+
+        print("\nStep 2: Parallel filter (values below 10)")
+        small = executor.filter(numbers, partial(operator.gt, 10))
+        print(f"{small.length} values below 10, first ones: {small.view(0, 5).to_list()}")
+
+        print("\nStep 3: Parallel reduce (sum and maximum)")
+        print("Sum:", executor.reduce(numbers, operator.add), "| expected:", sum(numbers))
+        print("Max:", executor.reduce(numbers, max))
+
+        print("\nStep 4: Parallel sort (chunk sort + k-way merge)")
+        ordered = executor.sort(numbers)
+        print("Smallest:", ordered.view(0, 5).to_list(), "| largest:", ordered.view(-5).to_list())
+        print("Sorted correctly:", ordered.to_list() == sorted(numbers))
+
+        words = Array.from_iterable(["pear", "Apple", "fig", "banana", "Cherry"])
+        print("Words sorted case-insensitively:", executor.sort(words, key=str.lower).to_list())
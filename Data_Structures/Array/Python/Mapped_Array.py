@@ -0,0 +1,493 @@
+"""
+Memory-Mapped Array Implementation
+
+This module provides a file-backed Array of fixed-width numbers built on
+`mmap`. The elements live in a file and are paged in by the operating system
+on access, so an array can be much larger than RAM while the resident memory
+stays bounded by the pages actually in use.
+
+The file starts with a small header (magic bytes, element count and type
+code) followed by the raw elements, so an array can be closed and reopened
+later. The file grows by doubling as elements are pushed, and is trimmed to
+its contents on close.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from itertools import islice
+
+MAGIC = b"DSAARRAY"
+HEADER = struct.Struct("<8sQ1s")  # Magic, element count, type code
+HEADER_SIZE = 64                  # Keeps the elements 64-byte aligned
+TYPECODES = "bBhHiIlLqQfd"        # `array` type codes that memoryview can cast to
+INTEGER_TYPECODES = "bBhHiIlLqQ"
+BULK_WRITE_SIZE = 1 << 19         # Appends of at least this many bytes are unmapped after writing
+
+
+class MappedArray:
+    """
+    A fixed-width Array stored in a memory-mapped file.
+
+    Supports the same `get`/`push`/`pop`/`search` operations as `Array`,
+    for numbers of a single C type given by `typecode` (see the `array`
+    module), e.g. 'q' for signed 64-bit integers or 'd' for doubles.
+
+    Slices are returned as `memoryview` objects that read and write the file
+    directly without copying. While such a view is alive the array can't
+    grow: release the view (or leave its `with` block) before pushing more
+    elements than the current capacity.
+
+    Attributes:
+        path (str): Path of the backing file.
+        typecode (str): The `array` type code of the elements.
+        itemsize (int): Size of one element in bytes.
+        length (int): The number of elements in the array.
+    """
+    def __init__(self, path, typecode='q', capacity=1024):
+        """
+        Open the array stored at `path`, creating the file if needed.
+
+        Args:
+            path: Path of the backing file.
+            typecode: The `array` type code of the elements of a new file
+                (default: 'q'). An existing file must use the same one.
+            capacity: Initial number of element slots of a new file
+                (default: 1024).
+
+        Raises:
+            ValueError: If the type code or capacity is invalid, or the file
+                isn't a MappedArray file of that type code.
+        """
+        if typecode not in TYPECODES:
+            raise ValueError(f"Unsupported type code: {typecode!r}")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.path = os.fspath(path)
+        self.typecode = typecode
+        self.itemsize = struct.calcsize(typecode)
+        self._values = None
+        self._header = None
+        self._mmap = None
+
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self._file = open(self.path, "r+b" if exists else "w+b")
+        try:
+            if exists:
+                self._read_header()
+            else:
+                self.length = 0
+                self._file.truncate(HEADER_SIZE + capacity * self.itemsize)
+            self._map()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _read_header(self):
+        """
+        Validate the header of an existing file and read its element count.
+
+        Raises:
+            ValueError: If the file isn't a MappedArray file of this type code.
+        """
+        header = self._file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is not a MappedArray file")
+        magic, length, typecode = HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a MappedArray file")
+        if typecode.decode() != self.typecode:
+            raise ValueError(f"{self.path} holds type code {typecode.decode()!r}, "
+                             f"not {self.typecode!r}")
+        self.length = length
+
+    def _map(self):
+        """Map the file and create the typed views over the header and elements."""
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = (len(self._mmap) - HEADER_SIZE) // self.itemsize
+        HEADER.pack_into(self._mmap, 0, MAGIC, self.length, self.typecode.encode())
+        self._header = memoryview(self._mmap)[8:16].cast('Q')
+        end = HEADER_SIZE + self._capacity * self.itemsize
+        self._values = memoryview(self._mmap)[HEADER_SIZE:end].cast(self.typecode)
+
+    def _unmap(self):
+        """
+        Release the typed views and the mapping.
+
+        Raises:
+            BufferError: If memoryview slices of the array are still alive.
+                The array stays usable.
+        """
+        self._values.release()
+        self._header.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            self._header = memoryview(self._mmap)[8:16].cast('Q')
+            end = HEADER_SIZE + self._capacity * self.itemsize
+            self._values = memoryview(self._mmap)[HEADER_SIZE:end].cast(self.typecode)
+            raise BufferError("Release the memoryview slices of the array first") from None
+
+    def _set_length(self, length):
+        """
+        Update the element count in memory and in the file header.
+
+        Args:
+            length: The new number of elements.
+        """
+        self.length = length
+        self._header[0] = length
+
+    def _reserve(self, count):
+        """
+        Grow the file so that `count` elements fit, doubling its capacity.
+
+        Args:
+            count: The number of elements needed.
+
+        Raises:
+            BufferError: If memoryview slices of the array are still alive.
+        """
+        if count <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < count:
+            capacity *= 2
+        self._unmap()
+        self._file.truncate(HEADER_SIZE + capacity * self.itemsize)
+        self._map()
+
+    def __len__(self):
+        """
+        Allow using len(array).
+
+        Returns:
+            int: The number of elements in the array.
+        """
+        return self.length
+
+    def __str__(self):
+        """
+        Return a string representation of the MappedArray.
+
+        Returns:
+            str: The file, type code and size of the array.
+        """
+        return (f"MappedArray(path={self.path!r}, typecode={self.typecode!r}, "
+                f"length={self.length}, capacity={self._capacity})")
+
+    def get(self, index):
+        """
+        Retrieve an element at the specified index.
+
+        Args:
+            index (int): The index of the element to retrieve.
+
+        Returns:
+            The element at the specified index.
+
+        Raises:
+            KeyError: If the index is out of bounds.
+        """
+        if not 0 <= index < self.length:
+            raise KeyError(index)
+        return self._values[index]
+
+    def set(self, index, item):
+        """
+        Replace the element at the specified index.
+
+        Args:
+            index (int): The index of the element to replace.
+            item: A number compatible with the array's type code.
+
+        Raises:
+            KeyError: If the index is out of bounds.
+            TypeError: If the item doesn't match the type code.
+        """
+        if not 0 <= index < self.length:
+            raise KeyError(index)
+        self._values[index] = item
+
+    def push(self, item):
+        """
+        Add an element to the end (push) of the array.
+
+        Args:
+            item: A number compatible with the array's type code.
+
+        Raises:
+            TypeError: If the item doesn't match the type code.
+            BufferError: If the file must grow while slices are alive.
+
+        Time Complexity:
+            O(1) amortized.
+        """
+        if self.length == self._capacity:
+            self._reserve(self.length + 1)
+        self._values[self.length] = item
+        self._set_length(self.length + 1)
+
+    def _push_raw(self, raw):
+        """
+        Append raw element bytes with a single copy into the mapping.
+
+        Args:
+            raw: A byte-format memoryview of whole elements.
+        """
+        count = raw.nbytes // self.itemsize
+        self._reserve(self.length + count)
+        start = HEADER_SIZE + self.length * self.itemsize
+        self._mmap[start:start + raw.nbytes] = raw
+        self._set_length(self.length + count)
+        if raw.nbytes >= BULK_WRITE_SIZE and hasattr(self._mmap, "madvise"):
+            # Large appends don't stay resident; the kernel writes them back
+            self._drop_pages(self.length - count, self.length)
+
+    def push_many(self, values):
+        """
+        Add several elements to the end of the array.
+
+        Buffers of the array's type code (an `array.array`, or raw bytes) are
+        copied into the file in one operation; other iterables are converted
+        in batches of 64K elements.
+
+        Args:
+            values: An iterable of numbers, or a buffer of raw elements.
+
+        Raises:
+            TypeError: If an item doesn't match the type code.
+            ValueError: If a buffer's size isn't a multiple of the item size.
+            BufferError: If the file must grow while slices are alive.
+        """
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is not None and view.format in ('B', self.typecode):
+            with view, view.cast('B') as raw:
+                if raw.nbytes % self.itemsize:
+                    raise ValueError("Buffer size is not a multiple of the item size")
+                self._push_raw(raw)
+            return
+        if view is not None:
+            view.release()
+
+        iterator = iter(values)
+        while True:
+            batch = array(self.typecode, islice(iterator, 1 << 16))
+            if not batch:
+                return
+            with memoryview(batch).cast('B') as raw:
+                self._push_raw(raw)
+
+    def pop(self):
+        """
+        Remove and return the last element (pop) from the array.
+
+        Returns:
+            The last element of the array.
+
+        Raises:
+            KeyError: If the array is empty.
+        """
+        if self.length == 0:
+            raise KeyError(-1)
+        item = self._values[self.length - 1]
+        self._set_length(self.length - 1)
+        return item
+
+    def __getitem__(self, index):
+        """
+        Get an element, or a zero-copy view of a slice.
+
+        Args:
+            index: An int (negative values count from the end) or a slice.
+
+        Returns:
+            The element, or a memoryview of the selected elements that reads
+            and writes the file directly.
+
+        Raises:
+            IndexError: If an int index is out of range.
+        """
+        if isinstance(index, slice):
+            return self._values[:self.length][index]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Array index out of bounds")
+        return self._values[index]
+
+    def view(self, start=0, stop=None):
+        """
+        Return a zero-copy memoryview of a range of elements.
+
+        Args:
+            start: First index (default: 0).
+            stop: End index, exclusive (default: the array length).
+
+        Returns:
+            memoryview: The elements in [start, stop), backed by the file.
+        """
+        return self._values[:self.length][start:stop]
+
+    def chunks(self, chunk_size=1 << 16):
+        """
+        Scan the array sequentially in zero-copy chunks.
+
+        The kernel is advised that the file is read sequentially, so it reads
+        ahead, and the pages of each chunk are unmapped from this process once
+        the chunk has been consumed, so the resident memory stays around one
+        chunk no matter how large the file is.
+
+        Args:
+            chunk_size: Number of elements per chunk (default: 65536).
+
+        Yields:
+            tuple: (index of the first element, memoryview of the chunk).
+                Each chunk is released when the next one is produced.
+        """
+        advise = getattr(self._mmap, "madvise", None)
+        if advise is not None:
+            advise(mmap.MADV_SEQUENTIAL)
+        for start in range(0, self.length, chunk_size):
+            stop = min(start + chunk_size, self.length)
+            with self._values[start:stop] as chunk:
+                yield start, chunk
+            if advise is not None:
+                self._drop_pages(start, stop)
+
+    def _drop_pages(self, start, stop):
+        """
+        Unmap the whole pages holding elements [start, stop) from this process.
+
+        The data stays in the file (and the OS page cache); touching the
+        elements again simply maps the pages back in.
+
+        Args:
+            start: First element index.
+            stop: End element index, exclusive.
+        """
+        first = (HEADER_SIZE + start * self.itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+        end = (HEADER_SIZE + stop * self.itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+        if first == 0:
+            first = mmap.PAGESIZE  # Keep the header page mapped
+        if end > first:
+            self._mmap.madvise(mmap.MADV_DONTNEED, first, end - first)
+
+    def __iter__(self):
+        """
+        Yield the elements in order, one chunk at a time.
+
+        Yields:
+            The array elements.
+        """
+        for _, chunk in self.chunks():
+            yield from chunk.tolist()
+
+    def search(self, item):
+        """
+        Search for an item in the array.
+
+        Integers in integer arrays are searched for by their raw bytes
+        directly in the mapping; anything else is compared chunk by chunk.
+
+        Args:
+            item: The item to search for.
+
+        Returns:
+            int: The index of the first occurrence of the item, or -1 if not found.
+        """
+        if self.typecode in INTEGER_TYPECODES and type(item) is int:
+            try:
+                needle = struct.pack(self.typecode, item)
+            except struct.error:
+                return -1  # Not representable, so not stored in the array
+            end = HEADER_SIZE + self.length * self.itemsize
+            position = self._mmap.find(needle, HEADER_SIZE, end)
+            while position != -1:
+                index, misalignment = divmod(position - HEADER_SIZE, self.itemsize)
+                if not misalignment:
+                    return index
+                position = self._mmap.find(needle, position + 1, end)
+            return -1
+        for start, chunk in self.chunks():
+            values = chunk.tolist()
+            if item in values:
+                return start + values.index(item)
+        return -1
+
+    def flush(self):
+        """Write pending changes of the mapping to the file."""
+        self._mmap.flush()
+
+    def close(self):
+        """
+        Flush the array, trim the file to its contents and close it.
+
+        Raises:
+            BufferError: If memoryview slices of the array are still alive.
+        """
+        if self._file.closed:
+            return
+        self._mmap.flush()
+        self._unmap()
+        self._file.truncate(HEADER_SIZE + max(1, self.length) * self.itemsize)
+        self._file.close()
+
+    def __enter__(self):
+        """
+        Use the array as a context manager.
+
+        Returns:
+            MappedArray: The array itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the array when leaving the `with` block."""
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "numbers.dsa")
+
+    # Create a file-backed array of 64-bit integers
+    print("Step 1: Creating a memory-mapped array")
+    with MappedArray(path, typecode='q', capacity=4) as numbers:
+        print(numbers)
+
+        # Push elements; the file grows as needed
+        print("\nStep 2: Pushing elements")
+        for value in (10, 20, 30, 40, 50):
+            numbers.push(value)
+        numbers.push_many(range(60, 110, 10))
+        print(numbers)
+
+        print("\nStep 3: Accessing and searching")
+        print("Element at index 2:", numbers.get(2))
+        print("Index of 70:", numbers.search(70))
+        print("Index of 75:", numbers.search(75))
+
+        # Zero-copy view: writes go straight to the file
+        print("\nStep 4: Zero-copy slice")
+        with numbers.view(0, 3) as first_three:
+            print("First three:", first_three.tolist())
+            first_three[0] = 11
+        print("Element at index 0 after writing through the view:", numbers.get(0))
+
+        print("\nStep 5: Chunked sequential scan")
+        total = sum(sum(chunk) for _, chunk in numbers.chunks(chunk_size=4))
+        print("Sum of all elements:", total)
+        print("Popped:", numbers.pop())
+
+    # Reopen the file: the elements persist
+    print("\nStep 6: Reopening the file")
+    with MappedArray(path, typecode='q') as numbers:
+        print(numbers)
+        print("Elements:", list(numbers))
@@ -0,0 +1 @@
+"""Array data structure."""
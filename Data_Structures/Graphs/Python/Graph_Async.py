@@ -0,0 +1,349 @@
+"""
+Async Lazy Graph Implementation
+
+This module provides a graph whose adjacency lists are not held in memory
+upfront but loaded on demand from an external source (a key/value service,
+a database...) through an async loader:
+- AsyncGraph: `await graph.get_neighbors(v)` loads the neighbors of a vertex
+  the first time they are needed and caches them. Requests made in the same
+  event-loop iteration are batched into a single loader call, and the number
+  of loader calls running at once is limited.
+- GraphLoader: an in-process stand-in for a remote service, serving the
+  adjacency lists of a regular Graph after a simulated network latency.
+
+A loader is any async callable taking a list of vertices and returning a
+dict mapping each vertex to its neighbor list, in the same format as
+`Graph.adjacency` (plain vertices, or (vertex, weight) tuples). Vertices
+missing from the result have no neighbors.
+"""
+
+import asyncio
+from collections import OrderedDict
+
+
+class GraphLoader:
+    """
+    In-process stand-in for a remote adjacency service.
+
+    Serves the adjacency lists of a Graph, sleeping for `latency` seconds
+    per call (one round trip) plus `per_vertex` seconds per vertex.
+
+    Attributes:
+        graph: The Graph served.
+        latency (float): Simulated round-trip time, in seconds.
+        per_vertex (float): Simulated transfer time per vertex, in seconds.
+        calls (int): Number of calls made so far.
+        vertices_loaded (int): Number of vertices requested so far.
+        max_active (int): Largest number of calls that ran at the same time.
+    """
+    def __init__(self, graph, latency=0.005, per_vertex=0.0):
+        """
+        Initialize a loader for a graph.
+
+        Args:
+            graph: The Graph to serve.
+            latency: Simulated round-trip time in seconds (default: 0.005).
+            per_vertex: Simulated time per requested vertex (default: 0).
+        """
+        self.graph = graph
+        self.latency = latency
+        self.per_vertex = per_vertex
+        self.calls = 0
+        self.vertices_loaded = 0
+        self.max_active = 0
+        self._active = 0
+
+    async def __call__(self, vertices):
+        """
+        Load the neighbor lists of some vertices.
+
+        Args:
+            vertices (list): The vertices to load.
+
+        Returns:
+            dict: Vertex -> copy of its neighbor list, for the vertices of
+                the graph.
+        """
+        self.calls += 1
+        self.vertices_loaded += len(vertices)
+        self._active += 1
+        self.max_active = max(self.max_active, self._active)
+        try:
+            await asyncio.sleep(self.latency + self.per_vertex * len(vertices))
+            adjacency = self.graph.adjacency
+            return {v: list(adjacency[v]) for v in vertices if v in adjacency}
+        finally:
+            self._active -= 1
+
+
+class AsyncGraph:
+    """
+    A read-only graph whose neighbor lists are loaded lazily by an async loader.
+
+    Each call to `get_neighbors` for an uncached vertex joins a pending batch.
+    The batch is sent to the loader at the end of the current event-loop
+    iteration (or after `batch_delay` seconds), or as soon as it reaches
+    `batch_size` vertices. Concurrent requests for the same vertex share a
+    single load. At most `max_concurrency` loader calls run at once.
+
+    Must be used from a single event loop.
+
+    Attributes:
+        loader: Async callable mapping a list of vertices to their neighbors.
+        batch_size (int): Maximum number of vertices per loader call.
+        batch_delay (float): Seconds to wait for more requests before
+            sending a batch (0: the end of the current loop iteration).
+        cache_size (int or None): Maximum number of cached neighbor lists
+            (least recently used are evicted), or None for no limit.
+        hits (int): Requests answered from the cache.
+        misses (int): Requests that needed a load.
+        loads (int): Loader calls made.
+    """
+    def __init__(self, loader, batch_size=64, max_concurrency=8, batch_delay=0,
+                 cache_size=None):
+        """
+        Initialize an AsyncGraph.
+
+        Args:
+            loader: Async callable taking a list of vertices and returning a
+                dict of vertex -> neighbor list.
+            batch_size: Maximum vertices per loader call (default: 64).
+            max_concurrency: Maximum loader calls at once (default: 8).
+            batch_delay: Seconds to collect requests before sending a batch
+                (default: 0).
+            cache_size: Maximum cached neighbor lists (default: unlimited).
+
+        Raises:
+            ValueError: If batch_size, max_concurrency or cache_size is not
+                positive, or batch_delay is negative.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        if max_concurrency <= 0:
+            raise ValueError("Max concurrency must be positive")
+        if batch_delay < 0:
+            raise ValueError("Batch delay must not be negative")
+        if cache_size is not None and cache_size <= 0:
+            raise ValueError("Cache size must be positive")
+        self.loader = loader
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self._cache = OrderedDict()
+        self._pending = {}    # Vertex -> future, waiting for the next batch
+        self._in_flight = {}  # Vertex -> future, sent to the loader
+        self._flush_scheduled = None
+        self._tasks = set()
+        self._semaphore = None  # Created inside the event loop on first use
+        self._max_concurrency = max_concurrency
+
+    def _remember(self, vertex, neighbors):
+        """
+        Cache the neighbor list of a vertex, evicting the oldest if full.
+
+        Args:
+            vertex: The vertex.
+            neighbors (list): Its neighbors.
+        """
+        self._cache[vertex] = neighbors
+        self._cache.move_to_end(vertex)
+        if self.cache_size is not None and len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _flush(self):
+        """Send all pending vertices to the loader, in batches of batch_size."""
+        if self._flush_scheduled is not None:
+            self._flush_scheduled.cancel()
+            self._flush_scheduled = None
+        pending = list(self._pending.items())
+        self._pending.clear()
+        for start in range(0, len(pending), self.batch_size):
+            batch = dict(pending[start:start + self.batch_size])
+            self._in_flight.update(batch)
+            task = asyncio.ensure_future(self._load(batch))
+            self._tasks.add(task)  # Keep a reference until the task is done
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, batch):
+        """
+        Load one batch, respecting the concurrency limit, and resolve its futures.
+
+        Args:
+            batch (dict): Vertex -> future to resolve with its neighbors.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        try:
+            async with self._semaphore:
+                self.loads += 1
+                loaded = await self.loader(list(batch))
+            # Inside the try: a loader returning something other than a
+            # mapping (e.g. None) fails the batch instead of leaving it pending
+            results = {vertex: loaded.get(vertex, []) for vertex in batch}
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            for vertex in batch:
+                self._in_flight.pop(vertex, None)
+        for vertex, future in batch.items():
+            neighbors = results[vertex]
+            self._remember(vertex, neighbors)
+            if not future.done():
+                future.set_result(neighbors)
+
+    async def get_neighbors(self, v):
+        """
+        Get all vertices adjacent to vertex v, loading them if needed.
+
+        Args:
+            v: The vertex to get neighbors for.
+
+        Returns:
+            list: The adjacent vertices (or (vertex, weight) tuples for a
+                weighted graph). Unknown vertices have no neighbors.
+
+        Raises:
+            Exception: Any error raised by the loader for v's batch.
+        """
+        neighbors = self._cache.get(v)
+        if neighbors is not None:
+            self.hits += 1
+            self._cache.move_to_end(v)
+            return neighbors
+        self.misses += 1
+        future = self._in_flight.get(v) or self._pending.get(v)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[v] = future
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self._flush_scheduled is None:
+                if self.batch_delay:
+                    self._flush_scheduled = loop.call_later(self.batch_delay, self._flush)
+                else:
+                    self._flush_scheduled = loop.call_soon(self._flush)
+        # Shield the shared load from the cancellation of one waiting caller
+        return await asyncio.shield(future)
+
+    async def prefetch(self, vertices):
+        """
+        Load the neighbor lists of many vertices at once.
+
+        Args:
+            vertices: An iterable of vertices.
+
+        Returns:
+            dict: Vertex -> neighbor list.
+        """
+        vertices = list(vertices)
+        results = await asyncio.gather(*(self.get_neighbors(v) for v in vertices))
+        return dict(zip(vertices, results))
+
+    def invalidate(self, v=None):
+        """
+        Drop cached neighbor lists so they are loaded again.
+
+        Args:
+            v: The vertex to forget (default: all vertices).
+        """
+        if v is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(v, None)
+
+    async def bfs(self, start, max_depth=None):
+        """
+        Breadth-first search from a vertex, one level at a time.
+
+        The neighbors of a whole level are requested at once, so they are
+        fetched in a few batched loader calls running concurrently instead
+        of one round trip per vertex.
+
+        Args:
+            start: The vertex to start from.
+            max_depth: Optional maximum distance from start to explore.
+
+        Returns:
+            dict: Vertex -> distance from start, in breadth-first order.
+        """
+        depths = {start: 0}
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            levels = await asyncio.gather(*(self.get_neighbors(v) for v in frontier))
+            next_frontier = []
+            for neighbors in levels:
+                for neighbor in neighbors:
+                    if isinstance(neighbor, tuple):  # Weighted: (vertex, weight)
+                        neighbor = neighbor[0]
+                    if neighbor not in depths:
+                        depths[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return depths
+
+    def __str__(self):
+        """
+        Return a string representation of the graph.
+
+        Returns:
+            str: The cache and loader statistics.
+        """
+        return (f"AsyncGraph(cached={len(self._cache)}, hits={self.hits}, "
+                f"misses={self.misses}, loads={self.loads})")
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+    import time
+
+    try:
+        from .Graphs import Graph
+    except ImportError:  # Run as a script rather than with -m
+        from Graphs import Graph
+
+    # A random social graph that lives "behind a service"
+    rng = random.Random(3)
+    social = Graph()
+    for person in range(2000):
+        social.add_vertex(person)
+    for _ in range(6000):
+        social.add_edge(rng.randrange(2000), rng.randrange(2000))
+
+    async def main():
+        print("Step 1: Lazy neighbor loading with caching")
+        loader = GraphLoader(social, latency=0.002)
+        graph = AsyncGraph(loader)
+        print("Neighbors of 0:", await graph.get_neighbors(0))
+        print("Again (from the cache):", await graph.get_neighbors(0))
+        print(graph)
+
+        print("\nStep 2: BFS with one round trip per vertex")
+        loader = GraphLoader(social, latency=0.002)
+        start = time.perf_counter()
+        depths = await AsyncGraph(loader, batch_size=1, max_concurrency=1).bfs(0)
+        print(f"Reached {len(depths)} vertices in {time.perf_counter() - start:.2f}s "
+              f"with {loader.calls} loader calls")
+
+        print("\nStep 3: BFS with batched, concurrent loads")
+        loader = GraphLoader(social, latency=0.002)
+        start = time.perf_counter()
+        depths = await AsyncGraph(loader, batch_size=64, max_concurrency=8).bfs(0)
+        print(f"Reached {len(depths)} vertices in {time.perf_counter() - start:.2f}s "
+              f"with {loader.calls} loader calls (at most {loader.max_active} at once)")
+        print("Farthest distance:", max(depths.values()))
+
+    asyncio.run(main())
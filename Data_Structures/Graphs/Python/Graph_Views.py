@@ -0,0 +1,484 @@
+"""
+Graph Views Implementation
+
+This module provides read-only views of a Graph that don't copy it:
+- SubgraphView: the subgraph induced by a set of vertices (those vertices
+  and the edges between them).
+- EdgeFilterView: all vertices, but only the edges accepted by a predicate
+  (e.g. edges lighter than a threshold).
+- ReversedView: a directed graph with every edge reversed (the transpose).
+
+A view reads through to its parent graph: nothing is copied when it is
+created, and `get_neighbors` returns a lazy sequence that filters the
+parent's neighbor list while it is iterated, so no list is built and later
+changes to the parent are seen. The exception is ReversedView of a directed
+graph: it caches an index of incoming edges, which only reflects changes to
+the parent's edges after `refresh()` is called. Views expose the same
+read API as Graph (`get_neighbors`, `get_vertices`, `get_edges`, plus
+`directed` and a read-only `adjacency` mapping), so code written for Graph,
+like traversals, `GraphMatrix` or the minimum spanning tree algorithms, runs
+on them unchanged. Views can be stacked, e.g. the reverse of a subgraph.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from itertools import islice
+
+
+def _target(entry):
+    """
+    Get the neighbor vertex of an adjacency entry.
+
+    Args:
+        entry: A vertex, or a (vertex, weight) tuple for weighted graphs.
+
+    Returns:
+        The neighbor vertex.
+    """
+    return entry[0] if isinstance(entry, tuple) else entry
+
+
+class _FilteredNeighbors(Sequence):
+    """
+    Lazy, read-only neighbor list of a view.
+
+    Keeps the parent's neighbor list and a filter, and applies the filter
+    while iterating instead of building a new list. `len()` and indexing
+    walk the parent's list, in O(deg(v)).
+    """
+    __slots__ = ('_entries', '_keep')
+
+    def __init__(self, entries, keep):
+        """
+        Initialize the sequence.
+
+        Args:
+            entries: The parent's neighbor list of the vertex.
+            keep: Function entry -> bool selecting the entries of the view.
+        """
+        self._entries = entries
+        self._keep = keep
+
+    def __iter__(self):
+        """Lazily yield the entries accepted by the filter."""
+        return filter(self._keep, self._entries)
+
+    def __len__(self):
+        """Return the number of accepted entries."""
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        """Return True if at least one entry is accepted."""
+        for _ in self:
+            return True
+        return False
+
+    def __getitem__(self, index):
+        """
+        Get an accepted entry by position, or a list for a slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for entry in islice(self, index, None):
+                return entry
+        raise IndexError("Neighbor index out of range")
+
+    def __reversed__(self):
+        """Yield the accepted entries from last to first."""
+        return reversed(list(self))
+
+    def __eq__(self, other):
+        """Compare element-wise with another neighbor list."""
+        if isinstance(other, (list, tuple, _FilteredNeighbors)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Show the accepted entries like a list."""
+        return repr(list(self))
+
+
+class _Adjacency(Mapping):
+    """
+    Read-only `adjacency` mapping of a view: vertex -> neighbor list.
+
+    Neighbor lists are computed by the view when looked up.
+    """
+    def __init__(self, view):
+        """
+        Initialize the mapping.
+
+        Args:
+            view: The GraphView it belongs to.
+        """
+        self._view = view
+
+    def __getitem__(self, v):
+        """
+        Get the neighbor list of a vertex of the view.
+
+        Raises:
+            KeyError: If the vertex is not in the view.
+        """
+        if not self._view.has_vertex(v):
+            raise KeyError(v)
+        return self._view.get_neighbors(v)
+
+    def __contains__(self, v):
+        """Return True if the vertex is in the view."""
+        return self._view.has_vertex(v)
+
+    def __iter__(self):
+        """Iterate over the vertices of the view."""
+        return iter(self._view.get_vertices())
+
+    def __len__(self):
+        """Return the number of vertices of the view."""
+        return len(self._view.get_vertices())
+
+
+class GraphView(ABC):
+    """
+    Abstract base class of the read-only graph views.
+
+    Subclasses must define `get_neighbors`, and override `has_vertex` and
+    `get_vertices` when they hide vertices; the rest of the read API is
+    derived from them.
+
+    Attributes:
+        parent: The Graph (or view) this view reads from.
+        directed (bool): Whether the parent graph is directed.
+    """
+    def __init__(self, parent):
+        """
+        Initialize a view of a graph.
+
+        Args:
+            parent: The Graph (or view) to read from.
+        """
+        self.parent = parent
+        self.directed = parent.directed
+
+    @property
+    def adjacency(self):
+        """
+        A read-only mapping of vertex -> neighbor list, like Graph.adjacency.
+
+        Returns:
+            Mapping: The adjacency mapping of the view.
+        """
+        return _Adjacency(self)
+
+    def has_vertex(self, v):
+        """
+        Check if a vertex is in the view.
+
+        Args:
+            v: The vertex.
+
+        Returns:
+            bool: True if the vertex is in the view.
+        """
+        return v in self.parent.adjacency
+
+    def get_vertices(self):
+        """
+        Get all vertices in the view.
+
+        Returns:
+            list: A list of all vertices in the view.
+        """
+        return self.parent.get_vertices()
+
+    @abstractmethod
+    def get_neighbors(self, v):
+        """
+        Get all vertices adjacent to vertex v in the view.
+
+        Args:
+            v: The vertex to get neighbors for.
+
+        Returns:
+            Sequence: The adjacent vertices (or (vertex, weight) tuples), as
+                a list or a lazy sequence. Empty if the vertex doesn't exist.
+        """
+
+    def get_edges(self):
+        """
+        Get all edges in the view.
+
+        For undirected graphs, each edge is listed once.
+
+        Returns:
+            list: A list of tuples (v1, v2) or (v1, v2, weight) for all edges.
+        """
+        edges = []
+        seen = set()
+        for v1 in self.get_vertices():
+            for entry in self.get_neighbors(v1):
+                edge = (v1, *entry) if isinstance(entry, tuple) else (v1, entry)
+                if not self.directed:
+                    reverse = (edge[1], v1, *edge[2:])
+                    if reverse in seen:
+                        continue
+                    seen.add(edge)
+                edges.append(edge)
+        return edges
+
+    def to_graph(self):
+        """
+        Copy the view into a new, independent graph.
+
+        Returns:
+            Graph: A graph of the same class as the underlying graph.
+        """
+        root = self.parent
+        while isinstance(root, GraphView):
+            root = root.parent
+        graph = type(root)(directed=self.directed)
+        for v in self.get_vertices():
+            graph.adjacency[v] = list(self.get_neighbors(v))
+        return graph
+
+    def __len__(self):
+        """
+        Allow using len(view).
+
+        Returns:
+            int: The number of vertices in the view.
+        """
+        return len(self.get_vertices())
+
+    def __str__(self):
+        """
+        Return a string representation of the view.
+
+        Returns:
+            str: A string showing each vertex and its adjacent vertices.
+        """
+        return "\n".join([f"{v}: {self.get_neighbors(v)}" for v in self.get_vertices()])
+
+
+class SubgraphView(GraphView):
+    """
+    The subgraph induced by a set of vertices.
+
+    Contains the given vertices that are in the parent graph, and the
+    parent's edges between two of them.
+    """
+    def __init__(self, parent, vertices):
+        """
+        Initialize an induced subgraph view.
+
+        Args:
+            parent: The Graph (or view) to read from.
+            vertices: An iterable of the vertices to keep.
+        """
+        super().__init__(parent)
+        self._vertices = dict.fromkeys(vertices)  # Ordered set
+
+    def has_vertex(self, v):
+        """
+        Check if a vertex is in the subgraph.
+
+        Args:
+            v: The vertex.
+
+        Returns:
+            bool: True if the vertex was selected and is in the parent.
+        """
+        return v in self._vertices and v in self.parent.adjacency
+
+    def get_vertices(self):
+        """
+        Get all vertices in the subgraph, in the order they were given.
+
+        Returns:
+            list: The selected vertices present in the parent.
+        """
+        parent_vertices = self.parent.adjacency
+        return [v for v in self._vertices if v in parent_vertices]
+
+    def get_neighbors(self, v):
+        """
+        Get the neighbors of v inside the subgraph.
+
+        Args:
+            v: The vertex to get neighbors for.
+
+        Returns:
+            Sequence: A lazy sequence of the parent's neighbors of v that are
+                in the subgraph (empty if v isn't in the subgraph).
+        """
+        if v not in self._vertices:
+            return []
+        selected = self._vertices
+        return _FilteredNeighbors(self.parent.get_neighbors(v),
+                                  lambda entry: _target(entry) in selected)
+
+
+class EdgeFilterView(GraphView):
+    """
+    All vertices of the parent graph, with only the edges accepted by a predicate.
+
+    For undirected graphs the predicate should be symmetric (give the same
+    answer for (v1, v2) and (v2, v1)), or the view can hold an edge in one
+    direction only.
+    """
+    def __init__(self, parent, predicate):
+        """
+        Initialize an edge filter view.
+
+        Args:
+            parent: The Graph (or view) to read from.
+            predicate: Function (v1, v2, weight) -> bool deciding if the edge
+                from v1 to v2 is kept. weight is None for unweighted graphs.
+        """
+        super().__init__(parent)
+        self.predicate = predicate
+
+    def get_neighbors(self, v):
+        """
+        Get the neighbors of v through accepted edges.
+
+        Args:
+            v: The vertex to get neighbors for.
+
+        Returns:
+            Sequence: A lazy sequence of the parent's neighbors of v whose
+                edge passes the predicate.
+        """
+        predicate = self.predicate
+
+        def keep(entry):
+            if isinstance(entry, tuple):
+                return predicate(v, entry[0], entry[1])
+            return predicate(v, entry, None)
+
+        return _FilteredNeighbors(self.parent.get_neighbors(v), keep)
+
+
+class ReversedView(GraphView):
+    """
+    A directed graph with all edges reversed (the transposed graph).
+
+    The neighbors of v in the view are the vertices with an edge to v in the
+    parent. Finding them requires an index of incoming edges, which is built
+    on the first lookup in O(V + E) and reused afterwards. Unlike the other
+    views, it therefore doesn't see edges added to or removed from the
+    parent after that lookup until `refresh()` is called. For undirected
+    graphs, reversing changes nothing and the view reads the parent
+    directly, so it is always up to date.
+    """
+    def __init__(self, parent):
+        """
+        Initialize a reversed view.
+
+        Args:
+            parent: The Graph (or view) to read from.
+        """
+        super().__init__(parent)
+        self._incoming = None
+
+    def refresh(self):
+        """Drop the index of incoming edges so it is rebuilt from the parent."""
+        self._incoming = None
+
+    def _incoming_index(self):
+        """
+        Build (once) the index of incoming edges of the parent.
+
+        Returns:
+            dict: Vertex -> list of entries for the edges pointing to it,
+                (source, weight) tuples for weighted graphs.
+        """
+        if self._incoming is None:
+            incoming = {}
+            for v in self.parent.get_vertices():
+                for entry in self.parent.get_neighbors(v):
+                    if isinstance(entry, tuple):
+                        incoming.setdefault(entry[0], []).append((v, entry[1]))
+                    else:
+                        incoming.setdefault(entry, []).append(v)
+            self._incoming = incoming
+        return self._incoming
+
+    def get_neighbors(self, v):
+        """
+        Get the vertices with an edge to v in the parent.
+
+        Args:
+            v: The vertex to get neighbors for.
+
+        Returns:
+            list: The sources of the parent's edges into v.
+        """
+        if not self.directed:
+            return self.parent.get_neighbors(v)
+        return self._incoming_index().get(v, [])
+
+
+# Example usage
+if __name__ == "__main__":
+    from collections import deque
+
+    try:
+        from .Graphs import Graph
+    except ImportError:  # Run as a script rather than with -m
+        from Graphs import Graph
+
+    def bfs(graph, start):
+        """Breadth-first order from start, using only get_neighbors."""
+        order, seen, queue = [], {start}, deque([start])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for entry in graph.get_neighbors(v):
+                neighbor = _target(entry)
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        return order
+
+    # A weighted road network
+    roads = Graph()
+    for a, b, km in [("A", "B", 5), ("A", "C", 3), ("B", "C", 2), ("B", "D", 6),
+                     ("C", "D", 7), ("D", "E", 4)]:
+        roads.add_edge(a, b, km)
+
+    print("Step 1: Induced subgraph on A, B, C")
+    triangle = SubgraphView(roads, ["A", "B", "C"])
+    print(triangle)
+    print("Edges:", triangle.get_edges())
+
+    print("\nStep 2: Only roads shorter than 6 km")
+    short = EdgeFilterView(roads, lambda a, b, km: km < 6)
+    print("BFS from A:", bfs(short, "A"))
+    print("Edges:", short.get_edges())
+
+    print("\nStep 3: Views read through to the parent")
+    roads.add_edge("C", "E", 1)
+    print("Short edges after adding C-E (1 km):", short.get_edges())
+
+    print("\nStep 4: Reversed view of a directed graph")
+    follows = Graph(directed=True)
+    for a, b in [("ann", "bob"), ("bob", "cat"), ("ann", "cat"), ("dan", "ann")]:
+        follows.add_edge(a, b)
+    followers = ReversedView(follows)
+    print("ann follows:", follows.get_neighbors("ann"))
+    print("cat is followed by:", followers.get_neighbors("cat"))
+    print("Reachable from cat in the reversed graph:", bfs(followers, "cat"))
+
+    print("\nStep 5: Stacked views and copying")
+    view = ReversedView(SubgraphView(follows, ["ann", "bob", "cat"]))
+    copy = view.to_graph()
+    print("Copied graph:")
+    print(copy)
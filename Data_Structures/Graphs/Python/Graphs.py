@@ -5,6 +5,16 @@ This module provides a Graph data structure implementation using an adjacency li
 The implementation supports directed/undirected graphs and weighted/unweighted graphs.
 """
 
+import sys
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+
+
 class Graph:
     """
     Graph implementation using an adjacency list.
@@ -57,15 +67,18 @@ class Graph:
         # For weighted graphs, store (vertex, weight) tuples
         if weight is not None:
             # Check if edge already exists
-            for i, (vertex, _) in enumerate(self.adjacency[v1]):
-                if vertex == v2:
-                    # Update weight if edge exists
-                    self.adjacency[v1][i] = (v2, weight)
-                    if not self.directed:
-                        for i, (vertex, _) in enumerate(self.adjacency[v2]):
-                            if vertex == v1:
-                                self.adjacency[v2][i] = (v1, weight)
-                    return
+            neighbors = self.adjacency[v1]
+            position = self._neighbor_index(neighbors, v2)
+            if position >= 0:
+                # Update weight if edge exists
+                neighbors[position] = (v2, weight)
+                if not self.directed:
+                    reverse = self.adjacency[v2]
+                    position = self._neighbor_index(reverse, v1)
+                    while position >= 0:
+                        reverse[position] = (v1, weight)
+                        position = self._neighbor_index(reverse, v1, position + 1)
+                return
             
             # Add new edge with weight
             self.adjacency[v1].append((v2, weight))
@@ -78,6 +91,27 @@ class Graph:
                 if not self.directed:
                     self.adjacency[v2].append(v1)
 
+    @staticmethod
+    def _neighbor_index(neighbors, vertex, start=0):
+        """
+        Find a vertex in a weighted adjacency list.
+
+        `_accelerated.Graph` replaces this scan with the C `neighbor_index`.
+
+        Args:
+            neighbors: The list of (vertex, weight) pairs to scan.
+            vertex: The vertex to look for.
+            start: The position to start scanning from.
+
+        Returns:
+            int: The position of the first matching pair at or after start, or -1.
+        """
+        for i in range(start, len(neighbors)):
+            neighbor, _ = neighbors[i]
+            if neighbor == vertex:
+                return i
+        return -1
+
     def get_neighbors(self, v):
         """
         Get all vertices adjacent to vertex v.
@@ -186,6 +220,46 @@ class Graph:
         """
         return "\n".join([f"{v}: {neighbors}" for v, neighbors in self.adjacency.items()])
 
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the graph, counting each object once.
+
+        A vertex is counted once, whether it appears as a key or in many
+        neighbor lists.
+
+        Args:
+            deep: If True, include everything the vertices and weights
+                reference (default: True).
+
+        Returns:
+            MemoryUsage: Overhead bytes (the graph object, the adjacency
+                dictionary, the neighbor lists and the (vertex, weight)
+                tuples) and payload bytes (the vertices and the weights).
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        sizeof = usage.sizeof
+        payload_sizeof = usage.payload_sizeof
+        usage.overhead["object"] = sizeof(self) + sizeof(vars(self))
+        usage.overhead["dictionary"] = sizeof(self.adjacency)
+        lists = tuples = vertices = weights = 0
+        for v, neighbors in self.adjacency.items():
+            vertices += payload_sizeof(v)
+            lists += sizeof(neighbors)
+            for entry in neighbors:
+                if isinstance(entry, tuple):  # Weighted: (vertex, weight)
+                    tuples += sizeof(entry)
+                    vertices += payload_sizeof(entry[0])
+                    weights += payload_sizeof(entry[1])
+                else:
+                    vertices += payload_sizeof(entry)
+        usage.overhead["neighbor_lists"] = lists
+        if tuples:
+            usage.overhead["edge_tuples"] = tuples
+        usage.payload["vertices"] = vertices
+        if weights:
+            usage.payload["weights"] = weights
+        return usage
+
 
 # Example usage
 if __name__ == "__main__":
@@ -255,4 +329,8 @@ if __name__ == "__main__":
     
     # Print the modified graph
     print("\nModified weighted graph:")
-    print(weighted_graph)
\ No newline at end of file
+    print(weighted_graph)
+
+    # Measure the neighbor lists and edge tuples, not just the vertices
+    print("\nMemory usage of the weighted graph:")
+    print(weighted_graph.memory_usage())
@@ -0,0 +1 @@
+"""Python implementation of the Graph."""
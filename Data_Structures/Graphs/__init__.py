@@ -0,0 +1 @@
+"""Graph data structure."""
@@ -0,0 +1,323 @@
+"""
+Bloom Filter Implementation
+
+A Bloom filter answers "is this key in the set?" with either "definitely not"
+or "probably yes", using a few bits per key regardless of the key size. It
+never gives a false negative; the rate of false positives is chosen when the
+filter is sized.
+
+This module provides:
+- BloomFilter: the classic filter, one bit per slot, packed in a `bytearray`.
+- CountingBloomFilter: 4-bit counters instead of bits (two per byte), which
+  also supports removing keys.
+
+Either one can be used on its own or given to a HashTable
+(`HashTable(size, bloom_filter=...)`), which then answers most misses from
+the filter without scanning a bucket.
+
+Keys are hashed with Python's `hash()`, so a filter is only valid within one
+process (string hashes are randomized per interpreter run).
+"""
+
+import math
+
+_MASK_64 = (1 << 64) - 1
+
+
+def optimal_size(expected_items, false_positive_rate):
+    """
+    Compute the number of slots and hash functions for a Bloom filter.
+
+    Uses the standard formulas m = -n ln(p) / ln(2)^2 and k = (m / n) ln(2).
+
+    Args:
+        expected_items: Number of keys the filter is expected to hold (n).
+        false_positive_rate: Target false positive rate (p), between 0 and 1.
+
+    Returns:
+        tuple: (number of slots m, number of hash functions k).
+
+    Raises:
+        ValueError: If expected_items is not positive or the rate is not
+            strictly between 0 and 1.
+    """
+    if expected_items <= 0:
+        raise ValueError("Expected items must be positive")
+    if not 0 < false_positive_rate < 1:
+        raise ValueError("False positive rate must be between 0 and 1")
+    slots = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+    hashes = max(1, round(slots / expected_items * math.log(2)))
+    return slots, hashes
+
+
+class BloomFilter:
+    """
+    A Bloom filter over a packed bit array.
+
+    Each key sets `num_hashes` bits, chosen by double hashing
+    (h1 + i * h2 mod m) from the two halves of the key's mixed hash.
+    A lookup stops at the first clear bit, so most misses only read one or
+    two bits.
+
+    Attributes:
+        num_bits (int): Number of bits (m).
+        num_hashes (int): Bits set per key (k).
+        count (int): Number of keys added.
+        bits (bytearray): The bit array, 8 bits per byte.
+    """
+    counting = False  # Plain bits can't be cleared, so keys can't be removed
+
+    def __init__(self, expected_items, false_positive_rate=0.01):
+        """
+        Initialize an empty Bloom filter sized for the expected load.
+
+        Args:
+            expected_items: Number of keys the filter is expected to hold.
+            false_positive_rate: Target false positive rate at that load
+                (default: 0.01).
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        self.num_bits, self.num_hashes = optimal_size(expected_items, false_positive_rate)
+        self.count = 0
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _hashes(self, key):
+        """
+        Derive the two double-hashing values of a key.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            tuple: (h1, h2), with h2 odd.
+        """
+        # Mix the hash (splitmix64 finalizer) so similar keys spread out
+        x = hash(key) & _MASK_64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        x ^= x >> 31
+        return x >> 32, (x & 0xFFFFFFFF) | 1
+
+    def _positions(self, key):
+        """
+        Compute the slots of a key.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            list: The `num_hashes` slot positions.
+        """
+        h1, h2 = self._hashes(key)
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key):
+        """
+        Add a key to the filter.
+
+        Args:
+            key: The key (must be hashable).
+        """
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, key):
+        """
+        Check if a key may have been added.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            bool: False if the key was definitely never added, True if it
+                probably was.
+        """
+        h1, h2 = self._hashes(key)
+        m = self.num_bits
+        bits = self.bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % m
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, key):
+        """
+        Allow using `key in bloom_filter`.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            bool: The result of might_contain(key).
+        """
+        return self.might_contain(key)
+
+    def __len__(self):
+        """
+        Allow using len(bloom_filter).
+
+        Returns:
+            int: The number of keys added.
+        """
+        return self.count
+
+    def false_positive_rate(self):
+        """
+        Estimate the current false positive rate from the number of keys.
+
+        Returns:
+            float: (1 - e^(-k n / m))^k for the current n.
+        """
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def clear(self):
+        """Remove all keys from the filter."""
+        self.bits[:] = bytes(len(self.bits))
+        self.count = 0
+
+    def __str__(self):
+        """
+        Return a string representation of the filter.
+
+        Returns:
+            str: The sizing and load of the filter.
+        """
+        return (f"{type(self).__name__}(bits={self.num_bits}, hashes={self.num_hashes}, "
+                f"items={self.count}, false_positive_rate={self.false_positive_rate():.4f})")
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    A Bloom filter with 4-bit counters, which supports removing keys.
+
+    Each slot is a counter packed two per byte, so the filter takes four
+    times the memory of a BloomFilter with the same false positive rate.
+    A counter that reaches 15 stays there (it can no longer be decremented
+    safely), which can only cause false positives, never false negatives.
+
+    Attributes:
+        num_bits (int): Number of counters (m).
+        num_hashes (int): Counters incremented per key (k).
+        count (int): Number of keys currently in the filter.
+        bits (bytearray): The counters, two 4-bit counters per byte.
+    """
+    counting = True
+
+    def __init__(self, expected_items, false_positive_rate=0.01):
+        """
+        Initialize an empty counting Bloom filter sized for the expected load.
+
+        Args:
+            expected_items: Number of keys the filter is expected to hold.
+            false_positive_rate: Target false positive rate at that load
+                (default: 0.01).
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        super().__init__(expected_items, false_positive_rate)
+        self.bits = bytearray((self.num_bits + 1) // 2)
+
+    def _counter(self, position):
+        """
+        Read the counter at a slot.
+
+        Args:
+            position: The slot position.
+
+        Returns:
+            int: The counter value (0-15).
+        """
+        return (self.bits[position >> 1] >> ((position & 1) << 2)) & 0xF
+
+    def add(self, key):
+        """
+        Add a key to the filter.
+
+        Args:
+            key: The key (must be hashable).
+        """
+        bits = self.bits
+        for position in self._positions(key):
+            shift = (position & 1) << 2
+            if (bits[position >> 1] >> shift) & 0xF != 0xF:
+                bits[position >> 1] += 1 << shift
+        self.count += 1
+
+    def remove(self, key):
+        """
+        Remove a previously added key from the filter.
+
+        Only remove keys that were added: removing a key that merely looks
+        present (a false positive) would clear counters of other keys.
+
+        Args:
+            key: The key (must be hashable).
+
+        Raises:
+            KeyError: If the key was definitely never added.
+        """
+        positions = self._positions(key)
+        if not all(self._counter(position) for position in positions):
+            raise KeyError(f"Key '{key}' not found")
+        bits = self.bits
+        for position in positions:
+            shift = (position & 1) << 2
+            if (bits[position >> 1] >> shift) & 0xF != 0xF:
+                bits[position >> 1] -= 1 << shift
+        self.count -= 1
+
+    def might_contain(self, key):
+        """
+        Check if a key may be in the filter.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            bool: False if the key is definitely not in the filter, True if
+                it probably is.
+        """
+        h1, h2 = self._hashes(key)
+        m = self.num_bits
+        bits = self.bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % m
+            if not (bits[position >> 1] >> ((position & 1) << 2)) & 0xF:
+                return False
+        return True
+
+
+# Example usage
+if __name__ == "__main__":
+    # Size a filter for 1000 keys at a 1% false positive rate
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    print("New filter:", bloom)
+    print(f"Memory: {len(bloom.bits)} bytes for {bloom.num_bits} bits")
+
+    for i in range(1000):
+        bloom.add(f"user-{i}")
+    print("\nAfter adding 1000 keys:", bloom)
+    print("Contains 'user-42':", "user-42" in bloom)
+
+    # Measure the false positive rate on keys that were never added
+    false_positives = sum(f"visitor-{i}" in bloom for i in range(10000))
+    print(f"False positives on 10000 unknown keys: {false_positives / 10000:.2%}")
+
+    # A counting filter supports removal
+    counting = CountingBloomFilter(expected_items=100, false_positive_rate=0.01)
+    counting.add("apple")
+    counting.add("banana")
+    print("\nCounting filter contains 'apple':", "apple" in counting)
+    counting.remove("apple")
+    print("After removing 'apple':", "apple" in counting)
+    try:
+        counting.remove("cherry")
+    except KeyError as e:
+        print("Error:", e)
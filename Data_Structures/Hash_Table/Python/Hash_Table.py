@@ -5,6 +5,15 @@ A simple hash table implementation that uses separate chaining for collision res
 For this implementation, we use Python lists to handle collisions through chaining.
 """
 
+import sys
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+
 
 class HashTable:
     """
@@ -12,17 +21,25 @@ class HashTable:
     
     This implementation uses separate chaining (linked lists)
     to handle collisions.
+
+    An optional Bloom filter (see Bloom_Filter.py) acts as a membership
+    pre-check: lookups of keys the filter has never seen fail without
+    scanning a bucket.
     """
     
-    def __init__(self, size=10):
+    def __init__(self, size=10, bloom_filter=None):
         """
         Initialize a hash table with the given size.
         
         Args:
             size: Number of buckets in the hash table (default: 10)
+            bloom_filter: Optional empty BloomFilter or CountingBloomFilter
+                consulted before each lookup. A CountingBloomFilter also
+                forgets deleted keys (default: None)
         """
         self.size = size
         self.table = [[] for _ in range(size)]  # Create empty buckets
+        self.bloom_filter = bloom_filter
 
     def _hash_function(self, key):
         """
@@ -36,6 +53,24 @@ class HashTable:
         """
         return hash(key) % self.size
 
+    @staticmethod
+    def _chain_index(bucket, key):
+        """
+        Find a key in a bucket. Every operation goes through this scan, so
+        the accelerated HashTable (_accelerated.py) swaps in a C version.
+
+        Args:
+            bucket: The list of (key, value) pairs to scan
+            key: The key to look for
+
+        Returns:
+            The position of the key's pair in the bucket, or -1
+        """
+        for i, (k, v) in enumerate(bucket):
+            if k == key:
+                return i
+        return -1
+
     def insert(self, key, value):
         """
         Insert or update a key-value pair in the hash table.
@@ -44,17 +79,19 @@ class HashTable:
             key: The key (must be hashable)
             value: The value to store
         """
-        index = self._hash_function(key)
+        bucket = self.table[self._hash_function(key)]
         
         # Check if key already exists
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                # Update existing key
-                self.table[index][i] = (key, value)
-                return
+        position = self._chain_index(bucket, key)
+        if position >= 0:
+            # Update existing key
+            bucket[position] = (key, value)
+            return
                 
         # Key doesn't exist, add new pair
-        self.table[index].append((key, value))
+        bucket.append((key, value))
+        if self.bloom_filter is not None:
+            self.bloom_filter.add(key)
 
     def get(self, key):
         """
@@ -69,12 +106,16 @@ class HashTable:
         Raises:
             KeyError: If the key is not found
         """
-        index = self._hash_function(key)
+        # Keys the filter has never seen can't be in the table
+        if self.bloom_filter is not None and not self.bloom_filter.might_contain(key):
+            raise KeyError(f"Key '{key}' not found")
+
+        bucket = self.table[self._hash_function(key)]
         
         # Search for the key in the bucket
-        for k, v in self.table[index]:
-            if k == key:
-                return v
+        position = self._chain_index(bucket, key)
+        if position >= 0:
+            return bucket[position][1]
                 
         # Key not found
         raise KeyError(f"Key '{key}' not found")
@@ -89,14 +130,19 @@ class HashTable:
         Raises:
             KeyError: If the key is not found
         """
-        index = self._hash_function(key)
+        if self.bloom_filter is not None and not self.bloom_filter.might_contain(key):
+            raise KeyError(f"Key '{key}' not found")
+
+        bucket = self.table[self._hash_function(key)]
         
         # Search for the key in the bucket
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                # Remove the key-value pair
-                del self.table[index][i]
-                return
+        position = self._chain_index(bucket, key)
+        if position >= 0:
+            # Remove the key-value pair
+            del bucket[position]
+            if self.bloom_filter is not None and self.bloom_filter.counting:
+                self.bloom_filter.remove(key)
+            return
                 
         # Key not found
         raise KeyError(f"Key '{key}' not found")
@@ -117,6 +163,39 @@ class HashTable:
         except KeyError:
             return False
     
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the table, counting each object once.
+
+        Args:
+            deep: If True, include everything the keys and values reference
+                (default: True)
+
+        Returns:
+            MemoryUsage: Overhead bytes (the table object, the bucket lists,
+                the (key, value) tuples and the Bloom filter) and payload
+                bytes (the keys and the values)
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        sizeof = usage.sizeof
+        payload_sizeof = usage.payload_sizeof
+        usage.overhead["object"] = sizeof(self) + sizeof(vars(self))
+        buckets = sizeof(self.table)
+        entries = keys = values = 0
+        for bucket in self.table:
+            buckets += sizeof(bucket)
+            for entry in bucket:
+                entries += sizeof(entry)
+                keys += payload_sizeof(entry[0])
+                values += payload_sizeof(entry[1])
+        usage.overhead["buckets"] = buckets
+        usage.overhead["entries"] = entries
+        if self.bloom_filter is not None:
+            usage.overhead["bloom_filter"] = sizeof(self.bloom_filter) + sizeof(self.bloom_filter.bits)
+        usage.payload["keys"] = keys
+        usage.payload["values"] = values
+        return usage
+
     def __str__(self):
         """
         Return a string representation of the hash table.
@@ -180,4 +259,21 @@ if __name__ == "__main__":
     try:
         hash_table.get("address")
     except KeyError as e:
-        print("Error:", e)
\ No newline at end of file
+        print("Error:", e)
+
+    # Answer misses from a Bloom filter instead of scanning buckets
+    print("\nUsing a Bloom filter as a pre-check:")
+    try:
+        from .Bloom_Filter import CountingBloomFilter
+    except ImportError:  # Run as a script rather than with -m
+        from Bloom_Filter import CountingBloomFilter
+    filtered = HashTable(size=5, bloom_filter=CountingBloomFilter(expected_items=100))
+    filtered.insert("name", "Bob")
+    print("Contains 'name':", filtered.contains("name"))
+    print("Contains 'email' (rejected by the filter):", filtered.contains("email"))
+    filtered.delete("name")
+    print("After deleting 'name', filter holds:", len(filtered.bloom_filter), "keys")
+
+    # Measure the buckets and entries, not just the outer list
+    print("\nMemory usage:")
+    print(hash_table.memory_usage())
\ No newline at end of file
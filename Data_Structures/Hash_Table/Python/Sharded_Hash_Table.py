@@ -0,0 +1,842 @@
+"""
+Sharded Hash Table Implementation
+
+A ShardedHashTable spreads its keys over several shards. Each shard is a
+HashTable held by a separate server process, so the table can use several
+cores and more memory than a single process. Shards are reached over local
+sockets (`multiprocessing.connection`), the same way a client would reach
+remote nodes. A server started elsewhere with `serve()` can be added by its
+address.
+
+Keys are assigned to shards by consistent hashing with virtual nodes. Each
+shard owns many points on a 64-bit hash ring, and a key belongs to the shard
+owning the first point at or after the key's hash. Adding or removing a
+shard then only moves the keys of the ring arcs that change owner, about
+1/N of the keys, instead of rehashing everything.
+
+Batch operations (`insert_many`, `get_many`) group the keys by shard, send
+one request to every shard before waiting for any reply, and so take a
+single round trip in total, with all shards working at the same time.
+
+Key hashes must agree between processes, so strings, bytes and tuples are
+hashed with BLAKE2 instead of Python's per-process randomized `hash()`.
+Numbers use `hash()`, which is deterministic for them. Keys of other types
+must have a deterministic `hash()` as well.
+"""
+
+import os
+import threading
+from bisect import bisect_left, insort
+from hashlib import blake2b
+from multiprocessing import AuthenticationError, Pipe, Process
+from multiprocessing.connection import Client, Listener
+
+try:
+    from .Hash_Table import HashTable
+except ImportError:  # Run as a script rather than as part of the package
+    from Hash_Table import HashTable
+
+_MASK_64 = (1 << 64) - 1
+_LOCAL_AUTHKEY = object()  # add_shard() default: the key of the local shards
+
+
+def _mix(x):
+    """
+    Spread a 64-bit integer over all bits (splitmix64 finalizer).
+
+    Args:
+        x: The integer to mix.
+
+    Returns:
+        int: The mixed 64-bit value.
+    """
+    x &= _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
+
+def _digest(data):
+    """
+    Hash bytes into a 64-bit integer with BLAKE2.
+
+    Args:
+        data: The bytes to hash.
+
+    Returns:
+        int: The 64-bit hash.
+    """
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def key_hash(key):
+    """
+    Compute the position of a key on the hash ring.
+
+    The result is the same in every process, and keys that are equal (e.g.
+    1, 1.0 and True) get the same position.
+
+    Args:
+        key: The key (must be hashable).
+
+    Returns:
+        int: A 64-bit hash of the key.
+    """
+    if isinstance(key, str):
+        return _digest(key.encode("utf-8", "surrogatepass"))
+    if isinstance(key, bytes):
+        return _digest(key)
+    if isinstance(key, tuple):
+        return _digest(b"".join(key_hash(item).to_bytes(8, "little") for item in key))
+    return _mix(hash(key))
+
+
+class ConsistentHashRing:
+    """
+    A consistent hash ring mapping keys to nodes.
+
+    Every node is placed on the ring at `virtual_nodes` points. A key is
+    owned by the node of the first point at or after its hash (wrapping
+    around at the end), so each point owns the arc (previous point, point].
+    The more virtual nodes per node, the more evenly the keys are spread.
+
+    Attributes:
+        virtual_nodes (int): Number of points per node.
+    """
+    def __init__(self, virtual_nodes=64):
+        """
+        Initialize an empty ring.
+
+        Args:
+            virtual_nodes: Number of points per node (default: 64).
+
+        Raises:
+            ValueError: If virtual_nodes is not positive.
+        """
+        if virtual_nodes <= 0:
+            raise ValueError("Virtual nodes must be positive")
+        self.virtual_nodes = virtual_nodes
+        self._points = []  # Sorted (point, node) pairs
+        self._nodes = set()
+
+    def _node_points(self, node):
+        """
+        Compute the points of a node.
+
+        Args:
+            node: The node name (a string).
+
+        Returns:
+            list: The `virtual_nodes` points of the node.
+        """
+        return [_digest(f"{node}#{i}".encode("utf-8")) for i in range(self.virtual_nodes)]
+
+    def _arc_start(self, index):
+        """
+        Return the point just before the point at `index` (wrapping around).
+
+        Args:
+            index: Position in the sorted points.
+
+        Returns:
+            int: The exclusive start of the arc owned by that point.
+        """
+        return self._points[index - 1][0]
+
+    def add_node(self, node):
+        """
+        Add a node to the ring.
+
+        Args:
+            node: The node name (a string).
+
+        Returns:
+            dict: For each node that lost keys to the new one, the list of
+                (start, end) arcs it lost. An arc holds the hashes h with
+                start < h <= end, wrapping around when start >= end.
+
+        Raises:
+            ValueError: If the node is already in the ring.
+        """
+        if node in self._nodes:
+            raise ValueError(f"Node '{node}' is already in the ring")
+        had_nodes = bool(self._nodes)
+        self._nodes.add(node)
+        points = self._node_points(node)
+        for point in points:
+            insort(self._points, (point, node))
+        if not had_nodes:
+            return {}
+
+        moved = {}
+        for point in points:
+            index = bisect_left(self._points, (point, node))
+            if self._points[index - 1][1] == node:
+                continue  # Its arc is covered by the arc of the node's previous point
+            # The previous owner is the next node on the ring: scan past the
+            # node's own consecutive points
+            following = index
+            while True:
+                following = (following + 1) % len(self._points)
+                owner = self._points[following][1]
+                if owner != node:
+                    break
+                point = self._points[following][0]
+            moved.setdefault(owner, []).append((self._arc_start(index), point))
+        return moved
+
+    def remove_node(self, node):
+        """
+        Remove a node from the ring. Its keys then belong to the nodes
+        following its points.
+
+        Args:
+            node: The node name.
+
+        Raises:
+            KeyError: If the node is not in the ring.
+        """
+        if node not in self._nodes:
+            raise KeyError(f"Node '{node}' not found")
+        self._nodes.remove(node)
+        self._points = [entry for entry in self._points if entry[1] != node]
+
+    def node_for_hash(self, position):
+        """
+        Find the node owning a position of the ring.
+
+        Args:
+            position: A 64-bit hash, as returned by key_hash.
+
+        Returns:
+            The node name.
+
+        Raises:
+            LookupError: If the ring is empty.
+        """
+        if not self._points:
+            raise LookupError("The ring has no nodes")
+        index = bisect_left(self._points, (position,))
+        if index == len(self._points):
+            index = 0  # Past the last point: wrap around to the first one
+        return self._points[index][1]
+
+    def node_for(self, key):
+        """
+        Find the node owning a key.
+
+        Args:
+            key: The key (must be hashable).
+
+        Returns:
+            The node name.
+
+        Raises:
+            LookupError: If the ring is empty.
+        """
+        return self.node_for_hash(key_hash(key))
+
+    def __len__(self):
+        """
+        Allow using len(ring).
+
+        Returns:
+            int: The number of nodes.
+        """
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        """
+        Allow using `node in ring`.
+
+        Args:
+            node: The node name.
+
+        Returns:
+            bool: True if the node is in the ring.
+        """
+        return node in self._nodes
+
+    def __iter__(self):
+        """
+        Iterate over the node names, in sorted order.
+
+        Yields:
+            The node names.
+        """
+        return iter(sorted(self._nodes))
+
+
+def _arc_table(arcs):
+    """
+    Prepare a list of ring arcs for fast membership tests.
+
+    Wrapping arcs are split in two, then the arcs are sorted by their end.
+
+    Args:
+        arcs: (start, end) pairs as returned by ConsistentHashRing.add_node.
+
+    Returns:
+        tuple: (sorted arc ends, matching exclusive arc starts).
+    """
+    split = []
+    for start, end in arcs:
+        if start < end:
+            split.append((end, start))
+        else:
+            split.append((_MASK_64, start))
+            split.append((end, -1))
+    split.sort()
+    return [end for end, _ in split], [start for _, start in split]
+
+
+def _take(table, predicate):
+    """
+    Remove and return the pairs of a table whose key matches a predicate.
+
+    Args:
+        table: The HashTable.
+        predicate: Function of a key.
+
+    Returns:
+        list: The removed (key, value) pairs.
+    """
+    taken = []
+    for bucket in table.table:
+        kept = []
+        for pair in bucket:
+            (taken if predicate(pair[0]) else kept).append(pair)
+        bucket[:] = kept
+    return taken
+
+
+def _handle(table, lock, operation, argument):
+    """
+    Run one request against a shard's table.
+
+    Args:
+        table: The shard's HashTable.
+        lock: Lock serializing access to the table.
+        operation: The request name.
+        argument: The request argument.
+
+    Returns:
+        The result of the request.
+
+    Raises:
+        ValueError: If the operation is unknown.
+    """
+    with lock:
+        if operation == "insert_many":
+            for key, value in argument:
+                table.insert(key, value)
+            return None
+        if operation == "get_many":
+            results = []
+            for key in argument:
+                try:
+                    results.append((True, table.get(key)))
+                except KeyError:
+                    results.append((False, None))
+            return results
+        if operation == "delete":
+            try:
+                table.delete(argument)
+                return True
+            except KeyError:
+                return False
+        if operation == "len":
+            return sum(len(bucket) for bucket in table.table)
+        if operation == "take_arcs":
+            ends, starts = _arc_table(argument)
+
+            def in_arcs(key):
+                position = key_hash(key)
+                index = bisect_left(ends, position)
+                return index < len(ends) and starts[index] < position
+            return _take(table, in_arcs)
+        if operation == "take_all":
+            return _take(table, lambda key: True)
+    raise ValueError(f"Unknown operation '{operation}'")
+
+
+def _serve_connection(connection, table, lock, stopping, address, authkey):
+    """
+    Answer the requests of one client until it disconnects.
+
+    Args:
+        connection: The client connection.
+        table: The shard's HashTable.
+        lock: Lock serializing access to the table.
+        stopping: Event set when the server is shutting down.
+        address: The server address, used to wake up the accept loop.
+        authkey: The server authentication key.
+    """
+    with connection:
+        while True:
+            try:
+                operation, argument = connection.recv()
+            except (EOFError, OSError):
+                return
+            if operation == "shutdown":
+                stopping.set()
+                connection.send((True, None))
+                Client(address, authkey=authkey).close()  # Unblock accept()
+                return
+            try:
+                connection.send((True, _handle(table, lock, operation, argument)))
+            except Exception as error:
+                connection.send((False, error))
+
+
+def serve(address=("127.0.0.1", 0), authkey=None, buckets=1024, ready=None):
+    """
+    Run a shard server until a client asks it to shut down.
+
+    Each client connection is served by its own thread; requests are
+    applied to the shard's HashTable one at a time. Requests are unpickled,
+    which can run arbitrary code, so only authenticated clients are served.
+
+    Args:
+        address: Address to listen on (default: a free localhost TCP port).
+        authkey: Key (non-empty bytes) that clients must present. Required.
+        buckets: Number of buckets of the shard's HashTable (default: 1024).
+        ready: Optional connection on which the actual listening address is
+            sent once the server accepts clients.
+
+    Raises:
+        ValueError: If no authkey is given.
+    """
+    if not authkey:
+        raise ValueError("An authkey is required to serve a shard")
+    table = HashTable(size=buckets)
+    lock = threading.Lock()
+    stopping = threading.Event()
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.send(listener.address)
+            ready.close()
+        while not stopping.is_set():
+            try:
+                connection = listener.accept()
+            except (AuthenticationError, EOFError, OSError):
+                continue  # A client that failed authentication or hung up
+            threading.Thread(target=_serve_connection,
+                             args=(connection, table, lock, stopping, listener.address, authkey),
+                             daemon=True).start()
+
+
+class _Shard:
+    """
+    A connection to one shard server, and its process if it was started here.
+
+    Attributes:
+        name (str): The shard name on the ring.
+        connection: The client connection to the server.
+        process (Process or None): The server process, if started locally.
+    """
+    def __init__(self, name, connection, process=None):
+        """
+        Initialize a shard handle.
+
+        Args:
+            name: The shard name on the ring.
+            connection: The client connection to the server.
+            process: The server process, if started locally.
+        """
+        self.name = name
+        self.connection = connection
+        self.process = process
+
+    def send(self, operation, argument=None):
+        """Send a request without waiting for the reply."""
+        self.connection.send((operation, argument))
+
+    def receive(self):
+        """
+        Wait for the reply to the oldest pending request.
+
+        Returns:
+            The result of the request.
+
+        Raises:
+            Exception: The error raised by the server for the request.
+        """
+        ok, result = self.connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def call(self, operation, argument=None):
+        """
+        Send a request and wait for its reply.
+
+        Returns:
+            The result of the request.
+        """
+        self.send(operation, argument)
+        return self.receive()
+
+    def close(self):
+        """Disconnect, and stop the server process if it was started here."""
+        if self.process is not None:
+            try:
+                self.call("shutdown")
+            except (EOFError, OSError):
+                pass
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.connection.close()
+
+
+class ShardedHashTable:
+    """
+    A hash table partitioned over shard server processes.
+
+    Supports the HashTable operations (`insert`, `get`, `delete`,
+    `contains`) plus the pipelined batches `insert_many` and `get_many`.
+    Shards can be added and removed at any time; only the keys whose owner
+    changes are moved.
+
+    A ShardedHashTable is not thread-safe: share it between threads only
+    with external locking, or give each thread its own client.
+
+    Attributes:
+        ring (ConsistentHashRing): Maps keys to shard names.
+        buckets (int): Buckets of the HashTable of each locally started shard.
+    """
+    def __init__(self, shards=4, virtual_nodes=64, buckets=1024):
+        """
+        Start a sharded hash table with local shard processes.
+
+        Args:
+            shards: Number of shard processes to start (default: 4).
+            virtual_nodes: Points per shard on the hash ring (default: 64).
+            buckets: Buckets of each shard's HashTable (default: 1024).
+
+        Raises:
+            ValueError: If shards or virtual_nodes is not positive.
+        """
+        if shards <= 0:
+            raise ValueError("Shards must be positive")
+        self.ring = ConsistentHashRing(virtual_nodes)
+        self.buckets = buckets
+        self._shards = {}
+        self._authkey = os.urandom(16)
+        self._next_id = 0
+        try:
+            for _ in range(shards):
+                self.add_shard()
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def shards(self):
+        """
+        The names of the shards, in sorted order.
+
+        Returns:
+            list: The shard names.
+        """
+        return sorted(self._shards)
+
+    def _start_shard(self, name):
+        """
+        Start a shard server process and connect to it.
+
+        Args:
+            name: The shard name.
+
+        Returns:
+            _Shard: The connected shard.
+
+        Raises:
+            RuntimeError: If the server doesn't start.
+        """
+        receiver, sender = Pipe(duplex=False)
+        process = Process(target=serve, name=f"ShardedHashTable-{name}", daemon=True,
+                          kwargs={"authkey": self._authkey, "buckets": self.buckets,
+                                  "ready": sender})
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(30):
+                raise RuntimeError(f"Shard '{name}' did not start")
+            address = receiver.recv()
+        except BaseException:
+            process.terminate()
+            process.join()
+            raise
+        finally:
+            receiver.close()
+        return _Shard(name, Client(address, authkey=self._authkey), process)
+
+    def add_shard(self, name=None, address=None, authkey=_LOCAL_AUTHKEY):
+        """
+        Add a shard and move the keys it now owns onto it.
+
+        Args:
+            name: The shard name (default: "shard-<n>").
+            address: Address of an already running `serve()` server. If
+                omitted, a local shard process is started.
+            authkey: Authentication key of that server (default: the key of
+                the local shards). Pass None for a server without one.
+
+        Returns:
+            int: The number of keys moved to the new shard.
+
+        Raises:
+            ValueError: If a shard with that name already exists.
+        """
+        if name is None:
+            while f"shard-{self._next_id}" in self._shards:
+                self._next_id += 1
+            name = f"shard-{self._next_id}"
+        if name in self._shards:
+            raise ValueError(f"Shard '{name}' already exists")
+        if address is None:
+            shard = self._start_shard(name)
+        else:
+            if authkey is _LOCAL_AUTHKEY:
+                authkey = self._authkey
+            shard = _Shard(name, Client(address, authkey=authkey))
+        self._shards[name] = shard
+
+        # Only the arcs taken over by the new shard change owner
+        losers = [(self._shards[owner], arcs) for owner, arcs in self.ring.add_node(name).items()]
+        for loser, arcs in losers:
+            loser.send("take_arcs", arcs)
+        moved = []
+        for loser, _ in losers:
+            moved.extend(loser.receive())
+        if moved:
+            shard.call("insert_many", moved)
+        return len(moved)
+
+    def remove_shard(self, name):
+        """
+        Remove a shard, moving its keys to the remaining shards.
+
+        Args:
+            name: The shard name.
+
+        Returns:
+            int: The number of keys moved off the shard.
+
+        Raises:
+            KeyError: If there is no shard with that name.
+            ValueError: If it is the last shard.
+        """
+        if name not in self._shards:
+            raise KeyError(f"Shard '{name}' not found")
+        if len(self._shards) == 1:
+            raise ValueError("Cannot remove the last shard")
+        shard = self._shards[name]
+        pairs = shard.call("take_all")
+        self.ring.remove_node(name)
+        del self._shards[name]
+        shard.close()
+        self.insert_many(pairs)
+        return len(pairs)
+
+    def _group(self, keys):
+        """
+        Group the positions of keys by the shard owning each key.
+
+        Args:
+            keys: The keys.
+
+        Returns:
+            dict: Shard name -> list of positions in `keys`.
+        """
+        groups = {}
+        node_for_hash = self.ring.node_for_hash
+        for position, key in enumerate(keys):
+            groups.setdefault(node_for_hash(key_hash(key)), []).append(position)
+        return groups
+
+    def insert(self, key, value):
+        """
+        Insert or update a key-value pair.
+
+        Args:
+            key: The key (must be hashable and picklable).
+            value: The value to store (must be picklable).
+        """
+        self._shards[self.ring.node_for(key)].call("insert_many", [(key, value)])
+
+    def insert_many(self, pairs):
+        """
+        Insert or update many key-value pairs in a single round trip.
+
+        Args:
+            pairs: An iterable of (key, value) pairs. Later pairs win over
+                earlier ones with the same key.
+        """
+        pairs = list(pairs)
+        groups = self._group([key for key, _ in pairs])
+        for name, positions in groups.items():
+            self._shards[name].send("insert_many", [pairs[i] for i in positions])
+        for name in groups:
+            self._shards[name].receive()
+
+    def get(self, key):
+        """
+        Retrieve a value by its key.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The value associated with the key.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        [(found, value)] = self._shards[self.ring.node_for(key)].call("get_many", [key])
+        if not found:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def get_many(self, keys, default=None):
+        """
+        Retrieve the values of many keys in a single round trip.
+
+        Args:
+            keys: An iterable of keys.
+            default: Value returned for missing keys (default: None).
+
+        Returns:
+            list: The values, in the order of the keys.
+        """
+        keys = list(keys)
+        groups = self._group(keys)
+        for name, positions in groups.items():
+            self._shards[name].send("get_many", [keys[i] for i in positions])
+        values = [default] * len(keys)
+        for name, positions in groups.items():
+            for i, (found, value) in zip(positions, self._shards[name].receive()):
+                if found:
+                    values[i] = value
+        return values
+
+    def delete(self, key):
+        """
+        Delete a key-value pair.
+
+        Args:
+            key: The key to delete.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        if not self._shards[self.ring.node_for(key)].call("delete", key):
+            raise KeyError(f"Key '{key}' not found")
+
+    def contains(self, key):
+        """
+        Check if a key exists.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            True if the key exists, False otherwise.
+        """
+        [(found, _)] = self._shards[self.ring.node_for(key)].call("get_many", [key])
+        return found
+
+    def shard_sizes(self):
+        """
+        Count the keys held by each shard.
+
+        Returns:
+            dict: Shard name -> number of keys.
+        """
+        for shard in self._shards.values():
+            shard.send("len")
+        return {name: shard.receive() for name, shard in sorted(self._shards.items())}
+
+    def __len__(self):
+        """
+        Allow using len(table).
+
+        Returns:
+            int: The total number of keys.
+        """
+        return sum(self.shard_sizes().values())
+
+    def __str__(self):
+        """
+        Return a string representation of the table.
+
+        Returns:
+            str: The number of keys of each shard.
+        """
+        return f"ShardedHashTable({self.shard_sizes()})"
+
+    def close(self):
+        """Disconnect from all shards and stop the local shard processes."""
+        for shard in self._shards.values():
+            shard.close()
+        self._shards.clear()
+
+    def __enter__(self):
+        """
+        Use the table as a context manager.
+
+        Returns:
+            ShardedHashTable: The table itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the shards when leaving the `with` block."""
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    with ShardedHashTable(shards=3) as table:
+        print("Shards:", table.shards)
+
+        # Single operations: one round trip each
+        table.insert("name", "Alice")
+        table.insert("age", 25)
+        print("\nname:", table.get("name"), "| on shard", table.ring.node_for("name"))
+        print("Contains 'email':", table.contains("email"))
+        table.delete("age")
+        try:
+            table.get("age")
+        except KeyError as e:
+            print("Error:", e)
+
+        # Batches: one request per shard, all shards working at once
+        print("\nInserting 30,000 keys, one call per key vs. pipelined batches:")
+        start = time.perf_counter()
+        for i in range(3000):
+            table.insert(f"single-{i}", i)
+        single = (time.perf_counter() - start) / 3000
+        start = time.perf_counter()
+        table.insert_many((f"user-{i}", i) for i in range(30_000))
+        batched = (time.perf_counter() - start) / 30_000
+        print(f"One call per key: {single * 1e6:.1f} us/key | insert_many: {batched * 1e6:.1f} us/key")
+        print("get_many:", table.get_many(["user-1", "user-2", "missing"]))
+        print("Keys per shard:", table.shard_sizes())
+
+        # Adding a shard only moves the keys of the arcs it takes over
+        total = len(table)
+        moved = table.add_shard()
+        print(f"\nAdded a shard: moved {moved} of {total} keys ({moved / total:.0%})")
+        print("Keys per shard:", table.shard_sizes())
+
+        moved = table.remove_shard("shard-0")
+        print(f"Removed shard-0: moved {moved} keys")
+        print("Keys per shard:", table.shard_sizes())
+        print("All keys still found:",
+              table.get_many(f"user-{i}" for i in range(30_000)) == list(range(30_000)))
@@ -0,0 +1 @@
+"""Hash Table data structure."""
@@ -6,6 +6,18 @@ A linked list is a linear data structure where elements are stored in nodes, and
 points to the next node in the sequence.
 """
 
+import math
+import sys
+from itertools import islice
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+
+
 class Node:
     """
     A Node in a Linked List.
@@ -16,6 +28,10 @@ class Node:
         data: The data stored in the node.
         next: Reference to the next node in the linked list.
     """
+    # Fixed attribute slots instead of a per-instance __dict__, which
+    # cuts the memory used by every node roughly in half.
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         """
         Initialize a new Node.
@@ -27,6 +43,541 @@ class Node:
         self.next = None
 
 
+class NodePool:
+    """
+    Free list of recycled Nodes.
+
+    Nodes removed from a list are kept here (chained through their `next`
+    reference) and handed out again on the next insertion, so workloads that
+    repeatedly add and remove elements stop allocating new nodes.
+    A pool can be shared between several lists. Any node class with `data`
+    and `next` attributes can be pooled, e.g. the linked-list Stack's nodes.
+
+    Attributes:
+        node_class: Class of the nodes created when the pool is empty.
+        max_size: Maximum number of free nodes kept (None means unbounded).
+        size: Number of free nodes currently in the pool.
+        allocated: Number of nodes created because the pool was empty.
+        reused: Number of nodes handed out from the pool.
+    """
+    __slots__ = ('_free', 'node_class', 'max_size', 'size', 'allocated', 'reused')
+
+    def __init__(self, max_size=None, node_class=Node):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size: Maximum number of free nodes to keep (default: unbounded).
+            node_class: Class of the nodes to create (default: Node).
+        """
+        self._free = None
+        self.node_class = node_class
+        self.max_size = max_size
+        self.size = 0
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, data):
+        """
+        Return a node holding `data`, reusing a free node when possible.
+
+        Args:
+            data: The data to store in the node.
+
+        Returns:
+            A node of `node_class` whose `next` reference is None.
+        """
+        node = self._free
+        if node is None:
+            self.allocated += 1
+            return self.node_class(data)
+        self._free = node.next
+        self.size -= 1
+        self.reused += 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node):
+        """
+        Give a node back to the pool.
+
+        The node's data is dropped so the pool doesn't keep it alive.
+        If the pool is full the node is simply discarded.
+
+        Args:
+            node: A node that is no longer linked into any list.
+        """
+        if self.max_size is not None and self.size >= self.max_size:
+            return
+        node.data = None
+        node.next = self._free
+        self._free = node
+        self.size += 1
+
+    def release_chain(self, head):
+        """
+        Give back every node of a chain starting at `head`.
+
+        Args:
+            head: The first node of a chain that is no longer in use.
+        """
+        current = head
+        while current:
+            next_node = current.next
+            self.release(current)
+            current = next_node
+
+    def __len__(self):
+        """
+        Allow using len(pool).
+
+        Returns:
+            int: The number of free nodes in the pool.
+        """
+        return self.size
+
+
+class PositionIndex:
+    """
+    Positional index over the nodes of a LinkedList.
+
+    The list is split into consecutive blocks of about sqrt(n) nodes, and the
+    index stores the first node and the size of every block (square-root
+    decomposition). Reaching position i means skipping whole blocks and then
+    walking inside a single block, so it takes O(sqrt(n)) steps instead of O(n).
+    Blocks are split when they grow too large, merged when they shrink, and
+    the whole index is rebuilt when the list size changes by a factor of four
+    or when there are more than about 2 * n / block_size blocks.
+
+    Attributes:
+        block_size: Target number of nodes per block.
+        length: Number of nodes covered by the index.
+        starts: First node of each block.
+        sizes: Number of nodes in each block.
+    """
+    MIN_BLOCK_SIZE = 16
+
+    def __init__(self, head=None, length=0):
+        """
+        Build an index over an existing chain of nodes.
+
+        Args:
+            head: First node of the chain.
+            length: Number of nodes in the chain.
+        """
+        self.rebuild(head, length)
+
+    def rebuild(self, head, length):
+        """
+        Recompute every block from scratch in O(n).
+
+        Args:
+            head: First node of the chain.
+            length: Number of nodes in the chain.
+        """
+        block_size = max(self.MIN_BLOCK_SIZE, math.isqrt(length))
+        self.block_size = block_size
+        self.length = length
+        self.starts = []
+        self.sizes = []
+
+        current = head
+        for position in range(length):
+            if position % block_size == 0:
+                self.starts.append(current)
+                self.sizes.append(min(block_size, length - position))
+            current = current.next
+
+    def _locate(self, index):
+        """
+        Find the block holding a position.
+
+        Blocks are scanned from whichever end of the list is closer, so
+        positions near the tail (e.g. `append` and `pop`) are found in O(1).
+
+        Args:
+            index: A position in the range [0, length).
+
+        Returns:
+            tuple: (block number, offset of the position inside that block).
+        """
+        sizes = self.sizes
+        if index < self.length // 2:
+            for block, size in enumerate(sizes):
+                if index < size:
+                    return block, index
+                index -= size
+        else:
+            remaining = self.length - index
+            for block in range(len(sizes) - 1, -1, -1):
+                size = sizes[block]
+                if remaining <= size:
+                    return block, size - remaining
+                remaining -= size
+        raise IndexError("Index out of range")
+
+    def node_at(self, index):
+        """
+        Return the node at a position.
+
+        Args:
+            index: A position in the range [0, length).
+
+        Returns:
+            Node: The node at that position.
+        """
+        block, offset = self._locate(index)
+        node = self.starts[block]
+        for _ in range(offset):
+            node = node.next
+        return node
+
+    def inserted(self, index, node):
+        """
+        Record that `node` has been linked into the list at `index`.
+
+        Args:
+            index: The position of the new node.
+            node: The new node.
+        """
+        if self.length == 0:
+            self.starts = [node]
+            self.sizes = [1]
+            self.length = 1
+            return
+        if index == 0:
+            block = 0
+            self.starts[0] = node
+        else:
+            block, _ = self._locate(index - 1)
+        self.sizes[block] += 1
+        self.length += 1
+
+        if self.length > 4 * self.block_size * self.block_size:
+            self.rebuild(self.starts[0], self.length)
+        elif self.sizes[block] >= 2 * self.block_size:
+            self._split(block)
+
+    def removed(self, index, next_node):
+        """
+        Record that the node at `index` has been unlinked from the list.
+
+        Must be called before any other change to the list.
+
+        Args:
+            index: The former position of the removed node.
+            next_node: The node that followed the removed one (or None).
+        """
+        block, offset = self._locate(index)
+        self.sizes[block] -= 1
+        self.length -= 1
+
+        if self.sizes[block] == 0:
+            del self.starts[block]
+            del self.sizes[block]
+        else:
+            if offset == 0:
+                self.starts[block] = next_node
+            following = block + 1
+            if (following < len(self.sizes)
+                    and self.sizes[block] + self.sizes[following] <= self.block_size):
+                self.sizes[block] += self.sizes[following]
+                del self.starts[following]
+                del self.sizes[following]
+
+        if (self.block_size > self.MIN_BLOCK_SIZE
+                and 4 * self.length < self.block_size * self.block_size):
+            self.rebuild(self.starts[0] if self.starts else None, self.length)
+
+    def extended(self, first, count):
+        """
+        Record that a chain of `count` nodes has been linked after the tail.
+
+        The last block is filled up to `block_size` first, so repeated small
+        extends do not leave a trail of tiny blocks.
+
+        Args:
+            first: The first node of the new chain.
+            count: Number of nodes in the chain.
+        """
+        block_size = self.block_size
+        node = first
+        position = 0
+        if self.sizes and self.sizes[-1] < block_size:
+            position = min(block_size - self.sizes[-1], count)
+            self.sizes[-1] += position
+            if position < count:
+                for _ in range(position):
+                    node = node.next
+        while position < count:
+            size = min(block_size, count - position)
+            self.starts.append(node)
+            self.sizes.append(size)
+            position += size
+            if position < count:
+                for _ in range(size):
+                    node = node.next
+        self.length += count
+        self._rebalance()
+
+    def adopted(self, starts, sizes):
+        """
+        Record that the blocks of another index have been linked after the tail.
+
+        The nodes are not walked: each block is kept as it is, or merged into
+        the previous block when both fit in `block_size`.
+
+        Args:
+            starts: First node of each adopted block.
+            sizes: Number of nodes in each adopted block.
+        """
+        block_size = self.block_size
+        oversized = False
+        for start, size in zip(starts, sizes):
+            if self.sizes and self.sizes[-1] + size <= block_size:
+                self.sizes[-1] += size
+            else:
+                self.starts.append(start)
+                self.sizes.append(size)
+                oversized = oversized or size >= 2 * block_size
+            self.length += size
+        if oversized:
+            self.rebuild(self.starts[0], self.length)
+        else:
+            self._rebalance()
+
+    def _rebalance(self):
+        """Rebuild the index if the list outgrew the blocks or they got fragmented."""
+        block_size = self.block_size
+        if (self.length > 4 * block_size * block_size
+                or len(self.sizes) > 2 * self.length // block_size + 1):
+            self.rebuild(self.starts[0], self.length)
+
+    def _split(self, block):
+        """
+        Split an oversized block in two.
+
+        Args:
+            block: The block number to split.
+        """
+        node = self.starts[block]
+        for _ in range(self.block_size):
+            node = node.next
+        self.starts.insert(block + 1, node)
+        self.sizes.insert(block + 1, self.sizes[block] - self.block_size)
+        self.sizes[block] = self.block_size
+
+    def clear(self):
+        """Forget every block."""
+        self.starts = []
+        self.sizes = []
+        self.length = 0
+
+
+class Cursor:
+    """
+    A finger pointing at one position of a LinkedList.
+
+    The cursor remembers the node it points to, so moving forward by k
+    positions costs O(k) and reading or writing the current element costs O(1).
+    This makes sequential or nearby accesses cheap compared to repeated
+    `lookup` calls, which always start over from the head (or the index).
+    If the list is modified by something other than this cursor, the cursor
+    finds its position again on the next access.
+
+    Attributes:
+        position: The index the cursor currently points at.
+    """
+    def __init__(self, linked_list, index=0):
+        """
+        Create a cursor at `index`.
+
+        Args:
+            linked_list: The LinkedList to walk.
+            index: Starting position (0-based).
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._list = linked_list
+        self._node = None
+        self._version = None
+        self.position = 0
+        self.move_to(index)
+
+    def _sync(self):
+        """Find the current position again if the list changed underneath."""
+        if self._version != self._list._version:
+            self.move_to(self.position)
+
+    def move_to(self, index):
+        """
+        Move the cursor to a position.
+
+        Moves forward walk from the current node; moves backward (or long
+        jumps when the list has a PositionIndex) restart from the index or head.
+
+        Args:
+            index: The target position (0-based).
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        linked_list = self._list
+        if index < 0 or index >= linked_list.length:
+            raise IndexError("Index out of range")
+
+        distance = index - self.position
+        if (self._version == linked_list._version and self._node is not None
+                and distance >= 0
+                and (linked_list.index is None
+                     or distance <= linked_list.index.block_size)):
+            node = self._node
+            for _ in range(distance):
+                node = node.next
+        else:
+            node = linked_list._node_at(index)
+
+        self._node = node
+        self._version = linked_list._version
+        self.position = index
+
+    def advance(self, steps=1):
+        """
+        Move the cursor forward.
+
+        Args:
+            steps: Number of positions to move (default: 1).
+
+        Raises:
+            IndexError: If the new position is out of range.
+        """
+        self.move_to(self.position + steps)
+
+    def has_next(self):
+        """
+        Check if there is an element after the cursor.
+
+        Returns:
+            bool: True if the cursor is not on the last element.
+        """
+        return self.position + 1 < self._list.length
+
+    def get(self):
+        """
+        Return the element under the cursor.
+
+        Returns:
+            The data at the cursor position.
+        """
+        self._sync()
+        return self._node.data
+
+    def set(self, value):
+        """
+        Replace the element under the cursor.
+
+        Args:
+            value: The new data for the current position.
+        """
+        self._sync()
+        self._node.data = value
+
+    def insert_after(self, data):
+        """
+        Insert an element right after the cursor in O(1) link time.
+
+        The cursor stays on its current element.
+
+        Args:
+            data: The data to insert.
+        """
+        self._sync()
+        linked_list = self._list
+        node = self._node
+        new_node = linked_list._new_node(data)
+        new_node.next = node.next
+        node.next = new_node
+        if linked_list.tail is node:
+            linked_list.tail = new_node
+        linked_list.length += 1
+        if linked_list.index is not None:
+            linked_list.index.inserted(self.position + 1, new_node)
+        linked_list._version += 1
+        self._version = linked_list._version
+
+
+def _identity(value):
+    """Return the value itself, the default sort key."""
+    return value
+
+
+def _cut_after(node, count):
+    """
+    Detach the chain after the first `count` nodes starting at `node`.
+
+    Args:
+        node: First node of the chain (may be None).
+        count: Number of nodes to keep in the first part.
+
+    Returns:
+        The first node of the detached remainder, or None.
+    """
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_chains(left, right, key, reverse):
+    """
+    Stably merge two sorted chains of nodes by relinking them.
+
+    Args:
+        left: Head of the first sorted chain (may be None).
+        right: Head of the second sorted chain (may be None).
+        key: Function extracting the comparison key from an element.
+        reverse: True if the chains are sorted in descending order.
+
+    Returns:
+        tuple: (head, tail) of the merged chain.
+    """
+    head = tail = None
+    while left and right:
+        # Take from the right chain only when strictly smaller (or larger
+        # when descending), so equal elements keep their original order.
+        if reverse:
+            take_right = key(right.data) > key(left.data)
+        else:
+            take_right = key(right.data) < key(left.data)
+        if take_right:
+            node, right = right, right.next
+        else:
+            node, left = left, left.next
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+
+    rest = left or right
+    if tail is None:
+        head = rest
+    else:
+        tail.next = rest
+    if rest is not None:
+        while rest.next:
+            rest = rest.next
+        tail = rest
+    return head, tail
+
+
 class LinkedList:
     """
     Singly Linked List implementation.
@@ -38,12 +589,102 @@ class LinkedList:
         head: Reference to the first node in the list.
         tail: Reference to the last node in the list.
         length: Number of nodes in the list.
+        pool: Optional NodePool used to recycle removed nodes.
+        index: Optional PositionIndex used for O(sqrt(n)) positional access.
     """
-    def __init__(self):
-        """Initialize an empty Linked List."""
+    def __init__(self, pool=None, indexed=False):
+        """
+        Initialize an empty Linked List.
+
+        Args:
+            pool: Optional NodePool. When given, nodes removed by `pop`,
+                `pop_first` and `clear` are recycled by later insertions.
+            indexed: If True, maintain a PositionIndex so that `lookup`,
+                `insert` and `pop` take O(sqrt(n)) instead of O(n).
+        """
         self.head = None
         self.tail = None
         self.length = 0
+        self.pool = pool
+        self.index = PositionIndex() if indexed else None
+        self._version = 0  # Bumped on every structural change, used by Cursor
+
+    def build_index(self):
+        """Create (or rebuild) the positional index for the current contents."""
+        self.index = PositionIndex(self.head, self.length)
+
+    def drop_index(self):
+        """Stop maintaining the positional index."""
+        self.index = None
+
+    def _node_at(self, index):
+        """
+        Return the node at a valid position.
+
+        Args:
+            index: A position in the range [0, length).
+
+        Returns:
+            Node: The node at that position.
+        """
+        if self.index is not None:
+            return self.index.node_at(index)
+        return self._walk(self.head, index)
+
+    @staticmethod
+    def _walk(node, steps):
+        """
+        Follow `next` references a number of times.
+
+        Positional access on an unindexed list spends its time here;
+        `_accelerated.LinkedList` overrides it with the C `walk`.
+
+        Args:
+            node: The node to start from.
+            steps: Number of references to follow (at most the nodes left).
+
+        Returns:
+            Node: The node `steps` positions after `node`.
+        """
+        for _ in range(steps):
+            node = node.next
+        return node
+
+    def cursor(self, index=0):
+        """
+        Return a Cursor positioned at `index`.
+
+        Args:
+            index: Starting position (0-based).
+
+        Returns:
+            Cursor: A finger for fast sequential access.
+        """
+        return Cursor(self, index)
+
+    def _new_node(self, data):
+        """
+        Create a node, taking it from the pool when one is configured.
+
+        Args:
+            data: The data to store in the node.
+
+        Returns:
+            Node: The new node.
+        """
+        if self.pool is None:
+            return Node(data)
+        return self.pool.acquire(data)
+
+    def _free_node(self, node):
+        """
+        Give a removed node back to the pool, if any.
+
+        Args:
+            node: The node that was unlinked from the list.
+        """
+        if self.pool is not None:
+            self.pool.release(node)
 
     def _init_first_node(self, new_node):
         """
@@ -63,13 +704,16 @@ class LinkedList:
         Args:
             data: The data to store in the new node.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data)
         if self.head is None:
             self._init_first_node(new_node)
         else:
             self.tail.next = new_node
             self.tail = new_node
             self.length += 1
+        if self.index is not None:
+            self.index.inserted(self.length - 1, new_node)
+        self._version += 1
 
     def prepend(self, data):
         """
@@ -78,26 +722,23 @@ class LinkedList:
         Args:
             data: The data to store in the new node.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data)
         if self.head is None:
             self._init_first_node(new_node)
         else:
             new_node.next = self.head
             self.head = new_node
             self.length += 1
+        if self.index is not None:
+            self.index.inserted(0, new_node)
+        self._version += 1
 
     def print_list(self):
         """Print the list in list format: [a, b, c]"""
-        elements = []
-        current = self.head
-
-        if self.head == None:
+        if self.head is None:
             print('Empty List')
         else:
-            while current:
-                elements.append(current.data)
-                current = current.next
-            print(elements)
+            print(list(self))
 
     def insert(self, index, data):
         """
@@ -117,10 +758,8 @@ class LinkedList:
         if index == self.length:
             return self.append(data)
 
-        new_node = Node(data)
-        current = self.head
-        for _ in range(index - 1):
-            current = current.next
+        new_node = self._new_node(data)
+        current = self._node_at(index - 1)
 
         # New node points to the node that was originally after current
         new_node.next = current.next
@@ -128,6 +767,9 @@ class LinkedList:
         # Current node now points to the new node
         current.next = new_node
         self.length += 1
+        if self.index is not None:
+            self.index.inserted(index, new_node)
+        self._version += 1
 
     def lookup(self, index):
         """
@@ -144,10 +786,7 @@ class LinkedList:
         """
         if index < 0 or index >= self.length:
             raise IndexError("Index out of range")
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        return current.data
+        return self._node_at(index).data
 
     def __len__(self):
         """
@@ -165,12 +804,108 @@ class LinkedList:
         Returns:
             str: String representation of the list.
         """
-        elements = []
+        return str(list(self))
+
+    def __iter__(self):
+        """
+        Lazily yield the elements from head to tail.
+
+        Yields:
+            The data of each node, in order.
+        """
         current = self.head
         while current:
-            elements.append(current.data)
+            yield current.data
             current = current.next
-        return str(elements)
+
+    def __reversed__(self):
+        """
+        Lazily yield the elements from tail to head.
+
+        A singly linked list can't walk backwards, so the list is cut into
+        segments of about sqrt(n) nodes (reusing the PositionIndex blocks when
+        available) and each segment is reversed on its own. This takes O(n)
+        time and only O(sqrt(n)) extra memory instead of copying the list.
+
+        Yields:
+            The data of each node, in reverse order.
+        """
+        if self.index is not None:
+            starts = list(self.index.starts)
+            sizes = list(self.index.sizes)
+        else:
+            step = max(1, math.isqrt(self.length))
+            starts = []
+            sizes = []
+            current = self.head
+            position = 0
+            while current:
+                if position % step == 0:
+                    starts.append(current)
+                    sizes.append(min(step, self.length - position))
+                current = current.next
+                position += 1
+
+        for block in range(len(starts) - 1, -1, -1):
+            segment = []
+            current = starts[block]
+            for _ in range(sizes[block]):
+                segment.append(current.data)
+                current = current.next
+            yield from reversed(segment)
+
+    def __getitem__(self, key):
+        """
+        Allow indexing and slicing with list[i] and list[start:stop:step].
+
+        Slices don't copy the list: they return a lazy iterator over the
+        selected elements.
+
+        Args:
+            key: An integer position (negative values count from the end)
+                or a slice.
+
+        Returns:
+            The element at the position, or an iterator for a slice.
+
+        Raises:
+            IndexError: If an integer position is out of range.
+            TypeError: If the key is neither an integer nor a slice.
+        """
+        if isinstance(key, slice):
+            return self._iter_slice(*key.indices(self.length))
+        if not isinstance(key, int):
+            raise TypeError("List indices must be integers or slices")
+        if key < 0:
+            key += self.length
+        return self.lookup(key)
+
+    def _iter_slice(self, start, stop, step):
+        """
+        Yield the elements selected by normalized slice bounds.
+
+        Args:
+            start: First position (as returned by slice.indices).
+            stop: Position to stop before.
+            step: Distance between positions (non-zero).
+
+        Yields:
+            The selected elements.
+        """
+        count = len(range(start, stop, step))
+        if count == 0:
+            return
+        if step < 0:
+            skip = self.length - 1 - start
+            yield from islice(reversed(self), skip, skip + count * -step, -step)
+            return
+
+        current = self._node_at(start)
+        for i in range(count):
+            yield current.data
+            if i + 1 < count:
+                for _ in range(step):
+                    current = current.next
 
     def find(self, value):
         """
@@ -203,20 +938,25 @@ class LinkedList:
         """
         if self.head is None:
             raise IndexError("List is empty")
+        self._version += 1
+        if self.index is not None:
+            self.index.removed(self.length - 1, None)
         if self.length == 1:
-            value = self.head.data
+            removed = self.head
+            value = removed.data
             self.head = None
             self.tail = None
             self.length = 0
+            self._free_node(removed)
             return value
 
-        current = self.head
-        while current.next != self.tail:
-            current = current.next
-        value = self.tail.data
+        current = self._node_at(self.length - 2)
+        removed = self.tail
+        value = removed.data
         current.next = None
         self.tail = current
         self.length -= 1
+        self._free_node(removed)
         return value
 
     def pop_first(self):
@@ -231,18 +971,28 @@ class LinkedList:
         """
         if self.head is None:
             raise IndexError("List is empty")
-        value = self.head.data
-        self.head = self.head.next
+        removed = self.head
+        value = removed.data
+        if self.index is not None:
+            self.index.removed(0, removed.next)
+        self.head = removed.next
         self.length -= 1
+        self._version += 1
         if self.length == 0:
             self.tail = None
+        self._free_node(removed)
         return value
 
     def clear(self):
         """Remove all elements from the list."""
+        if self.pool is not None:
+            self.pool.release_chain(self.head)
         self.head = None
         self.tail = None
         self.length = 0
+        if self.index is not None:
+            self.index.clear()
+        self._version += 1
 
     def reverse(self):
         """Reverse the order of nodes in the list."""
@@ -255,6 +1005,9 @@ class LinkedList:
             prev = current             # Move prev to current node
             current = next_node        # Move current to original next node
         self.head = prev               # The last visited node becomes the new head
+        if self.index is not None:
+            self.index.rebuild(self.head, self.length)
+        self._version += 1
 
     def to_list(self):
         """
@@ -263,12 +1016,7 @@ class LinkedList:
         Returns:
             list: A Python list containing all elements.
         """
-        elements = []
-        current = self.head
-        while current:
-            elements.append(current.data)
-            current = current.next
-        return elements
+        return list(self)
 
     def is_empty(self):
         """
@@ -282,12 +1030,238 @@ class LinkedList:
     def extend(self, iterable):
         """
         Add all elements from an iterable to the end of the list.
+
+        The iterable (which may be a generator) is consumed once. The new
+        nodes are chained together first and attached with a single tail
+        update, so the list is left unchanged if the iterable raises.
         
         Args:
             iterable: An iterable containing elements to add.
         """
+        first = last = None
+        count = 0
         for item in iterable:
-            self.append(item)
+            node = self._new_node(item)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if count == 0:
+            return
+
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.length += count
+        if self.index is not None:
+            self.index.extended(first, count)
+        self._version += 1
+
+    def _take_nodes(self, other):
+        """
+        Detach every node from another list.
+
+        Args:
+            other: The LinkedList to empty.
+
+        Returns:
+            tuple: (head, tail, length) of the detached chain.
+
+        Raises:
+            ValueError: If other is this list.
+        """
+        if other is self:
+            raise ValueError("Cannot combine a list with itself")
+        chain = (other.head, other.tail, other.length)
+        other.head = None
+        other.tail = None
+        other.length = 0
+        if other.index is not None:
+            other.index.clear()
+        other._version += 1
+        return chain
+
+    def concat(self, other):
+        """
+        Move all nodes of another list to the end of this one in O(1).
+
+        No element is copied: the other list's nodes are relinked and the
+        other list is left empty.
+
+        Args:
+            other: The LinkedList to append.
+
+        Raises:
+            ValueError: If other is this list.
+        """
+        other_index = other.index
+        blocks = None
+        if other_index is not None:
+            blocks = (list(other_index.starts), list(other_index.sizes))
+        head, tail, length = self._take_nodes(other)
+        if head is None:
+            return
+
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self.length += length
+
+        if self.index is not None:
+            if blocks is not None and blocks[0]:
+                # Reuse the other list's blocks instead of walking its nodes
+                self.index.adopted(*blocks)
+            else:
+                self.index.extended(head, length)
+        self._version += 1
+
+    def splice(self, index, other):
+        """
+        Move all nodes of another list into this one at a given position.
+
+        The nodes are relinked, not copied, and the other list is left empty.
+        Linking costs O(1) once the position has been reached.
+
+        Args:
+            index: The position where the other list's first element will end up.
+            other: The LinkedList to move.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If other is this list.
+        """
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+        if index == self.length:
+            return self.concat(other)
+
+        head, tail, length = self._take_nodes(other)
+        if head is None:
+            return
+        if index == 0:
+            tail.next = self.head
+            self.head = head
+        else:
+            prev = self._node_at(index - 1)
+            tail.next = prev.next
+            prev.next = head
+        self.length += length
+
+        if self.index is not None:
+            self.index.rebuild(self.head, self.length)
+        self._version += 1
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge another sorted list into this sorted list in O(n + m).
+
+        Both lists must already be sorted with the same key and order.
+        Nodes are relinked without allocating, the merge is stable
+        (this list's elements come first among equals), and the other
+        list is left empty.
+
+        Args:
+            other: The sorted LinkedList to merge in.
+            key: Optional function extracting a comparison key.
+            reverse: True if the lists are sorted in descending order.
+
+        Raises:
+            ValueError: If other is this list.
+        """
+        if key is None:
+            key = _identity
+        other_head, _, other_length = self._take_nodes(other)
+        self.head, self.tail = _merge_chains(self.head, other_head, key, reverse)
+        self.length += other_length
+        if self.index is not None:
+            self.index.rebuild(self.head, self.length)
+        self._version += 1
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place with a bottom-up merge sort.
+
+        Runs of width 1, 2, 4, ... are merged by relinking nodes, so the sort
+        takes O(n log n) time, is stable and needs only O(1) extra memory
+        (no auxiliary array or recursion).
+
+        Args:
+            key: Optional function extracting a comparison key.
+            reverse: If True, sort in descending order.
+        """
+        if self.length < 2:
+            return
+        if key is None:
+            key = _identity
+
+        head = self.head
+        tail = None
+        width = 1
+        while width < self.length:
+            new_head = tail = None
+            current = head
+            while current:
+                left = current
+                right = _cut_after(left, width)
+                current = _cut_after(right, width)
+                merged_head, merged_tail = _merge_chains(left, right, key, reverse)
+                if tail is None:
+                    new_head = merged_head
+                else:
+                    tail.next = merged_head
+                tail = merged_tail
+            head = new_head
+            width *= 2
+
+        self.head = head
+        self.tail = tail
+        if self.index is not None:
+            self.index.rebuild(self.head, self.length)
+        self._version += 1
+
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the list, counting each object once.
+
+        Args:
+            deep: If True, include everything the values reference
+                (default: True).
+
+        Returns:
+            MemoryUsage: Overhead bytes (the list object, its nodes, the
+                positional index, and the pool with its free nodes) and
+                payload bytes (the values).
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        sizeof = usage.sizeof
+        payload_sizeof = usage.payload_sizeof
+        usage.overhead["object"] = sizeof(self) + sizeof(vars(self))
+        nodes = values = 0
+        current = self.head
+        while current is not None:
+            nodes += sizeof(current)
+            values += payload_sizeof(current.data)
+            current = current.next
+        usage.overhead["nodes"] = nodes
+        if self.index is not None:
+            index = self.index
+            usage.overhead["index"] = (sizeof(index) + sizeof(index.starts) + sizeof(index.sizes)
+                                       + sum(map(sizeof, index.sizes)))
+        if self.pool is not None:
+            pool = sizeof(self.pool)
+            current = self.pool._free
+            while current is not None:
+                pool += sizeof(current)
+                current = current.next
+            usage.overhead["pool"] = pool
+        usage.payload["values"] = values
+        return usage
 
 
 # Example usage
@@ -349,4 +1323,32 @@ if __name__ == "__main__":
     print("\nStep 10: Clearing the list")
     linked_list.clear()
     print(f"After clearing: {linked_list}")
-    print(f"Is empty: {linked_list.is_empty()}")
\ No newline at end of file
+    print(f"Is empty: {linked_list.is_empty()}")
+    
+    # Indexed list and cursor
+    print("\nStep 11: Positional index and cursor")
+    indexed_list = LinkedList(indexed=True)
+    indexed_list.extend(range(100))
+    print(f"Element at index 75 (indexed lookup): {indexed_list.lookup(75)}")
+    cursor = indexed_list.cursor(10)
+    cursor.advance(2)
+    print(f"Cursor at position {cursor.position}: {cursor.get()}")
+    
+    # Iteration and streaming operations
+    print("\nStep 12: Iteration and streaming operations")
+    numbers = LinkedList()
+    numbers.extend(x * x % 17 for x in range(10))
+    print(f"Numbers: {numbers}")
+    print(f"Reversed: {list(reversed(numbers))}")
+    print(f"Every other element: {list(numbers[::2])}")
+    numbers.sort()
+    others = LinkedList()
+    others.extend([0, 5, 20])
+    numbers.merge_sorted(others)
+    print(f"Sorted and merged with [0, 5, 20]: {numbers}")
+
+    # Measure the nodes, not just the values
+    print("\nStep 13: Memory usage")
+    words = LinkedList(indexed=True)
+    words.extend(f"word{i}" for i in range(1000))
+    print(words.memory_usage())
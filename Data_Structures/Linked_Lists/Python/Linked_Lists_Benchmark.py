@@ -0,0 +1,160 @@
+"""
+Linked List Memory and Allocation Benchmark
+
+Compares the memory used by `__slots__` nodes against plain nodes with a
+per-instance `__dict__`, the number of node allocations performed by a
+list with and without a NodePool on a fill/drain churn workload, and the
+memory and traversal speed of LinkedList against UnrolledLinkedList.
+
+Usage:
+    python Linked_Lists_Benchmark.py [--size N] [--rounds R]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+from Data_Structures import LinkedList, LinkedListNode, NodePool, UnrolledLinkedList  # noqa: E402
+
+
+class DictNode:
+    """A Node without __slots__, used as the baseline for memory measurements."""
+    def __init__(self, data):
+        """
+        Initialize a new DictNode.
+
+        Args:
+            data: The data to store in the node.
+        """
+        self.data = data
+        self.next = None
+
+
+def measure_chain_memory(node_class, size):
+    """
+    Build a chain of `size` nodes and measure the memory it takes.
+
+    Args:
+        node_class: The node class to instantiate.
+        size: Number of nodes in the chain.
+
+    Returns:
+        int: Bytes allocated while building the chain (payload excluded,
+        every node stores the same small integer).
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    head = tail = node_class(0)
+    for _ in range(size - 1):
+        node = node_class(0)
+        tail.next = node
+        tail = node
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Free the chain iteratively to avoid deep recursion in deallocation
+    while head:
+        head.next, head = None, head.next
+    return current - start
+
+
+def run_churn(linked_list, size, rounds):
+    """
+    Fill and drain a list repeatedly.
+
+    Each round appends `size` elements, removes half of them with `pop_first`
+    and drops the rest with `clear`.
+
+    Args:
+        linked_list: The LinkedList to exercise.
+        size: Number of elements appended per round.
+        rounds: Number of rounds.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(size):
+            linked_list.append(i)
+        for _ in range(size // 2):
+            linked_list.pop_first()
+        linked_list.clear()
+    return time.perf_counter() - start
+
+
+def compare_traversal(list_class, size):
+    """
+    Build a list of `size` integers and time full traversals over it.
+
+    Args:
+        list_class: LinkedList or UnrolledLinkedList.
+        size: Number of elements.
+
+    Returns:
+        tuple: (bytes used by the structure, seconds for a missing `find`,
+        seconds for `to_list`).
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    linked_list = list_class()
+    linked_list.extend(range(size))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Integers below 256 are cached objects, larger ones count as payload
+    payload = sum(int.__sizeof__(i) for i in range(256, size))
+    memory = current - start - payload
+
+    start = time.perf_counter()
+    linked_list.find(-1)
+    find_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    linked_list.to_list()
+    to_list_time = time.perf_counter() - start
+
+    linked_list.clear()
+    return memory, find_time, to_list_time
+
+
+def main():
+    """Run the benchmark and print a short report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000_000,
+                        help="number of elements (default: 10,000,000)")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="fill/drain rounds for the churn test (default: 3)")
+    args = parser.parse_args()
+    size, rounds = args.size, args.rounds
+
+    print(f"Memory for a chain of {size:,} nodes")
+    plain = measure_chain_memory(DictNode, size)
+    slotted = measure_chain_memory(LinkedListNode, size)
+    print(f"  plain nodes:     {plain / 2**20:10.1f} MiB ({plain / size:.1f} bytes/node)")
+    print(f"  __slots__ nodes: {slotted / 2**20:10.1f} MiB ({slotted / size:.1f} bytes/node)")
+    print(f"  saving:          {100 * (1 - slotted / plain):9.1f} %")
+
+    print(f"\nChurn: {rounds} rounds of {size:,} appends, pop_first and clear")
+    elapsed = run_churn(LinkedList(), size, rounds)
+    print(f"  no pool:   {elapsed:8.2f} s, {size * rounds:,} node allocations")
+
+    pool = NodePool()
+    elapsed = run_churn(LinkedList(pool=pool), size, rounds)
+    print(f"  with pool: {elapsed:8.2f} s, {pool.allocated:,} node allocations "
+          f"({pool.reused:,} reused)")
+
+    print(f"\nTraversal over {size:,} elements")
+    for list_class in (LinkedList, UnrolledLinkedList):
+        memory, find_time, to_list_time = compare_traversal(list_class, size)
+        print(f"  {list_class.__name__:<20} {memory / size:6.1f} bytes/element, "
+              f"find (miss) {find_time:6.3f} s, to_list {to_list_time:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
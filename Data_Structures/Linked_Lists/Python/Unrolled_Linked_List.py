@@ -0,0 +1,503 @@
+"""
+Unrolled Linked List Implementation
+
+This module provides an Unrolled Linked List: a linked list where every node
+stores a small array of elements instead of a single one.
+Walking the list visits one node per block of elements, which means fewer
+pointer hops, better cache locality and far less per-element memory overhead
+than a classic linked list, while insertion and deletion still only touch one
+or two nodes. Nodes are linked in both directions, so the tail can be
+unlinked and the list walked backwards without a scan from the head.
+"""
+
+from itertools import islice
+
+
+class UnrolledNode:
+    """
+    A Node in an Unrolled Linked List.
+
+    Attributes:
+        elements (list): The elements stored in this node (at most `capacity`).
+        prev: Reference to the previous node in the list.
+        next: Reference to the next node in the list.
+    """
+    __slots__ = ('elements', 'prev', 'next')
+
+    def __init__(self, elements=None):
+        """
+        Initialize a new UnrolledNode.
+
+        Args:
+            elements: Optional list of initial elements.
+        """
+        self.elements = elements if elements is not None else []
+        self.prev = None
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Unrolled Linked List implementation.
+
+    Exposes the element API of `LinkedList`, including iteration, `reversed`,
+    negative indices and lazy slicing. Each node holds up to `capacity`
+    elements, and every node except the tail holds at least `capacity // 2`:
+    - a full node is split in half before inserting into it (a full tail
+      gets a new node instead, so appends fill nodes completely);
+    - a node that drops below half capacity after a removal borrows from or
+      merges with its successor, and empty nodes are unlinked.
+
+    Attributes:
+        head: Reference to the first node in the list.
+        tail: Reference to the last node in the list.
+        length: Number of elements in the list.
+        capacity: Maximum number of elements per node.
+    """
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty Unrolled Linked List.
+
+        Args:
+            capacity: Maximum number of elements per node (default: 64).
+
+        Raises:
+            ValueError: If capacity is smaller than 2.
+        """
+        if capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.capacity = capacity
+
+    def _locate(self, index):
+        """
+        Find the node holding a position, walking from the closer end.
+
+        Args:
+            index: A position in the range [0, length).
+
+        Returns:
+            tuple: (node, offset inside the node).
+        """
+        if index < self.length // 2:
+            node = self.head
+            while index >= len(node.elements):
+                index -= len(node.elements)
+                node = node.next
+            return node, index
+        remaining = self.length - index
+        node = self.tail
+        while remaining > len(node.elements):
+            remaining -= len(node.elements)
+            node = node.prev
+        return node, len(node.elements) - remaining
+
+    def _link_after(self, node, new_node):
+        """
+        Link a new node right after `node`.
+
+        Args:
+            node: A node of the list.
+            new_node: The node to link.
+        """
+        new_node.prev = node
+        new_node.next = node.next
+        if node.next is None:
+            self.tail = new_node
+        else:
+            node.next.prev = new_node
+        node.next = new_node
+
+    def _unlink(self, node):
+        """
+        Remove a node from the chain.
+
+        Args:
+            node: A node of the list.
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+    def _split(self, node):
+        """
+        Move the second half of a full node into a new node placed after it.
+
+        Args:
+            node: The node to split.
+        """
+        half = len(node.elements) // 2
+        new_node = UnrolledNode(node.elements[half:])
+        del node.elements[half:]
+        self._link_after(node, new_node)
+
+    def _rebalance(self, node):
+        """
+        Restore the half-full invariant after removing from `node`.
+
+        An empty node is unlinked. Any other node except the tail that fell
+        below half capacity merges with its successor when both fit in one
+        node, and borrows from it otherwise.
+
+        Args:
+            node: The node an element was just removed from.
+        """
+        count = len(node.elements)
+        if count == 0:
+            self._unlink(node)
+            return
+        following = node.next
+        minimum = self.capacity // 2
+        if following is None or count >= minimum:
+            return
+        if count + len(following.elements) <= self.capacity:
+            # Merge the successor into this node
+            node.elements.extend(following.elements)
+            self._unlink(following)
+        else:
+            # Borrow enough elements to make this node half full again
+            needed = minimum - count
+            node.elements.extend(following.elements[:needed])
+            del following.elements[:needed]
+
+    def append(self, data):
+        """
+        Add an element to the end of the list.
+
+        Args:
+            data: The element to add.
+        """
+        tail = self.tail
+        if tail is None:
+            self.head = self.tail = UnrolledNode([data])
+        elif len(tail.elements) < self.capacity:
+            tail.elements.append(data)
+        else:
+            # The full tail becomes an inner node, which is allowed
+            self._link_after(tail, UnrolledNode([data]))
+        self.length += 1
+
+    def prepend(self, data):
+        """
+        Add an element to the beginning of the list.
+
+        Args:
+            data: The element to add.
+        """
+        head = self.head
+        if head is None:
+            self.head = self.tail = UnrolledNode([data])
+        else:
+            if len(head.elements) >= self.capacity:
+                self._split(head)  # Both halves stay at least half full
+            head.elements.insert(0, data)
+        self.length += 1
+
+    def print_list(self):
+        """Print the list in list format: [a, b, c]"""
+        if self.head is None:
+            print('Empty List')
+        else:
+            print(self.to_list())
+
+    def insert(self, index, data):
+        """
+        Insert an element at a specific position.
+
+        Args:
+            index: The position to insert the element (0-based).
+            data: The element to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+        if index == 0:
+            return self.prepend(data)
+        if index == self.length:
+            return self.append(data)
+
+        node, offset = self._locate(index)
+        if len(node.elements) >= self.capacity:
+            self._split(node)
+            if offset > len(node.elements):
+                offset -= len(node.elements)
+                node = node.next
+        node.elements.insert(offset, data)
+        self.length += 1
+
+    def lookup(self, index):
+        """
+        Return the value at a specific position.
+
+        Args:
+            index: The position to look up (0-based).
+
+        Returns:
+            The element at the specified position.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+        node, offset = self._locate(index)
+        return node.elements[offset]
+
+    def __len__(self):
+        """
+        Allow using len(list).
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.length
+
+    def __repr__(self):
+        """
+        Official representation of the list, allows using print().
+
+        Returns:
+            str: String representation of the list.
+        """
+        return str(self.to_list())
+
+    def __iter__(self):
+        """
+        Lazily yield the elements from head to tail.
+
+        Yields:
+            The elements, in order.
+        """
+        node = self.head
+        while node:
+            yield from node.elements
+            node = node.next
+
+    def __reversed__(self):
+        """
+        Lazily yield the elements from tail to head, following `prev` links.
+
+        Yields:
+            The elements, in reverse order.
+        """
+        node = self.tail
+        while node:
+            yield from reversed(node.elements)
+            node = node.prev
+
+    def __getitem__(self, key):
+        """
+        Allow indexing and slicing with list[i] and list[start:stop:step].
+
+        Slices don't copy the list: they return a lazy iterator over the
+        selected elements.
+
+        Args:
+            key: An integer position (negative values count from the end)
+                or a slice.
+
+        Returns:
+            The element at the position, or an iterator for a slice.
+
+        Raises:
+            IndexError: If an integer position is out of range.
+            TypeError: If the key is neither an integer nor a slice.
+        """
+        if isinstance(key, slice):
+            return self._iter_slice(*key.indices(self.length))
+        if not isinstance(key, int):
+            raise TypeError("List indices must be integers or slices")
+        if key < 0:
+            key += self.length
+        return self.lookup(key)
+
+    def _iter_slice(self, start, stop, step):
+        """
+        Yield the elements selected by normalized slice bounds.
+
+        Args:
+            start: First position (as returned by slice.indices).
+            stop: Position to stop before.
+            step: Distance between positions (non-zero).
+
+        Yields:
+            The selected elements.
+        """
+        count = len(range(start, stop, step))
+        if count == 0:
+            return
+        node, offset = self._locate(start)
+        span = (count - 1) * abs(step) + 1  # Elements walked, first to last
+        if step > 0:
+            elements = self._iter_from(node, offset)
+        else:
+            elements = self._iter_back_from(node, offset)
+        yield from islice(elements, 0, span, abs(step))
+
+    def _iter_from(self, node, offset):
+        """Yield the elements from a node and offset towards the tail."""
+        yield from islice(node.elements, offset, None)
+        node = node.next
+        while node:
+            yield from node.elements
+            node = node.next
+
+    def _iter_back_from(self, node, offset):
+        """Yield the elements from a node and offset towards the head."""
+        yield from reversed(node.elements[:offset + 1])
+        node = node.prev
+        while node:
+            yield from reversed(node.elements)
+            node = node.prev
+
+    def find(self, value):
+        """
+        Find a value and return the index of its first occurrence.
+
+        Elements are compared with ==, like LinkedList.find.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            int: The index of the first occurrence, or -1 if not found.
+        """
+        base = 0
+        node = self.head
+        while node:
+            for offset, element in enumerate(node.elements):
+                if element == value:
+                    return base + offset
+            base += len(node.elements)
+            node = node.next
+        return -1
+
+    def pop(self):
+        """
+        Remove and return the last element.
+
+        Returns:
+            The removed element.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.head is None:
+            raise IndexError("List is empty")
+        tail = self.tail
+        value = tail.elements.pop()
+        self.length -= 1
+        if not tail.elements:
+            self._unlink(tail)
+        return value
+
+    def pop_first(self):
+        """
+        Remove and return the first element.
+
+        Returns:
+            The removed element.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.head is None:
+            raise IndexError("List is empty")
+        head = self.head
+        value = head.elements.pop(0)
+        self.length -= 1
+        self._rebalance(head)
+        return value
+
+    def clear(self):
+        """Remove all elements from the list."""
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def reverse(self):
+        """Reverse the order of the elements in the list."""
+        node = self.head
+        while node:
+            node.elements.reverse()
+            node.prev, node.next = node.next, node.prev
+            node = node.prev
+        self.head, self.tail = self.tail, self.head
+        if self.head is not None:
+            self._rebalance(self.head)  # The old tail may be under-full
+
+    def to_list(self):
+        """
+        Convert to a Python list.
+
+        Returns:
+            list: A Python list containing all elements.
+        """
+        elements = []
+        node = self.head
+        while node:
+            elements.extend(node.elements)
+            node = node.next
+        return elements
+
+    def is_empty(self):
+        """
+        Check if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.length == 0
+
+    def extend(self, iterable):
+        """
+        Add all elements from an iterable to the end of the list.
+
+        Args:
+            iterable: An iterable containing elements to add.
+        """
+        for item in iterable:
+            self.append(item)
+
+
+# Example usage
+if __name__ == "__main__":
+    # Create a list with small nodes so the blocks are visible
+    print("Step 1: Creating an unrolled linked list with node capacity 4")
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(10))
+    print(f"List: {unrolled}")
+
+    # Show the node layout
+    print("\nStep 2: Node layout")
+    node = unrolled.head
+    while node:
+        print(f"  {node.elements}")
+        node = node.next
+
+    # Insert into a full node, which splits it
+    print("\nStep 3: Inserting 99 at index 2 (splits the first node)")
+    unrolled.insert(2, 99)
+    node = unrolled.head
+    while node:
+        print(f"  {node.elements}")
+        node = node.next
+
+    # Access and search
+    print("\nStep 4: Accessing and searching")
+    print(f"Element at index 5: {unrolled.lookup(5)}")
+    print(f"Index of 7: {unrolled.find(7)}")
+
+    # Remove elements, which merges under-full nodes
+    print("\nStep 5: Removing elements")
+    print(f"Popped first: {unrolled.pop_first()}, popped last: {unrolled.pop()}")
+    print(f"List: {unrolled}, length: {len(unrolled)}")
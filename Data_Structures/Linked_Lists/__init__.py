@@ -0,0 +1 @@
+"""Linked List data structures."""
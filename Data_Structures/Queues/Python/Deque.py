@@ -0,0 +1,413 @@
+"""
+Ring Buffer Deque Implementation
+
+This module provides a double-ended queue stored in a circular buffer.
+The buffer size is always a power of two, so a logical position maps to a
+slot with a single bitwise AND (`(head + i) & mask`) instead of a modulo,
+and elements never move when the front advances.
+
+A Deque can grow on demand, or have a fixed capacity. A fixed-capacity deque
+either rejects new elements when full or, with `overwrite=True`, discards the
+oldest ones, which keeps a sliding window of the most recent values (e.g. the
+last N telemetry samples).
+"""
+
+MIN_BUFFER_SIZE = 8
+
+
+def _buffer_size(count):
+    """
+    Smallest power of two that holds `count` elements.
+
+    Args:
+        count: Number of elements.
+
+    Returns:
+        int: The buffer size (at least MIN_BUFFER_SIZE).
+    """
+    return max(MIN_BUFFER_SIZE, 1 << (count - 1).bit_length())
+
+
+class Deque:
+    """
+    Double-ended queue implementation using a circular buffer.
+
+    Used with `push_back` and `pop_front` it is a First-In-First-Out (FIFO)
+    queue. Pushing and popping at either end is O(1) (amortized when the
+    buffer has to grow), and elements are stored in list slots rather than
+    one node object each.
+
+    Attributes:
+        capacity: Maximum number of elements, or None if the deque grows.
+        overwrite: Whether a full fixed-capacity deque discards its oldest
+            elements instead of raising OverflowError.
+        size: Number of elements in the deque.
+    """
+    def __init__(self, values=(), capacity=None, overwrite=False):
+        """
+        Initialize a Deque.
+
+        Args:
+            values: Optional iterable of initial elements, front first.
+            capacity: Optional maximum number of elements. None (the default)
+                lets the deque grow without limit.
+            overwrite: When the deque has a capacity and is full, discard
+                the element at the opposite end instead of raising
+                OverflowError (default: False).
+
+        Raises:
+            ValueError: If capacity is not positive, or overwrite is set
+                without a capacity.
+            OverflowError: If more initial values than capacity are given
+                and overwrite is False.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if overwrite and capacity is None:
+            raise ValueError("Overwrite requires a capacity")
+        self.capacity = capacity
+        self.overwrite = overwrite
+        self.size = 0
+        self._buffer = [None] * _buffer_size(capacity or MIN_BUFFER_SIZE)
+        self._mask = len(self._buffer) - 1
+        self._head = 0  # Slot of the front element
+        if values:
+            self.extend(values)
+
+    def is_empty(self):
+        """
+        Check if the deque is empty.
+
+        Returns:
+            bool: True if the deque is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def is_full(self):
+        """
+        Check if a fixed-capacity deque is full.
+
+        Returns:
+            bool: True if the deque has a capacity and holds that many
+                elements, False otherwise.
+        """
+        return self.size == self.capacity
+
+    def get_size(self):
+        """
+        Get the number of elements in the deque.
+
+        Returns:
+            int: The number of elements in the deque.
+        """
+        return self.size
+
+    def __len__(self):
+        """
+        Allow using len(deque).
+
+        Returns:
+            int: The number of elements in the deque.
+        """
+        return self.size
+
+    def _resize(self, buffer_size):
+        """
+        Move the elements to a new buffer, front first at slot 0.
+
+        Args:
+            buffer_size: Size of the new buffer (a power of two).
+        """
+        old = self._buffer
+        head = self._head
+        end = min(head + self.size, len(old))
+        items = old[head:end] + old[:self.size - (end - head)]
+        self._buffer = items + [None] * (buffer_size - self.size)
+        self._mask = buffer_size - 1
+        self._head = 0
+
+    def _make_room(self, count):
+        """
+        Ensure `count` more elements fit, growing or failing as configured.
+
+        Args:
+            count: Number of elements about to be added.
+
+        Returns:
+            int: How many elements must be discarded from the opposite end
+                first (only non-zero for an overwriting deque).
+
+        Raises:
+            OverflowError: If a fixed-capacity deque without overwrite
+                doesn't have room.
+        """
+        needed = self.size + count
+        if self.capacity is None:
+            if needed > len(self._buffer):
+                self._resize(_buffer_size(needed))
+            return 0
+        if needed <= self.capacity:
+            return 0
+        if not self.overwrite:
+            raise OverflowError('Deque is full')
+        return needed - self.capacity
+
+    def push_back(self, item):
+        """
+        Add an element at the back of the deque.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            OverflowError: If the deque is full and doesn't overwrite.
+
+        Time Complexity:
+            O(1) amortized.
+        """
+        if self._make_room(1):
+            self.pop_front()
+        self._buffer[(self._head + self.size) & self._mask] = item
+        self.size += 1
+
+    def push_front(self, item):
+        """
+        Add an element at the front of the deque.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            OverflowError: If the deque is full and doesn't overwrite.
+
+        Time Complexity:
+            O(1) amortized.
+        """
+        if self._make_room(1):
+            self.pop_back()
+        self._head = (self._head - 1) & self._mask
+        self._buffer[self._head] = item
+        self.size += 1
+
+    def pop_front(self):
+        """
+        Remove and return the element at the front of the deque.
+
+        Returns:
+            The front element.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time Complexity:
+            O(1).
+        """
+        if self.size == 0:
+            raise IndexError('Deque is empty')
+        buffer = self._buffer
+        item = buffer[self._head]
+        buffer[self._head] = None  # Don't keep a reference to the popped item
+        self._head = (self._head + 1) & self._mask
+        self.size -= 1
+        return item
+
+    def pop_back(self):
+        """
+        Remove and return the element at the back of the deque.
+
+        Returns:
+            The back element.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time Complexity:
+            O(1).
+        """
+        if self.size == 0:
+            raise IndexError('Deque is empty')
+        self.size -= 1
+        slot = (self._head + self.size) & self._mask
+        buffer = self._buffer
+        item = buffer[slot]
+        buffer[slot] = None
+        return item
+
+    def peek_front(self):
+        """
+        View the front element without removing it.
+
+        Returns:
+            The front element, or None if the deque is empty.
+        """
+        if self.size == 0:
+            return None
+        return self._buffer[self._head]
+
+    def peek_back(self):
+        """
+        View the back element without removing it.
+
+        Returns:
+            The back element, or None if the deque is empty.
+        """
+        if self.size == 0:
+            return None
+        return self._buffer[(self._head + self.size - 1) & self._mask]
+
+    def extend(self, values):
+        """
+        Add several elements at the back, in order.
+
+        The elements are copied into the buffer with at most two slice
+        assignments (one on each side of the wrap-around point). An
+        overwriting deque keeps only the newest `capacity` elements.
+
+        Args:
+            values: Iterable of elements, front first.
+
+        Raises:
+            OverflowError: If the elements don't fit in a fixed-capacity
+                deque without overwrite. The deque is left unchanged.
+
+        Time Complexity:
+            O(k) for k new elements.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if self.overwrite and len(values) > self.capacity:
+            values = values[-self.capacity:]
+        count = len(values)
+        if count == 0:
+            return
+        discard = self._make_room(count)
+        if discard:
+            self.drain(discard)
+
+        buffer = self._buffer
+        start = (self._head + self.size) & self._mask
+        first = min(count, len(buffer) - start)
+        buffer[start:start + first] = values[:first]
+        buffer[:count - first] = values[first:]
+        self.size += count
+
+    def drain(self, n=None):
+        """
+        Remove and return up to `n` elements from the front.
+
+        Args:
+            n: Maximum number of elements to remove, or None for all of them.
+
+        Returns:
+            list: The removed elements, front first (empty if the deque is).
+
+        Raises:
+            ValueError: If n is negative.
+
+        Time Complexity:
+            O(k) for k removed elements.
+        """
+        if n is None or n > self.size:
+            n = self.size
+        elif n < 0:
+            raise ValueError("Count must be non-negative")
+        buffer = self._buffer
+        head = self._head
+        first = min(n, len(buffer) - head)
+        items = buffer[head:head + first] + buffer[:n - first]
+        buffer[head:head + first] = [None] * first
+        buffer[:n - first] = [None] * (n - first)
+        self._head = (head + n) & self._mask
+        self.size -= n
+        return items
+
+    def clear(self):
+        """Remove all elements from the deque."""
+        self.drain()
+
+    def __getitem__(self, index):
+        """
+        Get the element at a position, counted from the front.
+
+        Args:
+            index: The position; negative values count from the back.
+
+        Returns:
+            The element at that position.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity:
+            O(1).
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Deque index out of range')
+        return self._buffer[(self._head + index) & self._mask]
+
+    def __iter__(self):
+        """
+        Yield the elements from front to back.
+
+        Yields:
+            The deque elements, front first.
+        """
+        buffer = self._buffer
+        mask = self._mask
+        head = self._head
+        for i in range(self.size):
+            yield buffer[(head + i) & mask]
+
+    def __str__(self):
+        """
+        Return a string representation of the deque.
+
+        Returns:
+            str: A string showing the deque elements from front to back.
+        """
+        if self.is_empty():
+            return "Empty Deque"
+        return "FRONT <- " + " <- ".join(map(str, self)) + " <- BACK"
+
+
+# Example usage
+if __name__ == "__main__":
+    # Use the deque as a FIFO queue
+    queue = Deque()
+    print("New deque:", queue)
+
+    print("\nEnqueueing elements:")
+    for item in ["apple", "banana", "cherry"]:
+        queue.push_back(item)
+    print("Deque after pushing 3 items:", queue)
+
+    print("\nDequeued:", queue.pop_front())
+    print("Deque after pop_front:", queue)
+
+    # Both ends
+    queue.push_front("avocado")
+    print("\nAfter push_front('avocado'):", queue)
+    print("Front:", queue.peek_front(), "| Back:", queue.peek_back())
+    print("Popped from back:", queue.pop_back())
+
+    # Bulk operations
+    queue.extend(["date", "elderberry", "fig", "grape"])
+    print("\nAfter extend:", queue)
+    print("Drained 3:", queue.drain(3))
+    print("Deque after drain:", queue)
+
+    # Fixed-capacity window that keeps the newest values
+    window = Deque(capacity=4, overwrite=True)
+    for sample in range(10):
+        window.push_back(sample)
+    print("\nLast 4 samples of 10:", list(window))
+
+    # Fixed capacity without overwrite rejects new elements
+    bounded = Deque(capacity=2)
+    bounded.extend([1, 2])
+    try:
+        bounded.push_back(3)
+    except OverflowError as error:
+        print("Bounded deque:", error)
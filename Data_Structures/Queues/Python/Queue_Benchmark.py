@@ -0,0 +1,94 @@
+"""
+Queue Benchmark
+
+Streams elements through a FIFO queue built on the ring-buffer Deque and on
+LinkedList (append + pop_first, one node allocation per element), with
+collections.deque as a reference. Each round enqueues a batch and dequeues
+it again, either one element at a time or with the Deque's bulk operations.
+
+Usage:
+    python Queue_Benchmark.py [--size N] [--batch B]
+"""
+
+import argparse
+import collections
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+from Data_Structures import Deque, LinkedList  # noqa: E402
+
+
+def run_single(push, pop, size, batch):
+    """
+    Enqueue and dequeue `size` elements one at a time, `batch` at a time.
+
+    Args:
+        push: Function adding an element at the back.
+        pop: Function removing the element at the front.
+        size: Total number of elements.
+        batch: Elements queued before they are dequeued again.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    start = time.perf_counter()
+    for offset in range(0, size, batch):
+        for i in range(offset, offset + batch):
+            push(i)
+        for _ in range(batch):
+            pop()
+    return time.perf_counter() - start
+
+
+def run_bulk(queue, size, batch):
+    """
+    Stream `size` elements through a Deque with extend and drain.
+
+    Args:
+        queue: An empty Deque.
+        size: Total number of elements.
+        batch: Elements moved per extend and drain call.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    start = time.perf_counter()
+    for offset in range(0, size, batch):
+        queue.extend(range(offset, offset + batch))
+        queue.drain(batch)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=2_000_000,
+                        help="number of elements (default: 2,000,000)")
+    parser.add_argument("--batch", type=int, default=1000,
+                        help="elements queued per round (default: 1000)")
+    args = parser.parse_args()
+    size = args.size - args.size % args.batch
+
+    linked_list = LinkedList()
+    deque = Deque()
+    reference = collections.deque()
+    results = [
+        ("LinkedList (append/pop_first)",
+         run_single(linked_list.append, linked_list.pop_first, size, args.batch)),
+        ("Deque (push_back/pop_front)",
+         run_single(deque.push_back, deque.pop_front, size, args.batch)),
+        ("Deque (extend/drain)", run_bulk(Deque(), size, args.batch)),
+        ("collections.deque", run_single(reference.append, reference.popleft, size, args.batch)),
+    ]
+
+    print(f"{'queue':<32} {'seconds':>8} {'M elements/s':>13}")
+    for name, seconds in results:
+        print(f"{name:<32} {seconds:>8.2f} {size / seconds / 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Queue data structures."""
@@ -4,6 +4,15 @@ Stack Implementation using Array
 This module provides a Stack implementation using a Python list (dynamic array).
 """
 
+import sys
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+
 
 class Stack:
     """
@@ -75,6 +84,28 @@ class Stack:
         """
         return len(self.stack)
 
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the stack, counting each object once.
+
+        The list's size includes the spare slots it over-allocates for
+        future pushes.
+
+        Args:
+            deep: If True, include everything the items reference
+                (default: True).
+
+        Returns:
+            MemoryUsage: Overhead bytes (the stack object and its list) and
+                payload bytes (the items).
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        usage.overhead["object"] = usage.sizeof(self) + usage.sizeof(vars(self))
+        usage.overhead["list"] = usage.sizeof(self.stack)
+        payload_sizeof = usage.payload_sizeof
+        usage.payload["items"] = sum(payload_sizeof(item) for item in self.stack)
+        return usage
+
     def __str__(self):
         """
         Return a string representation of the stack.
@@ -117,3 +148,9 @@ if __name__ == "__main__":
     # Pop last element
     print("\nPopping last element:", stack.pop())
     print("Is stack empty?", stack.is_empty())
+
+    # Measure the list and the items
+    for word in ["apple", "banana", "cherry"]:
+        stack.push(word)
+    print("\nMemory usage:")
+    print(stack.memory_usage())
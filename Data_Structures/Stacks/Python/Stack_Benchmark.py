@@ -0,0 +1,90 @@
+"""
+Stack Benchmark
+
+Pushes and pops a large number of elements through each stack implementation
+and reports throughput and the worst single-push latency, which exposes the
+reallocation-and-copy pauses of list-backed growth. The garbage collector is
+disabled while measuring so its pauses don't hide the growth pauses.
+
+Usage:
+    python Stack_Benchmark.py [--size N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+from Data_Structures import ArrayStack, LinkedListStack, SegmentedStack, TypedStack  # noqa: E402
+
+
+def measure(stack, size):
+    """
+    Push then pop `size` elements, timing every push individually.
+
+    Args:
+        stack: An empty stack instance.
+        size: Number of elements.
+
+    Returns:
+        tuple: (push seconds, pop seconds, worst single push in seconds).
+    """
+    clock = time.perf_counter
+    push = stack.push
+    worst = 0.0
+    start = clock()
+    for i in range(size):
+        before = clock()
+        push(i)
+        elapsed = clock() - before
+        if elapsed > worst:
+            worst = elapsed
+    push_time = clock() - start
+
+    pop = stack.pop
+    start = clock()
+    for _ in range(size):
+        pop()
+    pop_time = clock() - start
+    return push_time, pop_time, worst
+
+
+def main():
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=5_000_000,
+                        help="number of elements (default: 5,000,000)")
+    args = parser.parse_args()
+
+    print(f"{'stack':<18} {'push s':>8} {'pop s':>8} {'worst push ms':>14}")
+    for name, stack in (("Stack_Array", ArrayStack()),
+                        ("Stack_LinkedList", LinkedListStack()),
+                        ("SegmentedStack", SegmentedStack()),
+                        ("TypedStack", TypedStack('q'))):
+        gc.disable()
+        try:
+            push_time, pop_time, worst = measure(stack, args.size)
+        finally:
+            gc.enable()
+        print(f"{name:<18} {push_time:>8.2f} {pop_time:>8.2f} {worst * 1000:>14.3f}")
+
+    # Bulk transfer on the typed stack
+    stack = TypedStack('q')
+    start = time.perf_counter()
+    stack.push_many(range(args.size))
+    push_time = time.perf_counter() - start
+    memory = stack.get_size() * stack.stack.itemsize
+    start = time.perf_counter()
+    while stack.get_size() >= 1024:
+        stack.pop_many(1024)
+    pop_time = time.perf_counter() - start
+    print(f"{'TypedStack (bulk)':<18} {push_time:>8.2f} {pop_time:>8.2f} "
+          f"{'':>14} {memory / 2**20:.1f} MiB of element storage")
+
+
+if __name__ == "__main__":
+    main()
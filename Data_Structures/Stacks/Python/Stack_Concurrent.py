@@ -0,0 +1,536 @@
+"""
+Concurrent Stack Implementation
+
+This module provides stacks that can be shared between threads or asyncio tasks:
+- ConcurrentStack: a thread-safe, optionally bounded stack with blocking and
+  timeout `push`/`pop`, batch operations and work-stealing from the bottom.
+- AsyncStack: the same API for asyncio coroutines.
+
+Elements are kept in a `collections.deque`, so both the top (owner side) and
+the bottom (thief side) can be accessed in O(1).
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class ConcurrentStack:
+    """
+    Thread-safe Stack with optional bounded capacity.
+
+    Every operation takes a single lock, including the batch operations
+    `push_many` and `pop_many`, which move many elements per acquisition.
+    In CPython a true lock-free stack isn't possible from pure Python, so
+    batching is the main tool for reducing contention.
+
+    Work-stealing: the owning thread pushes and pops at the top (LIFO), while
+    idle threads can `steal` the oldest elements from the bottom, so owner
+    and thieves work on opposite ends of the stack.
+
+    Attributes:
+        capacity: Maximum number of elements (None means unbounded).
+    """
+    def __init__(self, capacity=None):
+        """
+        Initialize an empty ConcurrentStack.
+
+        Args:
+            capacity: Maximum number of elements (default: unbounded).
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._batch_waiters = 0  # push_many calls waiting for room
+
+    def _wait_for(self, condition, predicate, block, timeout):
+        """
+        Wait on a condition until the predicate holds. Lock must be held.
+
+        Args:
+            condition: The Condition to wait on.
+            predicate: Function returning True when the caller can proceed.
+            block: If False, don't wait at all.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            bool: True if the predicate holds, False on timeout.
+        """
+        if predicate():
+            return True
+        if not block:
+            return False
+        if timeout is None:
+            while not predicate():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def _has_room(self, count):
+        """Return True if `count` more elements fit. Lock must be held."""
+        return self.capacity is None or len(self._items) + count <= self.capacity
+
+    def _wake_producers(self, freed):
+        """
+        Wake the producers that can use `freed` new slots. Lock must be held.
+
+        One waiting push is woken per slot. A waiting push_many may need more
+        slots than were freed, and waking it alone could leave a push that
+        fits asleep, so all producers are woken while one is waiting.
+
+        Args:
+            freed: Number of elements just removed.
+        """
+        if self._batch_waiters:
+            self._not_full.notify_all()
+        else:
+            self._not_full.notify(freed)
+
+    def is_empty(self):
+        """
+        Check if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return len(self._items) == 0
+
+    def get_size(self):
+        """
+        Get the number of elements in the stack.
+
+        Returns:
+            int: The number of elements in the stack.
+        """
+        return len(self._items)
+
+    def push(self, item, block=True, timeout=None):
+        """
+        Add an element to the top of the stack.
+
+        Args:
+            item: The item to add to the stack.
+            block: If True, wait for free space when the stack is full.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Raises:
+            OverflowError: If the stack is still full when giving up.
+        """
+        with self._not_full:
+            if not self._wait_for(self._not_full, lambda: self._has_room(1), block, timeout):
+                raise OverflowError('Stack is full')
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def push_many(self, items, block=True, timeout=None):
+        """
+        Push several elements with a single lock acquisition.
+
+        The batch is pushed all at once (the last item ends up on top),
+        waiting until there is room for the whole batch.
+
+        Args:
+            items: An iterable of items to push.
+            block: If True, wait for free space when the stack is full.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Raises:
+            ValueError: If the batch is larger than the stack capacity.
+            OverflowError: If there is still not enough room when giving up.
+        """
+        items = list(items)
+        if self.capacity is not None and len(items) > self.capacity:
+            raise ValueError("Batch is larger than the stack capacity")
+        if not items:
+            return
+        with self._not_full:
+            self._batch_waiters += 1
+            try:
+                has_room = self._wait_for(self._not_full,
+                                          lambda: self._has_room(len(items)),
+                                          block, timeout)
+            finally:
+                self._batch_waiters -= 1
+            if not has_room:
+                raise OverflowError('Stack is full')
+            self._items.extend(items)
+            self._not_empty.notify(len(items))
+
+    def pop(self, block=True, timeout=None):
+        """
+        Remove and return the top element from the stack.
+
+        Args:
+            block: If True, wait for an element when the stack is empty.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            The item from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is still empty when giving up.
+        """
+        with self._not_empty:
+            if not self._wait_for(self._not_empty, lambda: self._items, block, timeout):
+                raise IndexError('Stack is empty')
+            item = self._items.pop()
+            self._wake_producers(1)
+            return item
+
+    def pop_many(self, n, block=True, timeout=None):
+        """
+        Pop up to `n` elements with a single lock acquisition.
+
+        Waits until at least one element is available, then returns as many
+        as are present, up to `n`. Returns an empty list right away if `n`
+        is not positive.
+
+        Args:
+            n: Maximum number of elements to pop.
+            block: If True, wait for an element when the stack is empty.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            list: The popped items, top of the stack first.
+
+        Raises:
+            IndexError: If the stack is still empty when giving up.
+        """
+        if n <= 0:
+            return []
+        with self._not_empty:
+            if not self._wait_for(self._not_empty, lambda: self._items, block, timeout):
+                raise IndexError('Stack is empty')
+            items = self._items
+            count = min(n, len(items))
+            popped = [items.pop() for _ in range(count)]
+            self._wake_producers(count)
+            return popped
+
+    def steal(self, n=1):
+        """
+        Take up to `n` of the oldest elements from the bottom without waiting.
+
+        Intended for idle worker threads in a work-stealing scheduler.
+
+        Args:
+            n: Maximum number of elements to take (default: 1).
+
+        Returns:
+            list: The stolen items, oldest first (empty if the stack is empty).
+        """
+        with self._lock:
+            items = self._items
+            count = min(n, len(items))
+            stolen = [items.popleft() for _ in range(count)]
+            if count:
+                self._wake_producers(count)
+            return stolen
+
+    def peek(self):
+        """
+        View the top element without removing it.
+
+        Returns:
+            The item at the top of the stack, or None if the stack is empty.
+        """
+        with self._lock:
+            if not self._items:
+                return None
+            return self._items[-1]
+
+    def __str__(self):
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            str: A string showing the stack elements from top to bottom.
+        """
+        with self._lock:
+            if not self._items:
+                return "Empty Stack"
+            return "TOP -> " + " -> ".join(map(str, reversed(self._items))) + " -> None"
+
+
+class AsyncStack:
+    """
+    asyncio version of ConcurrentStack.
+
+    Must be used from a single event loop. Waiting coroutines are woken up
+    through asyncio.Condition objects instead of blocking a thread. They are
+    created inside the running loop on first use, so a stack can be built
+    before the loop starts.
+
+    Attributes:
+        capacity: Maximum number of elements (None means unbounded).
+    """
+    def __init__(self, capacity=None):
+        """
+        Initialize an empty AsyncStack.
+
+        Args:
+            capacity: Maximum number of elements (default: unbounded).
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._items = deque()
+        self._not_empty = None  # Conditions are created inside the event loop
+        self._not_full = None
+        self._batch_waiters = 0  # push_many calls waiting for room
+
+    def _conditions(self):
+        """
+        Return the (not_empty, not_full) conditions, creating them on first use.
+
+        Before Python 3.10, asyncio locks bind to the event loop current when
+        they are created, so they can't be created in __init__.
+
+        Returns:
+            tuple: The two asyncio.Condition objects, sharing one lock.
+        """
+        if self._not_empty is None:
+            lock = asyncio.Lock()
+            self._not_empty = asyncio.Condition(lock)
+            self._not_full = asyncio.Condition(lock)
+        return self._not_empty, self._not_full
+
+    def _has_room(self, count):
+        """Return True if `count` more elements fit."""
+        return self.capacity is None or len(self._items) + count <= self.capacity
+
+    def _wake_producers(self, freed):
+        """
+        Wake the producers that can use `freed` new slots. Lock must be held.
+
+        Works like ConcurrentStack._wake_producers.
+
+        Args:
+            freed: Number of elements just removed.
+        """
+        if self._batch_waiters:
+            self._not_full.notify_all()
+        else:
+            self._not_full.notify(freed)
+
+    async def _wait_for(self, condition, predicate, timeout):
+        """
+        Wait on a condition until the predicate holds. Lock must be held.
+
+        Args:
+            condition: The asyncio.Condition to wait on.
+            predicate: Function returning True when the caller can proceed.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            bool: True if the predicate holds, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def is_empty(self):
+        """
+        Check if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return len(self._items) == 0
+
+    def get_size(self):
+        """
+        Get the number of elements in the stack.
+
+        Returns:
+            int: The number of elements in the stack.
+        """
+        return len(self._items)
+
+    async def push(self, item, timeout=None):
+        """
+        Add an element to the top, waiting while the stack is full.
+
+        Args:
+            item: The item to add to the stack.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Raises:
+            OverflowError: If the stack is still full after the timeout.
+        """
+        not_empty, not_full = self._conditions()
+        async with not_full:
+            if not await self._wait_for(not_full, lambda: self._has_room(1), timeout):
+                raise OverflowError('Stack is full')
+            self._items.append(item)
+            not_empty.notify()
+
+    async def push_many(self, items, timeout=None):
+        """
+        Push several elements at once, waiting until the whole batch fits.
+
+        Args:
+            items: An iterable of items to push.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Raises:
+            ValueError: If the batch is larger than the stack capacity.
+            OverflowError: If there is still not enough room after the timeout.
+        """
+        items = list(items)
+        if self.capacity is not None and len(items) > self.capacity:
+            raise ValueError("Batch is larger than the stack capacity")
+        if not items:
+            return
+        not_empty, not_full = self._conditions()
+        async with not_full:
+            self._batch_waiters += 1
+            try:
+                has_room = await self._wait_for(not_full,
+                                                lambda: self._has_room(len(items)),
+                                                timeout)
+            finally:
+                self._batch_waiters -= 1
+            if not has_room:
+                raise OverflowError('Stack is full')
+            self._items.extend(items)
+            not_empty.notify(len(items))
+
+    async def pop(self, timeout=None):
+        """
+        Remove and return the top element, waiting while the stack is empty.
+
+        Args:
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            The item from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is still empty after the timeout.
+        """
+        not_empty, _ = self._conditions()
+        async with not_empty:
+            if not await self._wait_for(not_empty, lambda: self._items, timeout):
+                raise IndexError('Stack is empty')
+            item = self._items.pop()
+            self._wake_producers(1)
+            return item
+
+    async def pop_many(self, n, timeout=None):
+        """
+        Pop up to `n` elements once at least one is available.
+
+        Returns an empty list right away if `n` is not positive.
+
+        Args:
+            n: Maximum number of elements to pop.
+            timeout: Maximum seconds to wait (None means forever).
+
+        Returns:
+            list: The popped items, top of the stack first.
+
+        Raises:
+            IndexError: If the stack is still empty after the timeout.
+        """
+        if n <= 0:
+            return []
+        not_empty, _ = self._conditions()
+        async with not_empty:
+            if not await self._wait_for(not_empty, lambda: self._items, timeout):
+                raise IndexError('Stack is empty')
+            items = self._items
+            count = min(n, len(items))
+            popped = [items.pop() for _ in range(count)]
+            self._wake_producers(count)
+            return popped
+
+    def peek(self):
+        """
+        View the top element without removing it.
+
+        Returns:
+            The item at the top of the stack, or None if the stack is empty.
+        """
+        if not self._items:
+            return None
+        return self._items[-1]
+
+    def __str__(self):
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            str: A string showing the stack elements from top to bottom.
+        """
+        if not self._items:
+            return "Empty Stack"
+        return "TOP -> " + " -> ".join(map(str, reversed(self._items))) + " -> None"
+
+
+# Example usage
+if __name__ == "__main__":
+    # Producer/consumer threads sharing a bounded stack
+    print("Step 1: Threads sharing a bounded ConcurrentStack (capacity 4)")
+    stack = ConcurrentStack(capacity=4)
+    results = []
+
+    def producer():
+        for i in range(10):
+            stack.push(i)  # Blocks while the stack is full
+
+    def consumer():
+        for _ in range(10):
+            results.append(stack.pop())  # Blocks while the stack is empty
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"Consumed {len(results)} items: {sorted(results)}")
+
+    # Batch operations and timeouts
+    print("\nStep 2: Batch operations and timeouts")
+    stack.push_many(["a", "b", "c"])
+    print(f"After push_many: {stack}")
+    print(f"pop_many(2): {stack.pop_many(2)}")
+    print(f"steal(): {stack.steal()}")
+    try:
+        stack.pop(timeout=0.1)
+    except IndexError as e:
+        print(f"pop with timeout on empty stack: {e}")
+
+    # asyncio variant
+    print("\nStep 3: AsyncStack")
+
+    async def main():
+        async_stack = AsyncStack(capacity=2)
+        consumer_task = asyncio.create_task(async_stack.pop_many(5))
+        await async_stack.push_many([1, 2])
+        print(f"Async pop_many: {await consumer_task}")
+        try:
+            await async_stack.pop(timeout=0.1)
+        except IndexError as e:
+            print(f"Async pop with timeout on empty stack: {e}")
+
+    asyncio.run(main())
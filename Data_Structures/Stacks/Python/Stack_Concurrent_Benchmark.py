@@ -0,0 +1,104 @@
+"""
+Concurrent Stack Contention Benchmark
+
+Runs producer and consumer threads against a shared ConcurrentStack and
+reports throughput for different thread counts, comparing single-element
+`push`/`pop` against batched `push_many`/`pop_many`.
+
+Usage:
+    python Stack_Concurrent_Benchmark.py [--ops N] [--batch B] [--capacity C]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+from Data_Structures import ConcurrentStack  # noqa: E402
+
+
+def run(threads, ops, batch, capacity):
+    """
+    Move `ops` elements through a shared stack.
+
+    Half of the threads produce and half consume (at least one of each).
+
+    Args:
+        threads: Total number of threads.
+        ops: Total number of elements pushed (and popped).
+        batch: Elements per call (1 means plain push/pop).
+        capacity: Stack capacity (None means unbounded).
+
+    Returns:
+        float: Throughput in elements per second.
+    """
+    stack = ConcurrentStack(capacity=capacity)
+    producers = max(1, threads // 2)
+    consumers = max(1, threads - producers)
+    per_producer = ops // producers
+    total = per_producer * producers
+    consumed = [0]
+    consumed_lock = threading.Lock()
+
+    def produce():
+        if batch == 1:
+            for i in range(per_producer):
+                stack.push(i)
+        else:
+            chunk = list(range(batch))
+            for _ in range(per_producer // batch):
+                stack.push_many(chunk)
+            for i in range(per_producer % batch):
+                stack.push(i)
+
+    def consume():
+        while True:
+            with consumed_lock:
+                if consumed[0] >= total:
+                    return
+            try:
+                if batch == 1:
+                    stack.pop(timeout=0.05)
+                    taken = 1
+                else:
+                    taken = len(stack.pop_many(batch, timeout=0.05))
+            except IndexError:
+                continue
+            with consumed_lock:
+                consumed[0] += taken
+
+    workers = [threading.Thread(target=produce) for _ in range(producers)]
+    workers += [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=200_000,
+                        help="elements moved per run (default: 200,000)")
+    parser.add_argument("--batch", type=int, default=64,
+                        help="batch size for push_many/pop_many (default: 64)")
+    parser.add_argument("--capacity", type=int, default=1024,
+                        help="stack capacity, 0 for unbounded (default: 1024)")
+    args = parser.parse_args()
+    capacity = args.capacity or None
+
+    print(f"{'threads':>8} {'push/pop ops/s':>16} {'batched ops/s':>16}")
+    for threads in (2, 4, 8, 16):
+        single = run(threads, args.ops, 1, capacity)
+        batched = run(threads, args.ops, args.batch, capacity)
+        print(f"{threads:>8} {single:>16,.0f} {batched:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,17 @@ Stack Implementation using Linked List
 This module provides a Stack implementation using a linked list structure.
 """
 
+import sys
+from pathlib import Path
+
+try:
+    from ..._memory import MemoryUsage
+    from ...Linked_Lists.Python.Linked_Lists import NodePool
+except ImportError:  # Run as a script rather than as part of the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from Data_Structures._memory import MemoryUsage
+    from Data_Structures.Linked_Lists.Python.Linked_Lists import NodePool
+
 
 class Node:
     """
@@ -11,6 +22,9 @@ class Node:
     
     Each node contains data and a reference to the next node.
     """
+    # Fixed attribute slots instead of a per-instance __dict__.
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         """
         Initialize a new Node.
@@ -28,11 +42,18 @@ class Stack:
     
     This implementation follows the Last-In-First-Out (LIFO) principle.
     """
-    def __init__(self):
-        """Initialize an empty Stack."""
+    def __init__(self, pool=None):
+        """
+        Initialize an empty Stack.
+
+        Args:
+            pool: Optional NodePool used to recycle popped nodes, e.g.
+                `NodePool(node_class=Node)` to recycle this module's nodes.
+        """
         self.top = None
         self.bottom = None
         self.size = 0
+        self.pool = pool
 
     def is_empty(self):
         """
@@ -59,7 +80,10 @@ class Stack:
         Args:
             data: The data to add to the stack.
         """
-        new_node = Node(data)
+        if self.pool is None:
+            new_node = Node(data)
+        else:
+            new_node = self.pool.acquire(data)
         if self.is_empty():
             self.top = new_node
             self.bottom = new_node
@@ -83,6 +107,7 @@ class Stack:
 
         # Save reference to the top node
         popped_node = self.top
+        data = popped_node.data
 
         # Move the pointer to the next node, disconnecting the top node
         self.top = self.top.next
@@ -90,8 +115,11 @@ class Stack:
 
         if self.is_empty():
             self.bottom = None
+
+        if self.pool is not None:
+            self.pool.release(popped_node)
             
-        return popped_node.data
+        return data
 
     def peek(self):
         """
@@ -107,6 +135,39 @@ class Stack:
             raise IndexError('Stack is empty')
         return self.top.data
 
+    def memory_usage(self, deep=True):
+        """
+        Measure the memory used by the stack, counting each object once.
+
+        Args:
+            deep: If True, include everything the items reference
+                (default: True).
+
+        Returns:
+            MemoryUsage: Overhead bytes (the stack object, its nodes, and the
+                pool with its free nodes) and payload bytes (the items).
+        """
+        usage = MemoryUsage(type(self).__name__, deep)
+        sizeof = usage.sizeof
+        payload_sizeof = usage.payload_sizeof
+        usage.overhead["object"] = sizeof(self) + sizeof(vars(self))
+        nodes = items = 0
+        current = self.top
+        while current is not None:
+            nodes += sizeof(current)
+            items += payload_sizeof(current.data)
+            current = current.next
+        usage.overhead["nodes"] = nodes
+        if self.pool is not None:
+            pool = sizeof(self.pool)
+            current = self.pool._free
+            while current is not None:
+                pool += sizeof(current)
+                current = current.next
+            usage.overhead["pool"] = pool
+        usage.payload["items"] = items
+        return usage
+
     def __str__(self):
         """
         Return a string representation of the stack.
@@ -155,3 +216,9 @@ if __name__ == "__main__":
     # Pop last element
     print("\nPopping last element:", stack.pop())
     print("Is stack empty?", stack.is_empty())
+
+    # Measure the nodes and the items
+    for number in range(100):
+        stack.push(f"item{number}")
+    print("\nMemory usage:")
+    print(stack.memory_usage())
@@ -0,0 +1,199 @@
+"""
+Segmented Stack Implementation
+
+This module provides a Stack built from a chain of fixed-size array chunks.
+Growing never reallocates or copies existing elements (a full chunk is simply
+followed by a new one), and each element costs one array slot instead of a
+whole node object.
+"""
+
+
+class Chunk:
+    """
+    A fixed-size block of stack slots.
+
+    Attributes:
+        items (list): Preallocated slots for the elements.
+        below: Reference to the chunk underneath (closer to the bottom).
+    """
+    __slots__ = ('items', 'below')
+
+    def __init__(self, chunk_size):
+        """
+        Initialize an empty Chunk.
+
+        Args:
+            chunk_size: Number of slots in the chunk.
+        """
+        self.items = [None] * chunk_size
+        self.below = None
+
+
+class SegmentedStack:
+    """
+    Stack implementation using linked fixed-size chunks.
+
+    This implementation follows the Last-In-First-Out (LIFO) principle.
+    Every push and pop is O(1) in the worst case: chunks are preallocated,
+    so there is never a large reallocation-and-copy pause like the one a
+    Python list goes through when it grows.
+
+    One emptied chunk is kept as a spare, so pushing and popping back and
+    forth across a chunk boundary doesn't allocate and free chunks repeatedly.
+
+    Attributes:
+        chunk_size: Number of elements per chunk.
+        size: Number of elements in the stack.
+    """
+    def __init__(self, chunk_size=1024):
+        """
+        Initialize an empty SegmentedStack.
+
+        Args:
+            chunk_size: Number of elements per chunk (default: 1024).
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.chunk_size = chunk_size
+        self.size = 0
+        self._chunk = Chunk(chunk_size)  # Chunk holding the top of the stack
+        self._top = 0                    # Used slots in the top chunk
+        self._spare = None
+
+    def is_empty(self):
+        """
+        Check if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def get_size(self):
+        """
+        Get the number of elements in the stack.
+
+        Returns:
+            int: The number of elements in the stack.
+        """
+        return self.size
+
+    def push(self, item):
+        """
+        Add an element to the top of the stack.
+
+        Args:
+            item: The item to add to the stack.
+
+        Time Complexity:
+            O(1) worst case.
+        """
+        if self._top == self.chunk_size:
+            # Top chunk is full: continue in the spare chunk or a new one
+            chunk = self._spare
+            if chunk is None:
+                chunk = Chunk(self.chunk_size)
+            else:
+                self._spare = None
+            chunk.below = self._chunk
+            self._chunk = chunk
+            self._top = 0
+        self._chunk.items[self._top] = item
+        self._top += 1
+        self.size += 1
+
+    def pop(self):
+        """
+        Remove and return the top element from the stack.
+
+        Returns:
+            The item from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time Complexity:
+            O(1) worst case.
+        """
+        if self.size == 0:
+            raise IndexError('Stack is empty')
+        if self._top == 0:
+            # Top chunk is empty: keep it as the spare and move down
+            empty = self._chunk
+            self._chunk = empty.below
+            empty.below = None
+            self._spare = empty
+            self._top = self.chunk_size
+        self._top -= 1
+        items = self._chunk.items
+        item = items[self._top]
+        items[self._top] = None  # Don't keep a reference to the popped item
+        self.size -= 1
+        return item
+
+    def peek(self):
+        """
+        View the top element without removing it.
+
+        Returns:
+            The item at the top of the stack, or None if the stack is empty.
+        """
+        if self.size == 0:
+            return None
+        if self._top == 0:
+            return self._chunk.below.items[-1]
+        return self._chunk.items[self._top - 1]
+
+    def __iter__(self):
+        """
+        Yield the elements from top to bottom.
+
+        Yields:
+            The stack elements, top first.
+        """
+        chunk = self._chunk
+        used = self._top
+        while chunk:
+            items = chunk.items
+            for i in range(used - 1, -1, -1):
+                yield items[i]
+            chunk = chunk.below
+            used = self.chunk_size
+
+    def __str__(self):
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            str: A string showing the stack elements from top to bottom.
+        """
+        if self.is_empty():
+            return "Empty Stack"
+        return "TOP -> " + " -> ".join(map(str, self)) + " -> None"
+
+
+# Example usage
+if __name__ == "__main__":
+    # Create a stack with tiny chunks so the segments are visible
+    stack = SegmentedStack(chunk_size=2)
+    print("New stack:", stack)
+
+    # Push elements across several chunks
+    print("\nPushing elements:")
+    for item in ["apple", "banana", "cherry", "date", "elderberry"]:
+        stack.push(item)
+    print("Stack after pushing 5 items:", stack)
+    print("Size:", stack.get_size())
+
+    # Peek at top element
+    print("\nTop element (peek):", stack.peek())
+
+    # Pop elements across a chunk boundary
+    print("\nPopping elements:")
+    print("Popped:", stack.pop())
+    print("Popped:", stack.pop())
+    print("Stack after pops:", stack)
+    print("Spare chunk kept:", stack._spare is not None)
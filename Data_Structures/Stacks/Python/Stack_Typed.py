@@ -0,0 +1,235 @@
+"""
+Typed Stack Implementation
+
+This module provides a Stack for numbers backed by `array.array`.
+Elements are stored as raw machine values (e.g. 8-byte integers or doubles)
+instead of boxed Python objects, and batches of elements are moved with
+single slice operations.
+"""
+
+from array import array
+
+
+class TypedStack:
+    """
+    Stack implementation using a typed `array.array`.
+
+    This implementation follows the Last-In-First-Out (LIFO) principle.
+    All elements share one C type given by `typecode` (see the `array`
+    module), e.g. 'q' for signed 64-bit integers or 'd' for doubles, which
+    cuts memory use to the raw value size.
+
+    The stack supports the buffer protocol, so it can be shared without
+    copying with code that accepts buffers (`memoryview`, `bytes`, NumPy, ...).
+    While such a view is alive the stack can't grow or shrink.
+
+    Attributes:
+        stack (array): The elements, bottom first.
+    """
+    def __init__(self, typecode='q', values=()):
+        """
+        Initialize a TypedStack.
+
+        Args:
+            typecode: The `array` type code of the elements (default: 'q').
+            values: Optional iterable of initial elements, bottom first.
+        """
+        self.stack = array(typecode, values)
+
+    @property
+    def typecode(self):
+        """str: The `array` type code of the elements."""
+        return self.stack.typecode
+
+    def is_empty(self):
+        """
+        Check if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return len(self.stack) == 0
+
+    def get_size(self):
+        """
+        Get the number of elements in the stack.
+
+        Returns:
+            int: The number of elements in the stack.
+        """
+        return len(self.stack)
+
+    def __len__(self):
+        """
+        Allow using len(stack).
+
+        Returns:
+            int: The number of elements in the stack.
+        """
+        return len(self.stack)
+
+    def push(self, item):
+        """
+        Add an element to the top of the stack.
+
+        Args:
+            item: A number compatible with the stack's type code.
+
+        Raises:
+            TypeError: If the item doesn't match the type code.
+            OverflowError: If the item doesn't fit the type code.
+        """
+        self.stack.append(item)
+
+    def push_many(self, items):
+        """
+        Push several elements in one operation (the last one ends up on top).
+
+        Args:
+            items: An iterable of numbers, another array of the same type
+                code, or any bytes-like object holding raw values.
+        """
+        if isinstance(items, (bytes, bytearray, memoryview)):
+            # frombytes only takes byte-formatted buffers, so view the raw bytes
+            self.stack.frombytes(memoryview(items).cast('B'))
+        else:
+            self.stack.extend(items)
+
+    def pop(self):
+        """
+        Remove and return the top element from the stack.
+
+        Returns:
+            The item from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self.stack:
+            raise IndexError('Stack is empty')
+        return self.stack.pop()
+
+    def pop_many(self, n):
+        """
+        Remove the top `n` elements in one slice operation.
+
+        Args:
+            n: Number of elements to pop.
+
+        Returns:
+            array: The popped elements, top of the stack first.
+
+        Raises:
+            IndexError: If the stack holds fewer than `n` elements.
+        """
+        if n > len(self.stack):
+            raise IndexError('Not enough elements in stack')
+        if n <= 0:
+            return array(self.stack.typecode)
+        popped = self.stack[-n:]
+        del self.stack[-n:]
+        popped.reverse()
+        return popped
+
+    def peek(self):
+        """
+        View the top element without removing it.
+
+        Returns:
+            The item at the top of the stack, or None if the stack is empty.
+        """
+        if not self.stack:
+            return None
+        return self.stack[-1]
+
+    def peek_n(self, n):
+        """
+        View the top `n` elements without removing them.
+
+        Args:
+            n: Number of elements to view.
+
+        Returns:
+            array: A copy of the top elements, top of the stack first.
+
+        Raises:
+            IndexError: If the stack holds fewer than `n` elements.
+        """
+        if n > len(self.stack):
+            raise IndexError('Not enough elements in stack')
+        if n <= 0:
+            return array(self.stack.typecode)
+        top = self.stack[-n:]
+        top.reverse()
+        return top
+
+    def clear(self):
+        """Remove all elements from the stack."""
+        del self.stack[:]
+
+    def memoryview(self):
+        """
+        Return a zero-copy view of the elements, bottom first.
+
+        Returns:
+            memoryview: A view with the stack's item format.
+        """
+        return memoryview(self.stack)
+
+    def __buffer__(self, flags):
+        """
+        Export the elements through the buffer protocol (Python 3.12+).
+
+        Args:
+            flags: Buffer request flags.
+
+        Returns:
+            memoryview: A view of the underlying array.
+        """
+        return memoryview(self.stack)
+
+    def __str__(self):
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            str: A string showing the stack elements from top to bottom.
+        """
+        if self.is_empty():
+            return "Empty Stack"
+        return "TOP -> " + " -> ".join(map(str, reversed(self.stack))) + " -> None"
+
+
+# Example usage
+if __name__ == "__main__":
+    # Evaluate a postfix expression with a stack of doubles
+    print("Step 1: Evaluating the postfix expression '3 4 + 2 * 7 -'")
+    operators = {
+        "+": lambda a, b: a + b,
+        "-": lambda a, b: a - b,
+        "*": lambda a, b: a * b,
+        "/": lambda a, b: a / b,
+    }
+    stack = TypedStack('d')
+    for token in "3 4 + 2 * 7 -".split():
+        if token in operators:
+            right, left = stack.pop_many(2)
+            stack.push(operators[token](left, right))
+        else:
+            stack.push(float(token))
+    print("Result:", stack.pop())
+
+    # Bulk operations
+    print("\nStep 2: Bulk operations on a stack of 64-bit integers")
+    stack = TypedStack('q')
+    stack.push_many(range(10))
+    print("Stack:", stack)
+    print("peek_n(3):", stack.peek_n(3).tolist())
+    print("pop_many(4):", stack.pop_many(4).tolist())
+    print("Stack after pop_many:", stack)
+
+    # Zero-copy export
+    print("\nStep 3: Buffer export")
+    view = stack.memoryview()
+    print(f"Format: {view.format}, item size: {view.itemsize} bytes, total: {view.nbytes} bytes")
+    view.release()
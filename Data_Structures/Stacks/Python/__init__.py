@@ -0,0 +1 @@
+"""Python implementations of the Stacks."""
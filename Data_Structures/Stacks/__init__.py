@@ -0,0 +1 @@
+"""Stack data structures."""
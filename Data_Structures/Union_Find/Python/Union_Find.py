@@ -0,0 +1,255 @@
+"""
+Union-Find (Disjoint Set) Implementation
+
+A union-find structure keeps track of a collection of elements split into
+disjoint sets. It supports two operations:
+- find: which set does an element belong to? (returns the set's
+  representative element)
+- union: merge the sets of two elements.
+
+Each set is a tree of parent links whose root is the representative. Two
+optimizations keep the trees almost flat:
+- Union by rank: the shorter tree is attached under the taller one.
+- Path compression (path halving): every find points the visited elements
+  closer to the root.
+Together they make each operation take amortized O(alpha(n)) time, where
+alpha is the inverse Ackermann function (at most 4 for any practical n).
+
+Parent links are stored in an `array.array` of 64-bit indices and ranks in
+a `bytearray`, so each element costs 9 bytes plus its entry in the element
+index, instead of a node object.
+"""
+
+from array import array
+
+
+class UnionFind:
+    """
+    Union-find over arbitrary hashable elements, backed by flat arrays.
+
+    Elements are numbered in insertion order. `parent[i]` is the index of
+    the parent of element i (a root is its own parent) and `rank[i]` is an
+    upper bound on the height of its tree.
+
+    Attributes:
+        count (int): The number of disjoint sets.
+    """
+    def __init__(self, elements=()):
+        """
+        Initialize a UnionFind where every element is in its own set.
+
+        Args:
+            elements: Optional iterable of initial elements.
+        """
+        self._elements = []
+        self._index = {}
+        self._parent = array('q')
+        self._rank = bytearray()
+        self.count = 0
+        for element in elements:
+            self.add(element)
+
+    def add(self, element):
+        """
+        Add an element in a set of its own, if it isn't already present.
+
+        Args:
+            element: The element (must be hashable).
+
+        Returns:
+            int: The index of the element.
+        """
+        index = self._index.get(element)
+        if index is None:
+            index = len(self._elements)
+            self._index[element] = index
+            self._elements.append(element)
+            self._parent.append(index)
+            self._rank.append(0)
+            self.count += 1
+        return index
+
+    def _missing(self, *elements):
+        """
+        Build the error for a lookup of elements that are not all present.
+
+        Args:
+            *elements: The elements that were looked up.
+
+        Returns:
+            KeyError: The error naming the first missing element.
+        """
+        missing = next(element for element in elements if element not in self._index)
+        return KeyError(f"Element '{missing}' not found")
+
+    def _find(self, index):
+        """
+        Find the root index of the tree containing an index, halving the path.
+
+        Args:
+            index: The element index.
+
+        Returns:
+            int: The index of the root.
+        """
+        parent = self._parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]  # Point to the grandparent
+            index = parent[index]
+        return index
+
+    def _union(self, first, second):
+        """
+        Merge the sets of two indices, attaching the lower-ranked root.
+
+        Args:
+            first: The first element index.
+            second: The second element index.
+
+        Returns:
+            bool: True if the sets were merged, False if already the same.
+        """
+        first = self._find(first)
+        second = self._find(second)
+        if first == second:
+            return False
+        rank = self._rank
+        if rank[first] < rank[second]:
+            first, second = second, first
+        self._parent[second] = first
+        if rank[first] == rank[second]:
+            rank[first] += 1
+        self.count -= 1
+        return True
+
+    def find(self, element):
+        """
+        Find the representative of the set containing an element.
+
+        Args:
+            element: The element.
+
+        Returns:
+            The representative element. Two elements are in the same set
+            exactly when they have the same representative.
+
+        Raises:
+            KeyError: If the element is not present.
+        """
+        try:
+            return self._elements[self._find(self._index[element])]
+        except KeyError:
+            raise self._missing(element) from None
+
+    def union(self, first, second):
+        """
+        Merge the sets containing two elements.
+
+        Args:
+            first: An element.
+            second: Another element.
+
+        Returns:
+            bool: True if two sets were merged, False if the elements were
+                already in the same set.
+
+        Raises:
+            KeyError: If either element is not present.
+        """
+        index = self._index
+        try:
+            return self._union(index[first], index[second])
+        except KeyError:
+            raise self._missing(first, second) from None
+
+    def connected(self, first, second):
+        """
+        Check if two elements are in the same set.
+
+        Args:
+            first: An element.
+            second: Another element.
+
+        Returns:
+            bool: True if they are in the same set.
+
+        Raises:
+            KeyError: If either element is not present.
+        """
+        index = self._index
+        try:
+            return self._find(index[first]) == self._find(index[second])
+        except KeyError:
+            raise self._missing(first, second) from None
+
+    def sets(self):
+        """
+        Group the elements by set.
+
+        Returns:
+            list: One list of elements per set, in order of first element.
+        """
+        groups = {}
+        for index, element in enumerate(self._elements):
+            groups.setdefault(self._find(index), []).append(element)
+        return list(groups.values())
+
+    def __len__(self):
+        """
+        Allow using len(union_find).
+
+        Returns:
+            int: The number of elements.
+        """
+        return len(self._elements)
+
+    def __contains__(self, element):
+        """
+        Allow using `element in union_find`.
+
+        Args:
+            element: The element.
+
+        Returns:
+            bool: True if the element is present.
+        """
+        return element in self._index
+
+    def __str__(self):
+        """
+        Return a string representation of the structure.
+
+        Returns:
+            str: The sets.
+        """
+        return f"UnionFind({self.sets()})"
+
+
+# Example usage
+if __name__ == "__main__":
+    # Start with every city in its own set
+    cities = UnionFind(["Lima", "Quito", "Bogota", "Caracas", "Santiago"])
+    print("Initial:", cities)
+    print("Number of sets:", cities.count)
+
+    # Connect cities with roads
+    print("\nBuilding roads Lima-Quito, Quito-Bogota and Caracas-Santiago")
+    cities.union("Lima", "Quito")
+    cities.union("Quito", "Bogota")
+    cities.union("Caracas", "Santiago")
+    print("After unions:", cities)
+    print("Number of sets:", cities.count)
+
+    # Query connectivity
+    print("\nLima and Bogota connected:", cities.connected("Lima", "Bogota"))
+    print("Lima and Caracas connected:", cities.connected("Lima", "Caracas"))
+    print("Representative of Bogota:", cities.find("Bogota"))
+    print("Union of already connected cities:", cities.union("Lima", "Bogota"))
+
+    # Elements can be added later
+    cities.add("Montevideo")
+    print("\nAfter adding Montevideo, number of sets:", cities.count)
+    try:
+        cities.find("Madrid")
+    except KeyError as e:
+        print("Error:", e)
@@ -0,0 +1 @@
+"""Union-find (disjoint set) data structure."""
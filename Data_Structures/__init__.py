@@ -0,0 +1,139 @@
+"""
+Data Structures and Algorithms Toolkit
+
+A single namespace for every data structure in the toolkit:
+
+    import Data_Structures as ds
+
+    table = ds.HashTable(size=16)
+    stack = ds.ArrayStack()
+
+Submodules are loaded lazily on first attribute access (PEP 562), so importing
+the package, or using one structure, doesn't pay the import cost of the others.
+Classes that share a name in their own modules are exported under distinct
+names (e.g. `ArrayStack` and `LinkedListStack` for the two `Stack` classes).
+
+When the optional C extension `_speedups` is built, `Array`, `LinkedList`,
+`HashTable` and `Graph` resolve to the accelerated subclasses in
+`_accelerated`; otherwise (or with DSA_PURE_PYTHON=1 in the environment) they
+are the pure-Python classes. `ACCELERATED` tells which ones are in use.
+"""
+
+import importlib
+import os
+
+# Exported name -> (module relative to this package, attribute in that module)
+_EXPORTS = {
+    # Array
+    "Array": (".Array.Python.Array", "Array"),
+    "ArrayView": (".Array.Python.Array", "ArrayView"),
+    "MappedArray": (".Array.Python.Mapped_Array", "MappedArray"),
+    "ParallelExecutor": (".Array.Python.Array_Parallel", "ParallelExecutor"),
+    # Linked Lists
+    "LinkedList": (".Linked_Lists.Python.Linked_Lists", "LinkedList"),
+    "LinkedListNode": (".Linked_Lists.Python.Linked_Lists", "Node"),
+    "NodePool": (".Linked_Lists.Python.Linked_Lists", "NodePool"),
+    "PositionIndex": (".Linked_Lists.Python.Linked_Lists", "PositionIndex"),
+    "Cursor": (".Linked_Lists.Python.Linked_Lists", "Cursor"),
+    "UnrolledLinkedList": (".Linked_Lists.Python.Unrolled_Linked_List", "UnrolledLinkedList"),
+    # Stacks
+    "ArrayStack": (".Stacks.Python.Stack_Array", "Stack"),
+    "LinkedListStack": (".Stacks.Python.Stack_LinkedList", "Stack"),
+    "StackNode": (".Stacks.Python.Stack_LinkedList", "Node"),
+    "StackNodePool": (".Stacks.Python.Stack_LinkedList", "NodePool"),
+    "ConcurrentStack": (".Stacks.Python.Stack_Concurrent", "ConcurrentStack"),
+    "AsyncStack": (".Stacks.Python.Stack_Concurrent", "AsyncStack"),
+    "SegmentedStack": (".Stacks.Python.Stack_Segmented", "SegmentedStack"),
+    "TypedStack": (".Stacks.Python.Stack_Typed", "TypedStack"),
+    # Queues
+    "Deque": (".Queues.Python.Deque", "Deque"),
+    # Hash Table
+    "HashTable": (".Hash_Table.Python.Hash_Table", "HashTable"),
+    "BloomFilter": (".Hash_Table.Python.Bloom_Filter", "BloomFilter"),
+    "CountingBloomFilter": (".Hash_Table.Python.Bloom_Filter", "CountingBloomFilter"),
+    "ShardedHashTable": (".Hash_Table.Python.Sharded_Hash_Table", "ShardedHashTable"),
+    "ConsistentHashRing": (".Hash_Table.Python.Sharded_Hash_Table", "ConsistentHashRing"),
+    "DurableHashTable": (".Hash_Table.Python.Durable_Hash_Table", "DurableHashTable"),
+    # Union-Find
+    "UnionFind": (".Union_Find.Python.Union_Find", "UnionFind"),
+    # Graphs
+    "Graph": (".Graphs.Python.Graphs", "Graph"),
+    "GraphMatrix": (".Graphs.Python.Graph_Centrality", "GraphMatrix"),  # Requires NumPy
+    "AsyncGraph": (".Graphs.Python.Graph_Async", "AsyncGraph"),
+    "GraphLoader": (".Graphs.Python.Graph_Async", "GraphLoader"),
+    "SubgraphView": (".Graphs.Python.Graph_Views", "SubgraphView"),
+    "EdgeFilterView": (".Graphs.Python.Graph_Views", "EdgeFilterView"),
+    "ReversedView": (".Graphs.Python.Graph_Views", "ReversedView"),
+}
+
+# Exports with a compiled counterpart in ._accelerated (same attribute name)
+_ACCELERATED_EXPORTS = {"Array", "LinkedList", "HashTable", "Graph"}
+
+__all__ = sorted(_EXPORTS) + ["ACCELERATED"]
+
+# The `Array` subpackage has the same name as the exported `Array` class. The
+# import system binds a subpackage on its parent the first time it is loaded,
+# so load it now and drop the binding; `Array` then always means the class.
+importlib.import_module(".Array", __name__)
+del Array  # noqa: F821
+
+
+def _load_accelerated(name=None):
+    """
+    Import the accelerated module unless disabled or unavailable.
+
+    Only the requested class is created and bound, so the modules of the
+    other structures stay unimported.
+
+    Args:
+        name: Optional accelerated class to bind on the package.
+
+    Returns:
+        bool: True if the accelerated classes are in use.
+    """
+    if os.environ.get("DSA_PURE_PYTHON", "") not in ("", "0"):
+        return False
+    try:
+        module = importlib.import_module("._accelerated", __name__)
+    except ImportError:
+        return False
+    if name is not None:
+        globals()[name] = getattr(module, name)
+    return True
+
+
+def __getattr__(name):
+    """
+    Import the module defining `name` on first access and cache the result.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The exported class, or the ACCELERATED flag.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name == "ACCELERATED":
+        value = _load_accelerated()
+    elif name in _ACCELERATED_EXPORTS and _load_accelerated(name):
+        return globals()[name]
+    else:
+        try:
+            module_name, attribute = _EXPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value  # Later lookups skip __getattr__ entirely
+    return value
+
+
+def __dir__():
+    """
+    List the package attributes, including the lazily loaded ones.
+
+    Returns:
+        list: The attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
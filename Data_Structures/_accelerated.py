@@ -0,0 +1,199 @@
+"""
+Accelerated Data Structures
+
+Subclasses of the pure-Python structures whose hot loops run in the optional
+C extension `Data_Structures._speedups`. Each pure class keeps its hot loop
+in a small helper method, and the subclass only swaps that helper for the C
+function:
+- HashTable._chain_index: bucket chain scan (insert / get / delete / contains)
+- Array._shift_left / _shift_right / _index_search: element shifts (insert /
+  delete) and linear search
+- LinkedList._walk: following `next` references (lookup / insert / pop)
+- Graph._neighbor_index: weighted adjacency list scan (add_edge)
+
+A subclass is created on first access, so using one of them only imports the
+module of its own pure-Python class. Importing this module raises ImportError
+when the extension isn't built; the package namespace then falls back to the
+pure-Python classes. Behaviour is identical to the pure-Python classes:
+`verify_parity` replays the same random operations on both and compares every
+result.
+
+Build the extension with `pip install .` (or `python setup.py build_ext --inplace`).
+"""
+
+import importlib
+import random
+import sys
+
+from ._speedups import chain_index, index_search, neighbor_index, shift_left, shift_right, walk
+
+# Class name -> (module of the pure-Python class, {helper method: C function})
+_HELPERS = {
+    "HashTable": (".Hash_Table.Python.Hash_Table", {"_chain_index": chain_index}),
+    "Array": (".Array.Python.Array", {"_shift_left": shift_left, "_shift_right": shift_right,
+                                      "_index_search": index_search}),
+    "LinkedList": (".Linked_Lists.Python.Linked_Lists", {"_walk": walk}),
+    "Graph": (".Graphs.Python.Graphs", {"_neighbor_index": neighbor_index}),
+}
+
+
+def _pure_class(name):
+    """
+    Import the pure-Python class an accelerated class derives from.
+
+    Args:
+        name: The class name.
+
+    Returns:
+        type: The pure-Python class.
+    """
+    return getattr(importlib.import_module(_HELPERS[name][0], __package__), name)
+
+
+def __getattr__(name):
+    """
+    Create the accelerated subclass `name` on first access and cache it.
+
+    Args:
+        name: The attribute being looked up on the module.
+
+    Returns:
+        type: A subclass of the pure-Python class whose helpers are the C functions.
+
+    Raises:
+        AttributeError: If there is no accelerated class with that name.
+    """
+    if name not in _HELPERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    helpers = _HELPERS[name][1]
+    namespace = {helper: staticmethod(function) for helper, function in helpers.items()}
+    namespace["__doc__"] = f"{name} whose {', '.join(helpers)} run in C."
+    namespace["__module__"] = __name__
+    cls = type(name, (_pure_class(name),), namespace)
+    globals()[name] = cls  # Later lookups skip __getattr__ entirely
+    return cls
+
+
+def _classes(name):
+    """
+    Get the pure-Python and accelerated versions of a class.
+
+    Args:
+        name: The class name.
+
+    Returns:
+        tuple: (pure-Python class, accelerated class).
+    """
+    return _pure_class(name), getattr(sys.modules[__name__], name)
+
+
+def _check(condition, *details):
+    """
+    Check one parity condition. The error is raised explicitly rather than
+    with `assert`, so the checks still run under `python -O`.
+
+    Args:
+        condition: The value that must be true.
+        *details: Context included in the error.
+
+    Raises:
+        AssertionError: If condition is false.
+    """
+    if not condition:
+        raise AssertionError(details)
+
+
+def _outcome(call):
+    """
+    Run a call and capture its result or the type and message of its exception.
+
+    Args:
+        call: A zero-argument callable.
+
+    Returns:
+        tuple: ("ok", result) or ("error", exception type, message).
+    """
+    try:
+        return ("ok", call())
+    except Exception as error:
+        return ("error", type(error), str(error))
+
+
+def verify_parity(operations=2000, seed=0):
+    """
+    Check that accelerated and pure-Python classes behave identically.
+
+    The same random sequence of operations (including invalid ones that raise)
+    is applied to a pure and an accelerated instance of every structure, and
+    each result, exception and final internal state is compared.
+
+    Args:
+        operations: Number of random operations per structure.
+        seed: Random seed.
+
+    Raises:
+        AssertionError: If any result or state differs.
+    """
+    from .Hash_Table.Python.Bloom_Filter import CountingBloomFilter
+
+    rng = random.Random(seed)
+
+    PureHashTable, HashTable = _classes("HashTable")
+    for bloom_filter in (None, CountingBloomFilter):
+        tables = tuple(cls(size=7, bloom_filter=bloom_filter and bloom_filter(50))
+                       for cls in (PureHashTable, HashTable))
+        for _ in range(operations):
+            key = rng.choice([rng.randrange(40), f"k{rng.randrange(40)}", (rng.randrange(5), 1)])
+            action = rng.choice(["insert", "get", "delete", "contains"])
+            args = (key, rng.random()) if action == "insert" else (key,)
+            results = [_outcome(lambda t=t: getattr(t, action)(*args)) for t in tables]
+            _check(results[0] == results[1], action, args, results)
+        _check(tables[0].table == tables[1].table, "buckets")
+        if bloom_filter:
+            _check(tables[0].bloom_filter.bits == tables[1].bloom_filter.bits, "filter bits")
+
+    arrays = tuple(cls() for cls in _classes("Array"))
+    clones = []
+    for _ in range(operations):
+        if rng.random() < 0.05:
+            clones.append((arrays[0].to_list(),) + tuple(a.clone() for a in arrays))
+        action = rng.choice(["push", "pop", "insert", "delete", "search", "get"])
+        index = rng.randrange(-2, arrays[0].length + 3)
+        value = rng.randrange(20)
+        args = {"push": (value,), "pop": (), "insert": (index, value),
+                "delete": (index,), "search": (value,), "get": (index,)}[action]
+        results = [_outcome(lambda a=a: getattr(a, action)(*args)) for a in arrays]
+        _check(results[0] == results[1], action, args, results)
+    _check(arrays[0].data == arrays[1].data and arrays[0].length == arrays[1].length, "array state")
+    for snapshot, pure, accelerated in clones:
+        _check(pure.to_list() == accelerated.to_list() == snapshot, "clone", snapshot)
+
+    lists = tuple(cls() for cls in _classes("LinkedList"))
+    for _ in range(operations):
+        action = rng.choice(["append", "prepend", "insert", "lookup", "pop", "pop_first", "find"])
+        index = rng.randrange(-2, lists[0].length + 3)
+        value = rng.randrange(20)
+        args = {"append": (value,), "prepend": (value,), "insert": (index, value),
+                "lookup": (index,), "pop": (), "pop_first": (), "find": (value,)}[action]
+        results = [_outcome(lambda l=l: getattr(l, action)(*args)) for l in lists]
+        _check(results[0] == results[1], action, args, results)
+    _check(lists[0].to_list() == lists[1].to_list(), "list elements")
+
+    for directed in (False, True):
+        graphs = tuple(cls(directed) for cls in _classes("Graph"))
+        for _ in range(operations):
+            v1, v2 = rng.randrange(15), rng.randrange(15)
+            action = rng.choice(["add_edge", "add_edge", "remove_edge", "remove_vertex"])
+            args = {"add_edge": (v1, v2, rng.randrange(1, 9)), "remove_edge": (v1, v2),
+                    "remove_vertex": (v1,)}[action]
+            results = [_outcome(lambda g=g: getattr(g, action)(*args)) for g in graphs]
+            _check(results[0] == results[1], action, args, results)
+        _check(graphs[0].adjacency == graphs[1].adjacency, "adjacency", directed)
+
+
+# Example usage
+if __name__ == "__main__":
+    print("Checking that accelerated and pure-Python classes behave identically...")
+    for seed in range(5):
+        verify_parity(seed=seed)
+    print("All accelerated classes match the pure-Python implementations.")
@@ -0,0 +1,154 @@
+"""
+Memory Usage Accounting
+
+Shared helper behind the `memory_usage(deep=True)` methods of the data
+structures. `sys.getsizeof` measures a single object: for a hash table, the
+list of buckets, but not the buckets or the (key, value) tuples inside them.
+A MemoryUsage report adds up the sizes of every object a structure is made
+of, and splits them into two groups:
+- overhead: the structure's own storage (the structure object and its
+  attribute dictionary, its nodes, bucket lists, entry tuples, index
+  dictionaries...). This is the cost of the
+  representation, and what differs between two structures holding the same
+  elements.
+- payload: the stored elements (values, keys, vertices, weights). With
+  deep=True, everything an element references is included (the items of a
+  stored list, the attributes of a stored object...). With deep=False only
+  the element objects themselves are measured.
+
+Each object is counted once, by identity, however many times it is reached:
+a vertex stored as a key and in ten neighbor lists, or a string stored under
+two keys, is counted the first time only. Objects shared by the whole
+interpreter (None, True, False, the cached small integers -5 to 256, classes,
+functions and modules) are never counted.
+"""
+
+import gc
+import sys
+from types import BuiltinFunctionType, FunctionType, ModuleType
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+_SINGLETONS = (None, True, False, Ellipsis, NotImplemented, *range(-5, 257))
+# Objects of these types never reference other objects
+_LEAF_TYPES = (str, int, float, complex, bytes, bytearray, range)
+
+
+class MemoryUsage:
+    """
+    Bytes used by a data structure, split into overhead and payload.
+
+    A structure fills a report by measuring its objects with `sizeof` (its
+    own storage) and `payload_sizeof` (stored elements), and storing the
+    totals by category in `overhead` and `payload`.
+
+    Attributes:
+        name (str): Name of the measured structure.
+        deep (bool): Whether everything the elements reference is included.
+        overhead (dict): Category -> bytes of the structure's own storage.
+        payload (dict): Category -> bytes of the stored elements.
+        objects (int): Number of distinct objects counted.
+    """
+    def __init__(self, name, deep=True):
+        """
+        Initialize an empty report.
+
+        Args:
+            name: Name of the measured structure.
+            deep: Whether to include everything the elements reference.
+        """
+        self.name = name
+        self.deep = deep
+        self.overhead = {}
+        self.payload = {}
+        self.objects = 0
+        self._seen = {id(obj) for obj in _SINGLETONS}
+
+    def sizeof(self, obj):
+        """
+        Measure one object of the structure's own storage.
+
+        Args:
+            obj: The object.
+
+        Returns:
+            int: Its size in bytes, or 0 if it was already counted or is
+                shared by the interpreter.
+        """
+        key = id(obj)
+        if key in self._seen or isinstance(obj, _SHARED_TYPES):
+            return 0
+        self._seen.add(key)
+        self.objects += 1
+        return sys.getsizeof(obj)
+
+    def payload_sizeof(self, obj):
+        """
+        Measure a stored element and, if deep, everything it references.
+
+        Args:
+            obj: The element.
+
+        Returns:
+            int: The size in bytes of the objects not counted before.
+        """
+        size = self.sizeof(obj)
+        if not size or not self.deep or isinstance(obj, _LEAF_TYPES):
+            return size
+        sizeof = self.sizeof
+        pending = gc.get_referents(obj)
+        while pending:
+            referent = pending.pop()
+            referent_size = sizeof(referent)
+            if referent_size:
+                size += referent_size
+                if not isinstance(referent, _LEAF_TYPES):
+                    pending.extend(gc.get_referents(referent))
+        return size
+
+    @property
+    def overhead_bytes(self):
+        """
+        Total bytes of the structure's own storage.
+
+        Returns:
+            int: The sum of the overhead categories.
+        """
+        return sum(self.overhead.values())
+
+    @property
+    def payload_bytes(self):
+        """
+        Total bytes of the stored elements.
+
+        Returns:
+            int: The sum of the payload categories.
+        """
+        return sum(self.payload.values())
+
+    @property
+    def total_bytes(self):
+        """
+        Total bytes of the structure and its elements.
+
+        Returns:
+            int: Overhead plus payload bytes.
+        """
+        return self.overhead_bytes + self.payload_bytes
+
+    def __str__(self):
+        """
+        Return a table of the bytes used, by group and category.
+
+        Returns:
+            str: The breakdown of overhead and payload bytes.
+        """
+        total = self.total_bytes
+        lines = [f"{self.name} memory usage ({'deep' if self.deep else 'shallow'}): "
+                 f"{total:,} bytes in {self.objects:,} objects"]
+        for group, categories in (("overhead", self.overhead), ("payload", self.payload)):
+            group_bytes = sum(categories.values())
+            share = group_bytes / total if total else 0
+            lines.append(f"  {group:<16}{group_bytes:>14,} bytes ({share:.0%})")
+            for category, size in categories.items():
+                lines.append(f"    {category:<14}{size:>14,}")
+        return "\n".join(lines)
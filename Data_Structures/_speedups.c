@@ -0,0 +1,279 @@
+/*
+ * Optional C accelerators for the toolkit's hot loops.
+ *
+ * Each function is a C translation of a loop found in the pure-Python
+ * implementations and keeps exactly the same semantics: elements are compared
+ * with `==` in the same operand order, the same exceptions are raised, and
+ * containers are re-read on every iteration so user-defined __eq__ methods
+ * that mutate them behave as they would in Python.
+ *
+ * The module is used by Data_Structures/_accelerated.py when it can be
+ * imported; otherwise the pure-Python classes are used.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *next_name;  /* Interned "next" attribute name */
+
+/* Return 1 if a == b, 0 if not, -1 on error (no identity shortcut, like ==). */
+static int
+is_equal(PyObject *a, PyObject *b)
+{
+    PyObject *result = PyObject_RichCompare(a, b, Py_EQ);
+    int truth;
+
+    if (result == NULL)
+        return -1;
+    truth = PyObject_IsTrue(result);
+    Py_DECREF(result);
+    return truth;
+}
+
+/* Return the first element of a (first, second) pair, raising like unpacking. */
+static PyObject *
+pair_first(PyObject *entry)
+{
+    if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 2) {
+        PyErr_SetString(PyExc_TypeError, "expected a (first, second) tuple");
+        return NULL;
+    }
+    return PyTuple_GET_ITEM(entry, 0);
+}
+
+/*
+ * Index of the first pair in `pairs[start:]` whose first element == target,
+ * or -1. Shared by hash table chains and weighted adjacency lists.
+ */
+static PyObject *
+find_pair(PyObject *pairs, PyObject *target, Py_ssize_t start)
+{
+    Py_ssize_t i;
+
+    for (i = start; i < PyList_GET_SIZE(pairs); i++) {
+        PyObject *entry = PyList_GET_ITEM(pairs, i);
+        PyObject *first;
+        int equal;
+
+        Py_INCREF(entry);
+        first = pair_first(entry);
+        if (first == NULL) {
+            Py_DECREF(entry);
+            return NULL;
+        }
+        equal = is_equal(first, target);
+        Py_DECREF(entry);
+        if (equal < 0)
+            return NULL;
+        if (equal)
+            return PyLong_FromSsize_t(i);
+    }
+    return PyLong_FromLong(-1);
+}
+
+PyDoc_STRVAR(chain_index_doc,
+"chain_index(bucket, key)\n\n"
+"Index of the first (k, v) pair in a hash table bucket with k == key, or -1.");
+
+static PyObject *
+chain_index(PyObject *module, PyObject *args)
+{
+    PyObject *bucket, *key;
+
+    if (!PyArg_ParseTuple(args, "O!O:chain_index", &PyList_Type, &bucket, &key))
+        return NULL;
+    return find_pair(bucket, key, 0);
+}
+
+PyDoc_STRVAR(neighbor_index_doc,
+"neighbor_index(neighbors, vertex, start=0)\n\n"
+"Index of the first (v, weight) pair at or after start with v == vertex, or -1.");
+
+static PyObject *
+neighbor_index(PyObject *module, PyObject *args)
+{
+    PyObject *neighbors, *vertex;
+    Py_ssize_t start = 0;
+
+    if (!PyArg_ParseTuple(args, "O!O|n:neighbor_index", &PyList_Type, &neighbors,
+                          &vertex, &start))
+        return NULL;
+    return find_pair(neighbors, vertex, start < 0 ? 0 : start);
+}
+
+/* data[key], with a fast path for the Array's dict storage. */
+static PyObject *
+get_item(PyObject *data, PyObject *key)
+{
+    PyObject *value;
+
+    if (!PyDict_CheckExact(data))
+        return PyObject_GetItem(data, key);
+    value = PyDict_GetItemWithError(data, key);
+    if (value != NULL)
+        Py_INCREF(value);
+    else if (!PyErr_Occurred())
+        PyErr_SetObject(PyExc_KeyError, key);
+    return value;
+}
+
+/* data[key] = value, with a fast path for the Array's dict storage. */
+static int
+set_item(PyObject *data, PyObject *key, PyObject *value)
+{
+    if (PyDict_CheckExact(data))
+        return PyDict_SetItem(data, key, value);
+    return PyObject_SetItem(data, key, value);
+}
+
+/*
+ * for i in range(start, stop, step): data[i] = data[i + step]
+ *
+ * Each integer key is created once: the source key of one move is the
+ * target key of the next.
+ */
+static PyObject *
+shift(PyObject *data, Py_ssize_t start, Py_ssize_t stop, Py_ssize_t step)
+{
+    PyObject *target, *source, *value;
+    Py_ssize_t i;
+
+    if ((step > 0 && start >= stop) || (step < 0 && start <= stop))
+        Py_RETURN_NONE;
+    target = PyLong_FromSsize_t(start);
+    if (target == NULL)
+        return NULL;
+    for (i = start; step > 0 ? i < stop : i > stop; i += step) {
+        source = PyLong_FromSsize_t(i + step);
+        if (source == NULL)
+            goto error;
+        value = get_item(data, source);
+        if (value == NULL || set_item(data, target, value) < 0) {
+            Py_XDECREF(value);
+            Py_DECREF(source);
+            goto error;
+        }
+        Py_DECREF(value);
+        Py_DECREF(target);
+        target = source;
+    }
+    Py_DECREF(target);
+    Py_RETURN_NONE;
+
+error:
+    Py_DECREF(target);
+    return NULL;
+}
+
+PyDoc_STRVAR(shift_left_doc,
+"shift_left(data, index, length)\n\n"
+"for i in range(index, length - 1): data[i] = data[i + 1]");
+
+static PyObject *
+shift_left(PyObject *module, PyObject *args)
+{
+    PyObject *data;
+    Py_ssize_t index, length;
+
+    if (!PyArg_ParseTuple(args, "Onn:shift_left", &data, &index, &length))
+        return NULL;
+    return shift(data, index, length - 1, 1);
+}
+
+PyDoc_STRVAR(shift_right_doc,
+"shift_right(data, index, length)\n\n"
+"for i in range(length, index, -1): data[i] = data[i - 1]");
+
+static PyObject *
+shift_right(PyObject *module, PyObject *args)
+{
+    PyObject *data;
+    Py_ssize_t index, length;
+
+    if (!PyArg_ParseTuple(args, "Onn:shift_right", &data, &index, &length))
+        return NULL;
+    return shift(data, length, index, -1);
+}
+
+PyDoc_STRVAR(index_search_doc,
+"index_search(data, item, length)\n\n"
+"First i in range(length) with data[i] == item, or -1.");
+
+static PyObject *
+index_search(PyObject *module, PyObject *args)
+{
+    PyObject *data, *item;
+    Py_ssize_t length, i;
+
+    if (!PyArg_ParseTuple(args, "OOn:index_search", &data, &item, &length))
+        return NULL;
+    for (i = 0; i < length; i++) {
+        PyObject *key, *value;
+        int equal;
+
+        key = PyLong_FromSsize_t(i);
+        if (key == NULL)
+            return NULL;
+        value = get_item(data, key);
+        Py_DECREF(key);
+        if (value == NULL)
+            return NULL;
+        equal = is_equal(value, item);
+        Py_DECREF(value);
+        if (equal < 0)
+            return NULL;
+        if (equal)
+            return PyLong_FromSsize_t(i);
+    }
+    return PyLong_FromLong(-1);
+}
+
+PyDoc_STRVAR(walk_doc,
+"walk(node, steps)\n\n"
+"Follow the `next` reference `steps` times and return the node reached.");
+
+static PyObject *
+walk(PyObject *module, PyObject *args)
+{
+    PyObject *node;
+    Py_ssize_t steps, i;
+
+    if (!PyArg_ParseTuple(args, "On:walk", &node, &steps))
+        return NULL;
+    Py_INCREF(node);
+    for (i = 0; i < steps; i++) {
+        PyObject *next = PyObject_GetAttr(node, next_name);
+        Py_DECREF(node);
+        if (next == NULL)
+            return NULL;
+        node = next;
+    }
+    return node;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"chain_index", chain_index, METH_VARARGS, chain_index_doc},
+    {"neighbor_index", neighbor_index, METH_VARARGS, neighbor_index_doc},
+    {"shift_left", shift_left, METH_VARARGS, shift_left_doc},
+    {"shift_right", shift_right, METH_VARARGS, shift_right_doc},
+    {"index_search", index_search, METH_VARARGS, index_search_doc},
+    {"walk", walk, METH_VARARGS, walk_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "_speedups",
+    "C accelerators for the toolkit's hot loops.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    next_name = PyUnicode_InternFromString("next");
+    if (next_name == NULL)
+        return NULL;
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,481 @@
+"""
+Instrumentation Layer
+
+Opt-in, per-operation instrumentation for the toolkit's data structures.
+
+Enabling instrumentation for a class replaces its public methods with thin
+wrappers that count calls, record latencies in a histogram and update
+structure-specific counters (HashTable chain lengths and hot buckets,
+LinkedList nodes traversed, Array element shifts, Graph adjacency scans).
+Disabling it puts the original methods back, so there is no overhead at all
+while instrumentation is off.
+
+Metrics can be exported as a dict or in the Prometheus text format.
+"""
+
+import inspect
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+                   2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    Cumulative-bucket latency histogram in the Prometheus style.
+
+    Attributes:
+        bounds (tuple): Upper bounds of the buckets in seconds.
+        counts (list): Observations per bucket (last one is +Inf).
+        total (float): Sum of all observed latencies.
+        count (int): Number of observations.
+    """
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds: Sorted upper bounds of the buckets in seconds.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        """
+        Record one latency.
+
+        Args:
+            seconds: The observed latency.
+        """
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated latency, or None if there are no observations.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        """
+        Export the histogram.
+
+        Returns:
+            dict: Count, sum, mean, estimated p50/p99 and cumulative buckets.
+        """
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else repr(bound)] = running
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+# Structure-specific probes. Each probe runs before the wrapped method with the
+# same arguments and returns {counter name: increment}. Probes run only while
+# instrumentation is enabled, so they may do extra work.
+
+def _hash_table_probe(table, key, *args, **kwargs):
+    """Chain length scanned and bucket hit by a HashTable key operation."""
+    bucket = table._hash_function(key)
+    return {"chain_length": len(table.table[bucket]), "bucket": bucket}
+
+
+def _hash_table_lookup_probe(table, key, *args, **kwargs):
+    """Like _hash_table_probe, but counts lookups the Bloom filter answered."""
+    bloom_filter = getattr(table, "bloom_filter", None)
+    if bloom_filter is not None and not bloom_filter.might_contain(key):
+        return {"bloom_rejections": 1}
+    return _hash_table_probe(table, key)
+
+
+def _linked_list_lookup_probe(linked_list, index, *args, **kwargs):
+    """Nodes walked by LinkedList.lookup (or LinkedList.insert)."""
+    if not 0 <= index < linked_list.length:
+        return {}
+    position_index = getattr(linked_list, "index", None)
+    if position_index is None:
+        return {"nodes_traversed": index}
+    _, offset = position_index._locate(index)
+    return {"nodes_traversed": offset}
+
+
+def _linked_list_pop_probe(linked_list, *args, **kwargs):
+    """Nodes walked by LinkedList.pop to find the node before the tail."""
+    if getattr(linked_list, "index", None) is not None or linked_list.length < 2:
+        return {}
+    return {"nodes_traversed": linked_list.length - 2}
+
+
+def _array_insert_probe(array, index, *args, **kwargs):
+    """Elements shifted right by Array.insert."""
+    if not 0 <= index <= array.length:
+        return {}
+    return {"shifts": array.length - index}
+
+
+def _array_delete_probe(array, index, *args, **kwargs):
+    """Elements shifted left by Array.delete."""
+    if not 0 <= index < array.length:
+        return {}
+    return {"shifts": array.length - index - 1}
+
+
+def _graph_add_edge_probe(graph, v1, *args, **kwargs):
+    """Adjacency entries scanned by Graph.add_edge / remove_edge."""
+    return {"edges_scanned": len(graph.adjacency.get(v1, ()))}
+
+
+def _graph_remove_vertex_probe(graph, v, *args, **kwargs):
+    """Adjacency lists and entries scanned by Graph.remove_vertex."""
+    if v not in graph.adjacency:
+        return {}
+    return {
+        "adjacency_lists_scanned": len(graph.adjacency) - 1,
+        "edges_scanned": sum(len(neighbors) for neighbors in graph.adjacency.values()),
+    }
+
+
+PROBES = {
+    "HashTable": {
+        "insert": _hash_table_probe,
+        "get": _hash_table_lookup_probe,
+        "delete": _hash_table_lookup_probe,
+    },
+    "LinkedList": {
+        "lookup": _linked_list_lookup_probe,
+        "insert": _linked_list_lookup_probe,
+        "pop": _linked_list_pop_probe,
+    },
+    "Array": {
+        "insert": _array_insert_probe,
+        "delete": _array_delete_probe,
+    },
+    "Graph": {
+        "add_edge": _graph_add_edge_probe,
+        "remove_edge": _graph_add_edge_probe,
+        "remove_vertex": _graph_remove_vertex_probe,
+    },
+}
+
+
+class Instrumentation:
+    """
+    Collects call counts, latency histograms and counters for instrumented classes.
+
+    Usage:
+        instrumentation = Instrumentation()
+        instrumentation.enable(HashTable, LinkedList)
+        ...  # run the workload
+        instrumentation.disable()
+        print(instrumentation.to_prometheus())
+
+    Instrumentation applies to every instance of an enabled class.
+
+    Attributes:
+        calls (Counter): Calls per (class name, method).
+        latencies (dict): LatencyHistogram per (class name, method).
+        counters (Counter): Totals per (class name, method, counter).
+        bucket_hits (dict): Counter of hits per HashTable bucket, per class name.
+    """
+    def __init__(self, probes=None):
+        """
+        Initialize an Instrumentation with no class enabled.
+
+        Args:
+            probes: Optional mapping {class name: {method: probe}} replacing
+                the default structure-specific probes.
+        """
+        self.probes = PROBES if probes is None else probes
+        self._originals = {}
+        self.calls = Counter()
+        self.latencies = {}
+        self.counters = Counter()
+        self.bucket_hits = {}
+
+    def reset(self):
+        """
+        Clear every collected metric.
+
+        Metrics are cleared in place, because the installed wrappers keep
+        references to them, so this is safe while instrumentation is enabled.
+        """
+        self.calls.clear()
+        self.counters.clear()
+        self.bucket_hits.clear()
+        for histogram in self.latencies.values():
+            histogram.counts = [0] * len(histogram.counts)
+            histogram.total = 0.0
+            histogram.count = 0
+
+    def is_enabled(self, cls):
+        """
+        Check if a class is currently instrumented.
+
+        Args:
+            cls: The class to check.
+
+        Returns:
+            bool: True if instrumentation is enabled for the class.
+        """
+        return any(owner is cls for owner, _ in self._originals)
+
+    def enable(self, *classes, methods=None):
+        """
+        Start instrumenting classes.
+
+        Args:
+            *classes: The classes to instrument.
+            methods: Optional list of method names to wrap (default: every
+                public method of each class).
+        """
+        for cls in classes:
+            names = methods
+            if names is None:
+                names = [name for name in dir(cls)
+                         if not name.startswith("_") and callable(getattr(cls, name))
+                         and not isinstance(inspect.getattr_static(cls, name),
+                                            (classmethod, staticmethod))]
+            for name in names:
+                if (cls, name) in self._originals:
+                    continue
+                original = cls.__dict__.get(name)
+                self._originals[(cls, name)] = original
+                setattr(cls, name, self._wrap(cls, name, getattr(cls, name)))
+
+    def disable(self, *classes):
+        """
+        Stop instrumenting classes and restore their original methods.
+
+        Args:
+            *classes: The classes to restore (default: all enabled classes).
+        """
+        for (cls, name) in list(self._originals):
+            if classes and cls not in classes:
+                continue
+            original = self._originals.pop((cls, name))
+            if original is None:
+                # The method was inherited: remove the wrapper from the class
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+    @contextmanager
+    def enabled(self, *classes, methods=None):
+        """
+        Context manager instrumenting classes only inside a `with` block.
+
+        Args:
+            *classes: The classes to instrument.
+            methods: Optional list of method names to wrap.
+
+        Yields:
+            Instrumentation: This instance.
+        """
+        self.enable(*classes, methods=methods)
+        try:
+            yield self
+        finally:
+            self.disable(*classes)
+
+    def _wrap(self, cls, name, method):
+        """
+        Build the instrumented replacement of a method.
+
+        Args:
+            cls: The class owning the method.
+            name: The method name.
+            method: The original function.
+
+        Returns:
+            function: The wrapper.
+        """
+        structure = cls.__name__
+        key = (structure, name)
+        histogram = self.latencies.setdefault(key, LatencyHistogram())
+        probe = self.probes.get(structure, {}).get(name)
+        calls = self.calls
+        counters = self.counters
+        bucket_hits = self.bucket_hits
+        clock = time.perf_counter
+
+        @wraps(method)
+        def wrapper(instance, *args, **kwargs):
+            calls[key] += 1
+            if probe is not None:
+                try:
+                    observations = probe(instance, *args, **kwargs)
+                except Exception:
+                    # A probe must never change the behaviour of the method
+                    observations = {}
+                for counter, value in observations.items():
+                    if counter == "bucket":
+                        bucket_hits.setdefault(structure, Counter())[value] += 1
+                    else:
+                        counters[(structure, name, counter)] += value
+            start = clock()
+            try:
+                return method(instance, *args, **kwargs)
+            finally:
+                histogram.observe(clock() - start)
+        return wrapper
+
+    def to_dict(self, hot_buckets=10):
+        """
+        Export every metric as nested dictionaries.
+
+        Args:
+            hot_buckets: Number of most-hit buckets to report per hash table.
+
+        Returns:
+            dict: {structure: {"methods": {method: {...}}, "hot_buckets": [...]}}.
+        """
+        report = {}
+        for (structure, method), histogram in self.latencies.items():
+            if self.calls[(structure, method)] == 0:
+                continue
+            methods = report.setdefault(structure, {"methods": {}})["methods"]
+            methods[method] = {
+                "calls": self.calls[(structure, method)],
+                "latency": histogram.to_dict(),
+                "counters": {},
+            }
+        for (structure, method, counter), total in self.counters.items():
+            entry = report.setdefault(structure, {"methods": {}})["methods"].setdefault(
+                method, {"calls": self.calls[(structure, method)], "counters": {}})
+            entry["counters"][counter] = total
+        for structure, hits in self.bucket_hits.items():
+            report.setdefault(structure, {"methods": {}})["hot_buckets"] = [
+                {"bucket": bucket, "hits": count}
+                for bucket, count in hits.most_common(hot_buckets)
+            ]
+        return report
+
+    def to_prometheus(self, prefix="dsa", hot_buckets=10):
+        """
+        Export every metric in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names (default: "dsa").
+            hot_buckets: Number of most-hit buckets to report per hash table.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = [
+            f"# HELP {prefix}_calls_total Calls per data structure method.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for (structure, method), count in sorted(self.calls.items()):
+            lines.append(f'{prefix}_calls_total{{structure="{structure}",method="{method}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_latency_seconds Latency per data structure method.",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for (structure, method), histogram in sorted(self.latencies.items()):
+            if histogram.count == 0:
+                continue
+            labels = f'structure="{structure}",method="{method}"'
+            running = 0
+            for bound, count in zip(histogram.bounds + (float("inf"),), histogram.counts):
+                running += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_latency_seconds_bucket{{{labels},le="{le}"}} {running}')
+            lines.append(f"{prefix}_latency_seconds_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{prefix}_latency_seconds_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            f"# HELP {prefix}_work_total Structure-specific work counters "
+            f"(chain lengths, nodes traversed, shifts, edges scanned).",
+            f"# TYPE {prefix}_work_total counter",
+        ]
+        for (structure, method, counter), total in sorted(self.counters.items()):
+            lines.append(f'{prefix}_work_total{{structure="{structure}",method="{method}",'
+                         f'counter="{counter}"}} {total}')
+
+        lines += [
+            f"# HELP {prefix}_bucket_hits_total Hits of the most used hash table buckets.",
+            f"# TYPE {prefix}_bucket_hits_total counter",
+        ]
+        for structure, hits in sorted(self.bucket_hits.items()):
+            for bucket, count in hits.most_common(hot_buckets):
+                lines.append(f'{prefix}_bucket_hits_total{{structure="{structure}",'
+                             f'bucket="{bucket}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from Data_Structures import Array, HashTable, LinkedList
+
+    instrumentation = Instrumentation()
+
+    print("Step 1: Running a workload with instrumentation enabled")
+    with instrumentation.enabled(HashTable, LinkedList, Array):
+        table = HashTable(size=8)
+        for i in range(100):
+            table.insert(f"key-{i}", i)
+        for i in range(50):
+            table.get(f"key-{i}")
+
+        linked_list = LinkedList()
+        linked_list.extend(range(1000))
+        for index in (10, 500, 999):
+            linked_list.lookup(index)
+
+        array = Array()
+        for i in range(100):
+            array.push(i)
+        array.insert(0, -1)
+        array.delete(50)
+
+    print("\nStep 2: Methods are restored once disabled")
+    print(f"HashTable.get is the original: {not hasattr(HashTable.get, '__wrapped__')}")
+
+    print("\nStep 3: Metrics as a dict (excerpt)")
+    report = instrumentation.to_dict(hot_buckets=3)
+    print(f"HashTable.get: {report['HashTable']['methods']['get']['calls']} calls, "
+          f"counters {report['HashTable']['methods']['get']['counters']}")
+    print(f"Hot buckets: {report['HashTable']['hot_buckets']}")
+    print(f"LinkedList.lookup counters: {report['LinkedList']['methods']['lookup']['counters']}")
+    print(f"Array counters: insert {report['Array']['methods']['insert']['counters']}, "
+          f"delete {report['Array']['methods']['delete']['counters']}")
+
+    print("\nStep 4: Prometheus export (first lines)")
+    print("\n".join(instrumentation.to_prometheus().splitlines()[:6]))
@@ -0,0 +1 @@
+"""Instrumentation layer for the data structures."""
@@ -0,0 +1,19 @@
+"""
+Build script for the optional C accelerators.
+
+Package metadata lives in pyproject.toml; this file only declares the
+`Data_Structures._speedups` extension. It is marked optional, so installing
+without a C compiler still succeeds and the pure-Python classes are used.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "Data_Structures._speedups",
+            ["Data_Structures/_speedups.c"],
+            optional=True,
+        )
+    ]
+)
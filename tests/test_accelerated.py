@@ -0,0 +1,203 @@
+"""
+Tests for the accelerated classes.
+
+The same seeded operation sequences run against the pure-Python and the
+accelerated Array, HashTable, Graph and LinkedList, and every result is
+checked against a plain Python model. The accelerated side is skipped when
+the `_speedups` extension isn't built.
+"""
+
+import random
+
+import pytest
+
+from Data_Structures.Array.Python import Array as array_module
+from Data_Structures.Graphs.Python import Graphs as graphs_module
+from Data_Structures.Hash_Table.Python import Hash_Table as hash_table_module
+from Data_Structures.Linked_Lists.Python import Linked_Lists as linked_lists_module
+
+PURE = {
+    "Array": array_module.Array,
+    "HashTable": hash_table_module.HashTable,
+    "Graph": graphs_module.Graph,
+    "LinkedList": linked_lists_module.LinkedList,
+}
+SEEDS = range(3)
+OPERATIONS = 1500
+
+
+@pytest.fixture(params=["pure", "accelerated"])
+def classes(request):
+    """The four classes of one implementation, by name."""
+    if request.param == "pure":
+        return PURE
+    pytest.importorskip("Data_Structures._speedups")
+    from Data_Structures import _accelerated
+    return {name: getattr(_accelerated, name) for name in PURE}
+
+
+def outcome(call):
+    """Run a call and return ("ok", result) or ("error", exception type)."""
+    try:
+        return ("ok", call())
+    except Exception as error:
+        return ("error", type(error))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hash_table_matches_dict(classes, seed):
+    rng = random.Random(seed)
+    table, model = classes["HashTable"](size=7), {}
+
+    def expected(action, key, value):
+        if action == "insert":
+            model[key] = value
+            return ("ok", None)
+        if action == "contains":
+            return ("ok", key in model)
+        if key not in model:
+            return ("error", KeyError)
+        if action == "get":
+            return ("ok", model[key])
+        del model[key]
+        return ("ok", None)
+
+    for _ in range(OPERATIONS):
+        key = rng.choice([rng.randrange(40), f"k{rng.randrange(40)}", (rng.randrange(5), 1)])
+        action = rng.choice(["insert", "get", "delete", "contains"])
+        value = rng.random()
+        args = (key, value) if action == "insert" else (key,)
+        result = outcome(lambda: getattr(table, action)(*args))
+        assert result == expected(action, key, value), (action, args)
+    assert sorted(map(repr, (entry for bucket in table.table for entry in bucket))) == \
+        sorted(map(repr, model.items()))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_array_matches_list(classes, seed):
+    rng = random.Random(seed)
+    array, model = classes["Array"](), []
+
+    def expected(action, index, value):
+        in_range = 0 <= index < len(model)
+        if action == "push":
+            model.append(value)
+            return ("ok", None)
+        if action == "pop":
+            return ("ok", model.pop()) if model else ("error", KeyError)
+        if action == "get":
+            return ("ok", model[index]) if in_range else ("error", KeyError)
+        if action == "delete":
+            return ("ok", model.pop(index)) if in_range else ("error", KeyError)
+        if action == "insert":
+            if not 0 <= index <= len(model):
+                return ("error", IndexError)
+            model.insert(index, value)
+            return ("ok", None)
+        return ("ok", model.index(value) if value in model else -1)
+
+    for _ in range(OPERATIONS):
+        action = rng.choice(["push", "pop", "insert", "delete", "search", "get"])
+        index = rng.randrange(-2, len(model) + 3)
+        value = rng.randrange(20)
+        args = {"push": (value,), "pop": (), "insert": (index, value),
+                "delete": (index,), "search": (value,), "get": (index,)}[action]
+        result = outcome(lambda: getattr(array, action)(*args))
+        assert result == expected(action, index, value), (action, args)
+    assert array.to_list() == model
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_linked_list_matches_list(classes, seed):
+    rng = random.Random(seed)
+    linked_list, model = classes["LinkedList"](), []
+
+    def expected(action, index, value):
+        if action == "append":
+            model.append(value)
+        elif action == "prepend":
+            model.insert(0, value)
+        elif action == "insert":
+            if not 0 <= index <= len(model):
+                return ("error", IndexError)
+            model.insert(index, value)
+        elif action == "lookup":
+            return ("ok", model[index]) if 0 <= index < len(model) else ("error", IndexError)
+        elif action in ("pop", "pop_first"):
+            if not model:
+                return ("error", IndexError)
+            return ("ok", model.pop() if action == "pop" else model.pop(0))
+        else:
+            return ("ok", model.index(value) if value in model else -1)
+        return ("ok", None)
+
+    for _ in range(OPERATIONS):
+        action = rng.choice(["append", "prepend", "insert", "lookup", "pop", "pop_first", "find"])
+        index = rng.randrange(-2, len(model) + 3)
+        value = rng.randrange(20)
+        args = {"append": (value,), "prepend": (value,), "insert": (index, value),
+                "lookup": (index,), "pop": (), "pop_first": (), "find": (value,)}[action]
+        result = outcome(lambda: getattr(linked_list, action)(*args))
+        assert result == expected(action, index, value), (action, args)
+    assert linked_list.to_list() == model
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_weighted_graph_matches_model(classes, seed, directed):
+    rng = random.Random(seed)
+    graph, model = classes["Graph"](directed), {}
+
+    def connect(v1, v2, weight):
+        model.setdefault(v1, {})
+        model.setdefault(v2, {})
+        model[v1][v2] = weight
+        if not directed:
+            model[v2][v1] = weight
+
+    def expected(action, v1, v2, weight):
+        if action == "add_edge":
+            connect(v1, v2, weight)
+            return ("ok", None)
+        if action == "remove_edge":
+            if v2 not in model.get(v1, {}):
+                return ("ok", False)
+            del model[v1][v2]
+            if not directed:
+                del model[v2][v1]
+            return ("ok", True)
+        if v1 not in model:
+            return ("ok", False)
+        del model[v1]
+        for neighbors in model.values():
+            neighbors.pop(v1, None)
+        return ("ok", True)
+
+    for _ in range(OPERATIONS):
+        v1, v2 = rng.sample(range(15), 2)  # No self-loops
+        weight = rng.randrange(1, 9)
+        action = rng.choice(["add_edge", "add_edge", "remove_edge", "remove_vertex"])
+        args = {"add_edge": (v1, v2, weight), "remove_edge": (v1, v2),
+                "remove_vertex": (v1,)}[action]
+        result = outcome(lambda: getattr(graph, action)(*args))
+        assert result == expected(action, v1, v2, weight), (action, args)
+    assert {v: sorted(neighbors) for v, neighbors in graph.adjacency.items()} == \
+        {v: sorted(neighbors.items()) for v, neighbors in model.items()}
+
+
+def test_accelerated_helpers_are_the_c_functions():
+    speedups = pytest.importorskip("Data_Structures._speedups")
+    from Data_Structures import _accelerated
+    assert _accelerated.HashTable._chain_index is speedups.chain_index
+    assert _accelerated.LinkedList._walk is speedups.walk
+    assert _accelerated.Graph._neighbor_index is speedups.neighbor_index
+    assert _accelerated.Array._index_search is speedups.index_search
+    for name, pure in PURE.items():
+        assert issubclass(getattr(_accelerated, name), pure)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_verify_parity(seed):
+    pytest.importorskip("Data_Structures._speedups")
+    from Data_Structures import _accelerated
+    _accelerated.verify_parity(operations=500, seed=seed)
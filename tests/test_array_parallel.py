@@ -0,0 +1,85 @@
+"""Tests for ParallelExecutor."""
+
+import operator
+import random
+
+import pytest
+
+from Data_Structures import Array, ParallelExecutor
+from Data_Structures.Array.Python.Array_Parallel import _numeric_typecode
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["shared", "pickled"])
+def executor(request):
+    with ParallelExecutor(workers=2, chunk_size=7, shared_memory=request.param) as executor:
+        yield executor
+
+
+def random_values(seed, count=100):
+    rng = random.Random(seed)
+    return [rng.randint(-1000, 1000) for _ in range(count)]
+
+
+def test_map_filter_reduce(executor):
+    values = random_values(1)
+    array = Array.from_iterable(values)
+    assert executor.map(array, operator.neg).to_list() == [-v for v in values]
+    assert executor.filter(array, bool).to_list() == [v for v in values if v]
+    assert executor.reduce(array, operator.add) == sum(values)
+    assert executor.reduce(array, operator.add, 10) == sum(values) + 10
+
+
+def test_reduce_keeps_chunk_order(executor):
+    array = Array.from_iterable(list("abcdefghijklmnopqrstuvwxyz"))
+    assert executor.reduce(array, operator.add) == "abcdefghijklmnopqrstuvwxyz"
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_numbers(executor, reverse):
+    values = random_values(2) + [0.5, -2.5]
+    floats = Array.from_iterable([float(v) for v in values])
+    assert executor.sort(floats, reverse=reverse).to_list() == \
+        sorted(map(float, values), reverse=reverse)
+    ints = Array.from_iterable(random_values(3))
+    assert executor.sort(ints, key=abs).to_list() == sorted(ints.to_list(), key=abs)
+
+
+def test_sort_is_stable(executor):
+    rng = random.Random(4)
+    pairs = [(rng.randrange(5), i) for i in range(60)]
+    result = executor.sort(Array.from_iterable(pairs), key=operator.itemgetter(0))
+    assert result.to_list() == sorted(pairs, key=operator.itemgetter(0))
+
+
+def test_views_and_empty_arrays(executor):
+    array = Array.from_iterable(range(50))
+    assert executor.map(array[10:20], operator.neg).to_list() == [-v for v in range(10, 20)]
+    empty = Array()
+    assert executor.map(empty, operator.neg).to_list() == []
+    assert executor.sort(empty).to_list() == []
+    assert executor.reduce(empty, operator.add, 0) == 0
+    with pytest.raises(TypeError):
+        executor.reduce(empty, operator.add)
+
+
+def test_the_original_array_is_unchanged(executor):
+    values = random_values(5)
+    array = Array.from_iterable(values)
+    executor.sort(array)
+    assert array.to_list() == values
+
+
+def test_numeric_typecode():
+    assert _numeric_typecode([1, 2, 3]) == 'q'
+    assert _numeric_typecode([1.0, 2.5]) == 'd'
+    assert _numeric_typecode([1, 2.0]) is None
+    assert _numeric_typecode([1 << 70]) is None
+    assert _numeric_typecode([True, False]) is None
+    assert _numeric_typecode([]) is None
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ParallelExecutor(workers=0)
+    with pytest.raises(ValueError):
+        ParallelExecutor(chunk_size=0)
@@ -0,0 +1,83 @@
+"""Tests for Array slicing views and copy-on-write clones."""
+
+import random
+
+import pytest
+
+from Data_Structures import Array, ArrayView
+
+
+def make_array(values):
+    return Array.from_iterable(values)
+
+
+@pytest.mark.parametrize("key", [
+    slice(None), slice(2, 8), slice(None, None, 3), slice(8, 1, -2),
+    slice(-4, None), slice(5, 5),
+])
+def test_slices_match_list(key):
+    array = make_array(range(10))
+    view = array[key]
+    assert isinstance(view, ArrayView)
+    assert view.to_list() == list(range(10))[key]
+    assert len(view) == view.length == len(range(10)[key])
+
+
+def test_views_of_views_share_the_parent():
+    array = make_array(range(20))
+    view = array.view(2, 18, 2)[1:5]
+    assert view.parent is array
+    assert view.to_list() == [4, 6, 8, 10]
+    assert view.get(0) == 4
+    with pytest.raises(KeyError):
+        view.get(4)
+    assert view.search(8) == 2
+    assert view.search(5) == -1
+
+
+def test_views_see_parent_changes_and_copies_do_not():
+    array = make_array([1, 2, 3])
+    view = array[:]
+    copy = view.copy()
+    array.insert(0, 0)
+    assert view.to_list() == [0, 1, 2]  # Same indices, new contents
+    assert copy.to_list() == [1, 2, 3]
+    assert isinstance(copy, Array)
+
+
+def test_clone_shares_storage_until_written():
+    array = make_array(range(5))
+    clone = array.clone()
+    assert clone.data is array.data
+    clone.push(5)
+    assert clone.data is not array.data
+    assert array.to_list() == [0, 1, 2, 3, 4]
+    assert clone.to_list() == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_clones_behave_like_independent_copies(seed):
+    rng = random.Random(seed)
+    arrays = [make_array(range(5))]
+    models = [list(range(5))]
+    for _ in range(500):
+        i = rng.randrange(len(arrays))
+        array, model = arrays[i], models[i]
+        action = rng.choice(["clone", "push", "pop", "insert", "delete"])
+        if action == "clone":
+            arrays.append(array.clone())
+            models.append(list(model))
+        elif action == "push":
+            array.push(rng.randrange(100))
+            model.append(array.get(array.length - 1))
+        elif model and action == "pop":
+            assert array.pop() == model.pop()
+        elif action == "insert":
+            index = rng.randrange(len(model) + 1)
+            array.insert(index, -index)
+            model.insert(index, -index)
+        elif model and action == "delete":
+            index = rng.randrange(len(model))
+            assert array.delete(index) == model.pop(index)
+    for array, model in zip(arrays, models):
+        assert array.to_list() == model
@@ -0,0 +1,79 @@
+"""Tests for the benchmark suite in Benchmarks/Python/Benchmark.py."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "Benchmarks" / "Python" / "Benchmark.py"
+
+
+def load_suite():
+    spec = importlib.util.spec_from_file_location("benchmark_suite", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+suite = load_suite()
+
+
+def test_workloads_are_reproducible():
+    assert suite.random_ints(100) == suite.random_ints(100)
+    assert suite.random_keys(100) == suite.random_keys(100)
+    assert suite.random_edges(10, 50, weighted=True) == suite.random_edges(10, 50, weighted=True)
+    assert suite.random_ints(100, seed=1) != suite.random_ints(100, seed=2)
+    assert sorted(suite.random_keys(50)) == sorted(f"key-{i}" for i in range(50))
+
+
+@pytest.mark.parametrize("name", sorted(suite.BENCHMARKS))
+def test_every_benchmark_runs_at_a_small_size(name):
+    factory, _ = suite.BENCHMARKS[name]
+    run = factory(50)
+    run()
+
+
+def test_run_suite_skips_sizes_above_the_limit():
+    limited = [name for name, (_, limit) in suite.BENCHMARKS.items() if limit]
+    assert limited
+    name = limited[0]
+    limit = suite.BENCHMARKS[name][1]
+    results = suite.run_suite([name], [10, limit + 1], repeat=2, warmup=0, memory=True)
+    assert list(results[name]) == ["10"]
+    stats = results[name]["10"]
+    assert stats["min"] <= stats["median"]
+    assert stats["repeat"] == 2
+    assert stats["peak_memory"] > 0
+
+
+def test_compare_flags_regressions_above_the_threshold():
+    baseline = {"A.op": {"10": {"min": 1.0}}, "B.op": {"10": {"min": 1.0}}}
+    results = {"A.op": {"10": {"min": 1.05}}, "B.op": {"10": {"min": 1.5}},
+               "C.op": {"10": {"min": 9.0}}}  # Not in the baseline
+    regressions = suite.compare(results, baseline, threshold=0.10)
+    assert regressions == [("B.op", 10, 1.5)]
+
+
+def test_command_line_writes_and_compares_results(tmp_path):
+    output = tmp_path / "results.json"
+    command = [sys.executable, str(SCRIPT), "--filter", "Deque", "--sizes", "20",
+               "--repeat", "1", "--warmup", "0", "--no-memory"]
+    subprocess.run(command + ["--output", str(output)], check=True,
+                   capture_output=True, cwd=tmp_path)
+    document = json.loads(output.read_text())
+    assert document["meta"]["seed"] == suite.SEED
+    assert set(document["results"]) == {"Deque.push_pop"}
+
+    # A baseline that is much faster than any real run triggers exit code 1
+    for by_size in document["results"].values():
+        for stats in by_size.values():
+            stats["min"] = 1e-12
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(document))
+    completed = subprocess.run(command + ["--baseline", str(baseline)],
+                               capture_output=True, text=True, cwd=tmp_path)
+    assert completed.returncode == 1
+    assert "REGRESSION" in completed.stdout
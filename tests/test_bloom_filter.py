@@ -0,0 +1,78 @@
+"""Tests for BloomFilter, CountingBloomFilter and their use in HashTable."""
+
+import pytest
+
+from Data_Structures import BloomFilter, CountingBloomFilter, HashTable
+from Data_Structures.Hash_Table.Python.Bloom_Filter import optimal_size
+
+
+def test_optimal_size():
+    slots, hashes = optimal_size(1000, 0.01)
+    assert 9500 < slots < 9700  # About 9.6 bits per key
+    assert hashes == 7
+    for bad in ((0, 0.01), (10, 0), (10, 1)):
+        with pytest.raises(ValueError):
+            optimal_size(*bad)
+
+
+@pytest.mark.parametrize("cls", [BloomFilter, CountingBloomFilter])
+def test_no_false_negatives_and_bounded_false_positives(cls):
+    bloom = cls(expected_items=2000, false_positive_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"in-{i}")
+    assert all(f"in-{i}" in bloom for i in range(2000))
+    false_positives = sum(bloom.might_contain(f"out-{i}") for i in range(20000))
+    assert false_positives / 20000 < 0.03
+    assert len(bloom) == 2000
+    assert bloom.false_positive_rate() == pytest.approx(0.01, rel=0.3)
+
+
+def test_clear():
+    bloom = BloomFilter(100)
+    bloom.add("x")
+    bloom.clear()
+    assert "x" not in bloom
+    assert len(bloom) == 0
+
+
+def test_counting_filter_removes_keys():
+    bloom = CountingBloomFilter(100)
+    bloom.add("a")
+    bloom.add("a")
+    bloom.add("b")
+    bloom.remove("a")
+    assert "a" in bloom  # Added twice, removed once
+    bloom.remove("a")
+    assert "a" not in bloom
+    assert "b" in bloom
+    assert len(bloom) == 1
+    with pytest.raises(KeyError):
+        bloom.remove("never-added")
+
+
+def test_counting_filter_counters_saturate():
+    bloom = CountingBloomFilter(10)
+    for _ in range(20):
+        bloom.add("hot")
+    positions = bloom._positions("hot")
+    assert all(bloom._counter(p) == 15 for p in positions)
+    for _ in range(20):
+        bloom.remove("hot")
+    assert "hot" in bloom  # Saturated counters are never decremented
+
+
+@pytest.mark.parametrize("cls", [BloomFilter, CountingBloomFilter])
+def test_hash_table_answers_misses_from_the_filter(cls):
+    table = HashTable(size=8, bloom_filter=cls(100))
+    for i in range(50):
+        table.insert(i, str(i))
+    assert table.get(7) == "7"
+    assert not table.contains("missing")
+    with pytest.raises(KeyError):
+        table.get("missing")
+    table.delete(7)
+    assert not table.contains(7)
+    with pytest.raises(KeyError):
+        table.delete(7)
+    if cls is CountingBloomFilter:
+        assert len(table.bloom_filter) == 49
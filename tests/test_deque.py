@@ -0,0 +1,102 @@
+"""Tests for the ring buffer Deque."""
+
+import collections
+import random
+
+import pytest
+
+from Data_Structures import Deque
+
+
+def run_against_model(deque, model, rng, steps=3000):
+    """Apply the same random operations to a Deque and a collections.deque."""
+    for step in range(steps):
+        action = rng.choice(["push_back", "push_front", "pop_front", "pop_back",
+                             "extend", "drain", "getitem"])
+        if action == "push_back":
+            deque.push_back(step)
+            model.append(step)
+        elif action == "push_front":
+            deque.push_front(step)
+            model.appendleft(step)
+        elif action == "extend":
+            values = list(range(step, step + rng.randrange(12)))
+            deque.extend(values)
+            model.extend(values)
+        elif action == "drain":
+            n = rng.randrange(6)
+            expected = [model.popleft() for _ in range(min(n, len(model)))]
+            assert deque.drain(n) == expected
+        elif action == "getitem" and model:
+            index = rng.randrange(-len(model), len(model))
+            assert deque[index] == model[index]
+        elif model and action == "pop_front":
+            assert deque.pop_front() == model.popleft()
+        elif model and action == "pop_back":
+            assert deque.pop_back() == model.pop()
+        assert len(deque) == len(model)
+        assert deque.peek_front() == (model[0] if model else None)
+        assert deque.peek_back() == (model[-1] if model else None)
+    assert list(deque) == list(model)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_growing_deque_matches_collections_deque(seed):
+    deque = Deque()
+    run_against_model(deque, collections.deque(), random.Random(seed))
+    buffer_size = len(deque._buffer)
+    assert buffer_size & (buffer_size - 1) == 0  # Always a power of two
+
+
+@pytest.mark.parametrize("capacity", [1, 5, 8, 13])
+def test_overwriting_deque_keeps_the_newest_elements(capacity):
+    deque = Deque(capacity=capacity, overwrite=True)
+    run_against_model(deque, collections.deque(maxlen=capacity), random.Random(capacity))
+    assert len(deque._buffer) >= capacity
+
+
+def test_fixed_capacity_rejects_overflow_and_stays_unchanged():
+    deque = Deque([1, 2, 3], capacity=4)
+    deque.push_front(0)
+    assert deque.is_full()
+    with pytest.raises(OverflowError):
+        deque.push_back(4)
+    with pytest.raises(OverflowError):
+        deque.push_front(-1)
+    deque.pop_back()
+    with pytest.raises(OverflowError):
+        deque.extend([7, 8])
+    assert list(deque) == [0, 1, 2]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Deque(capacity=0)
+    with pytest.raises(ValueError):
+        Deque(overwrite=True)
+    with pytest.raises(OverflowError):
+        Deque(range(5), capacity=3)
+    with pytest.raises(ValueError):
+        Deque([1]).drain(-1)
+
+
+def test_empty_deque():
+    deque = Deque()
+    with pytest.raises(IndexError):
+        deque.pop_front()
+    with pytest.raises(IndexError):
+        deque.pop_back()
+    with pytest.raises(IndexError):
+        deque[0]
+    assert deque.drain() == []
+    assert str(deque) == str(Deque([]))
+
+
+def test_popped_slots_are_cleared():
+    deque = Deque(range(6))
+    deque.pop_front()
+    deque.pop_back()
+    deque.drain(2)
+    assert sum(slot is not None for slot in deque._buffer) == len(deque) == 2
+    deque.clear()
+    assert deque._buffer == [None] * len(deque._buffer)
@@ -0,0 +1,156 @@
+"""Tests for DurableHashTable: logging, replay, compaction and corruption."""
+
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+import pytest
+
+from Data_Structures import DurableHashTable
+
+
+def contents(table):
+    return dict(pair for bucket in table.table for pair in bucket)
+
+
+def log_path(directory):
+    return os.path.join(directory, "wal.log")
+
+
+def append_record(log, record):
+    """Write a well-formed log record: length, CRC-32, operation and payload."""
+    log.write(struct.pack("<II", len(record), zlib.crc32(record)) + record)
+
+
+def test_changes_survive_reopening(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("a", 1)
+        table.insert("b", [2])
+        table.insert("a", 3)
+        table.delete("b")
+        with pytest.raises(KeyError):
+            table.delete("missing")  # Failed deletes are not logged
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {"a": 3}
+        assert table.replayed == table.log_records == 4
+
+
+def test_compaction_empties_the_log(tmp_path):
+    with DurableHashTable(tmp_path, compact_every=3) as table:
+        for i in range(7):
+            table.insert(i, i * i)
+        assert table.log_records == 1
+    assert os.path.exists(tmp_path / "snapshot.pkl")
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {i: i * i for i in range(7)}
+        assert table.replayed == 1
+
+
+def test_torn_last_record_is_truncated(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("kept", 1)
+    size = os.path.getsize(log_path(tmp_path))
+    with open(log_path(tmp_path), "ab") as log:
+        log.write(b"\x20\x00\x00\x00garbage")  # Cut short by a crash
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {"kept": 1}
+    assert os.path.getsize(log_path(tmp_path)) == size
+
+
+def test_bad_checksum_on_the_last_record_is_truncated(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("first", 1)
+        table.insert("last", 2)
+    with open(log_path(tmp_path), "r+b") as log:
+        log.seek(-1, os.SEEK_END)
+        log.write(b"\xff")
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {"first": 1}
+        assert table.replayed == 1
+
+
+def test_zero_padding_after_a_torn_record_is_truncated(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("kept", 1)
+    with open(log_path(tmp_path), "ab") as log:
+        log.write(bytes(64))  # Space allocated but never written
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {"kept": 1}
+
+
+def test_corrupt_record_in_the_middle_raises(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("first", 1)
+        first_size = os.path.getsize(log_path(tmp_path))
+        table.insert("second", 2)
+        table.insert("third", 3)
+    with open(log_path(tmp_path), "r+b") as log:
+        log.seek(first_size + 10)  # Inside the payload of the second record
+        log.write(b"\xff")
+    size = os.path.getsize(log_path(tmp_path))
+    with pytest.raises(ValueError, match="corrupt record"):
+        DurableHashTable(tmp_path)
+    assert os.path.getsize(log_path(tmp_path)) == size  # Nothing was dropped
+
+
+def test_unapplicable_records_are_skipped(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        table.insert("a", 1)
+    with open(log_path(tmp_path), "ab") as log:
+        append_record(log, b"D" + pickle.dumps("b"))  # Key already gone
+        append_record(log, b"I" + b"not a pickle")
+    with DurableHashTable(tmp_path) as table:
+        assert contents(table) == {"a": 1}
+        assert (table.replayed, table.skipped, table.log_records) == (2, 1, 3)
+
+
+def test_group_commit_counts_syncs(tmp_path):
+    with DurableHashTable(tmp_path / "every", sync_every=10) as table:
+        for i in range(25):
+            table.insert(i, i)
+        assert table.syncs == 2
+    assert table.syncs == 3  # close() syncs the rest
+    with DurableHashTable(tmp_path / "never", sync_every=None) as table:
+        for i in range(5):
+            table.insert(i, i)
+        assert table.syncs == 0
+
+
+def test_concurrent_inserts_count_every_record(tmp_path):
+    with DurableHashTable(tmp_path, size=64, sync_every=None, sync_interval=0.001) as table:
+        def worker(start):
+            for i in range(start, start + 200):
+                table.insert(i, i)
+
+        threads = [threading.Thread(target=worker, args=(n * 200,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert table.log_records == 800
+    with DurableHashTable(tmp_path, size=64) as table:
+        assert table.replayed == 800
+        assert contents(table) == {i: i for i in range(800)}
+
+
+def test_unhashable_keys_are_not_logged(tmp_path):
+    with DurableHashTable(tmp_path) as table:
+        with pytest.raises(TypeError):
+            table.insert(["list"], 1)
+        assert table.log_records == 0
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"sync_every": 0}, {"sync_interval": 0}, {"compact_every": -1},
+])
+def test_invalid_arguments(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        DurableHashTable(tmp_path, **kwargs)
+
+
+def test_bad_snapshot_raises(tmp_path):
+    (tmp_path / "snapshot.pkl").write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        DurableHashTable(tmp_path)
@@ -0,0 +1,72 @@
+"""Tests for the external merge sort."""
+
+import operator
+import random
+
+import pytest
+
+from Algorithms.Sorting.Python.External_Merge_Sort import external_sort, sort_file
+from Data_Structures import LinkedList
+
+
+def random_ints(seed, count):
+    rng = random.Random(seed)
+    return [rng.randrange(-10_000, 10_000) for _ in range(count)]
+
+
+@pytest.mark.parametrize("typecode", [None, 'q'])
+@pytest.mark.parametrize("run_size, fan_in", [(10_000, 64), (100, 64), (50, 2), (7, 3)])
+def test_matches_sorted(typecode, run_size, fan_in):
+    values = random_ints(run_size, 2000)
+    ordered = external_sort(iter(values), run_size=run_size, fan_in=fan_in,
+                            typecode=typecode)
+    assert list(ordered) == sorted(values)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_stable_with_key_across_merge_passes(reverse):
+    rng = random.Random(1)
+    records = [(rng.choice("ABCDE"), i) for i in range(1000)]
+    key = operator.itemgetter(0)
+    ordered = external_sort(records, key=key, reverse=reverse, run_size=30, fan_in=3)
+    assert list(ordered) == sorted(records, key=key, reverse=reverse)
+
+
+def test_floats_and_structures_as_input():
+    values = [random.Random(2).random() for _ in range(500)]
+    assert list(external_sort(values, run_size=64, typecode='d')) == sorted(values)
+    linked_list = LinkedList()
+    linked_list.extend(random_ints(3, 300))
+    assert list(external_sort(linked_list, run_size=40)) == sorted(linked_list)
+
+
+def test_empty_input_and_invalid_arguments():
+    assert list(external_sort([])) == []
+    with pytest.raises(ValueError):
+        list(external_sort([1], run_size=0))
+    with pytest.raises(ValueError):
+        list(external_sort([1], fan_in=1))
+
+
+def test_run_files_go_in_temp_dir_and_are_removed(tmp_path):
+    values = random_ints(4, 500)
+    ordered = external_sort(values, run_size=50, fan_in=4, temp_dir=tmp_path)
+    assert next(ordered) == min(values)
+    ordered.close()  # Abandoning the merge closes every run
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sort_file_in_place(tmp_path):
+    path = tmp_path / "words.txt"
+    words = [f"word-{i:04d}" for i in random.Random(5).sample(range(1000), 300)]
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    assert sort_file(path, path, run_size=25, fan_in=3) == 300
+    assert path.read_text(encoding="utf-8").splitlines() == sorted(words)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["words.txt"]
+
+
+def test_sort_file_with_key_into_another_file(tmp_path):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("b 2\na 3\nc 1\n", encoding="utf-8")
+    sort_file(source, target, key=lambda line: int(line.split()[1]), reverse=True)
+    assert target.read_text(encoding="utf-8") == "a 3\nb 2\nc 1\n"
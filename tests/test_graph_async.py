@@ -0,0 +1,172 @@
+"""Tests for AsyncGraph and GraphLoader."""
+
+import asyncio
+import random
+
+import pytest
+
+from Data_Structures import AsyncGraph, Graph, GraphLoader
+
+
+def ring(size, weighted=False):
+    graph = Graph()
+    for v in range(size):
+        if weighted:
+            graph.add_edge(v, (v + 1) % size, v + 1)
+        else:
+            graph.add_edge(v, (v + 1) % size)
+    return graph
+
+
+def sync_bfs(graph, start):
+    depths, frontier = {start: 0}, [start]
+    while frontier:
+        next_frontier = []
+        for v in frontier:
+            for neighbor in graph.get_neighbors(v):
+                if neighbor not in depths:
+                    depths[neighbor] = depths[v] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return depths
+
+
+def test_can_be_created_outside_the_loop():
+    graph = AsyncGraph(GraphLoader(ring(5), latency=0))  # No running loop yet
+    assert sorted(asyncio.run(graph.get_neighbors(0))) == [1, 4]
+
+
+def test_cache_hits_and_invalidation():
+    async def main():
+        loader = GraphLoader(ring(5), latency=0)
+        graph = AsyncGraph(loader)
+        first = await graph.get_neighbors(0)
+        assert await graph.get_neighbors(0) is first
+        assert (graph.hits, graph.misses, loader.calls) == (1, 1, 1)
+        graph.invalidate(0)
+        await graph.get_neighbors(0)
+        assert loader.calls == 2
+        graph.invalidate()
+        assert "cached=0" in str(graph)
+
+    asyncio.run(main())
+
+
+def test_same_iteration_requests_share_one_batch():
+    async def main():
+        loader = GraphLoader(ring(50), latency=0)
+        graph = AsyncGraph(loader, batch_size=64)
+        result = await graph.prefetch([0, 1, 2, 0, 1])
+        assert loader.calls == 1
+        assert loader.vertices_loaded == 3  # Duplicates share one load
+        assert set(result) == {0, 1, 2}
+
+    asyncio.run(main())
+
+
+def test_batches_are_split_and_concurrency_is_limited():
+    async def main():
+        loader = GraphLoader(ring(100), latency=0.01)
+        graph = AsyncGraph(loader, batch_size=10, max_concurrency=3)
+        await graph.prefetch(range(100))
+        assert loader.calls == 10
+        assert loader.max_active == 3
+
+    asyncio.run(main())
+
+
+def test_lru_cache_evicts_the_oldest():
+    async def main():
+        loader = GraphLoader(ring(10), latency=0)
+        graph = AsyncGraph(loader, cache_size=2)
+        for v in (0, 1, 0, 2):  # 1 is the least recently used when 2 arrives
+            await graph.get_neighbors(v)
+        calls = loader.calls
+        await graph.get_neighbors(0)
+        assert loader.calls == calls
+        await graph.get_neighbors(1)
+        assert loader.calls == calls + 1
+
+    asyncio.run(main())
+
+
+def test_unknown_vertices_have_no_neighbors():
+    async def main():
+        graph = AsyncGraph(GraphLoader(ring(3), latency=0))
+        assert await graph.get_neighbors("missing") == []
+
+    asyncio.run(main())
+
+
+def test_loader_errors_reach_every_waiter():
+    async def failing(vertices):
+        raise ConnectionError("service down")
+
+    async def main():
+        graph = AsyncGraph(failing)
+        results = await asyncio.gather(graph.get_neighbors(1), graph.get_neighbors(2),
+                                       return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+        with pytest.raises(ConnectionError):
+            await graph.get_neighbors(1)  # Failures are not cached
+
+    asyncio.run(main())
+
+
+def test_bad_loader_result_fails_the_batch():
+    async def returns_none(vertices):
+        return None
+
+    async def main():
+        graph = AsyncGraph(returns_none)
+        with pytest.raises(AttributeError):
+            await asyncio.wait_for(graph.get_neighbors(1), timeout=1)
+
+    asyncio.run(main())
+
+
+def test_cancelling_one_waiter_keeps_the_shared_load():
+    async def main():
+        loader = GraphLoader(ring(5), latency=0.02)
+        graph = AsyncGraph(loader)
+        first = asyncio.create_task(graph.get_neighbors(0))
+        second = asyncio.create_task(graph.get_neighbors(0))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        assert sorted(await second) == [1, 4]
+        assert loader.calls == 1
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_bfs_matches_synchronous_bfs(weighted):
+    rng = random.Random(5)
+    graph = ring(40, weighted=weighted)
+    for _ in range(30):
+        u, v = rng.sample(range(40), 2)
+        graph.add_edge(u, v, 1 if weighted else None)
+    unweighted = Graph()
+    for u, neighbors in graph.adjacency.items():
+        for n in neighbors:
+            unweighted.add_edge(u, n[0] if weighted else n)
+
+    async def main():
+        return await AsyncGraph(GraphLoader(graph, latency=0), batch_size=8).bfs(0)
+
+    assert asyncio.run(main()) == sync_bfs(unweighted, 0)
+
+
+def test_bfs_max_depth():
+    async def main():
+        return await AsyncGraph(GraphLoader(ring(10), latency=0)).bfs(0, max_depth=2)
+
+    assert asyncio.run(main()) == {0: 0, 1: 1, 9: 1, 2: 2, 8: 2}
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"batch_size": 0}, {"max_concurrency": 0}, {"batch_delay": -1}, {"cache_size": 0},
+])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        AsyncGraph(GraphLoader(ring(2)), **kwargs)
@@ -0,0 +1,122 @@
+"""Tests for GraphMatrix and the centrality measures (requires NumPy)."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Data_Structures import Graph, GraphMatrix  # noqa: E402
+
+
+def random_graph(seed, directed, weighted, vertices=30, edges=90):
+    rng = random.Random(seed)
+    graph = Graph(directed)
+    for v in range(vertices):
+        graph.add_vertex(v)
+    for _ in range(edges):
+        v1, v2 = rng.sample(range(vertices), 2)
+        if weighted:
+            graph.add_edge(v1, v2, rng.randint(1, 5))
+        else:
+            graph.add_edge(v1, v2)
+    return graph
+
+
+def dense_matrix(graph):
+    """Adjacency matrix A[s, t] = weight of s -> t, built the slow way."""
+    vertices = list(graph.adjacency)
+    index = {v: i for i, v in enumerate(vertices)}
+    matrix = np.zeros((len(vertices), len(vertices)))
+    for v, neighbors in graph.adjacency.items():
+        for neighbor in neighbors:
+            target, weight = neighbor if isinstance(neighbor, tuple) else (neighbor, 1.0)
+            matrix[index[v], index[target]] += weight
+    return vertices, matrix
+
+
+def reference_pagerank(graph, damping=0.85, jump=None):
+    vertices, matrix = dense_matrix(graph)
+    n = len(vertices)
+    jump = np.full(n, 1.0 / n) if jump is None else jump
+    out = matrix.sum(axis=1)
+    transition = np.divide(matrix, out[:, None], out=np.zeros_like(matrix),
+                           where=out[:, None] > 0)
+    scores = jump.copy()
+    for _ in range(1000):
+        scores = damping * (transition.T @ scores + scores[out == 0].sum() * jump) \
+            + (1 - damping) * jump
+    return dict(zip(vertices, scores))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_pagerank_matches_dense_reference(directed, weighted):
+    graph = random_graph(1, directed, weighted)
+    graph.add_vertex("isolated")  # A dangling vertex
+    scores = GraphMatrix(graph).pagerank(tol=1e-12, max_iter=1000)
+    expected = reference_pagerank(graph)
+    assert sum(scores.values()) == pytest.approx(1.0)
+    for vertex, value in expected.items():
+        assert scores[vertex] == pytest.approx(value, abs=1e-8)
+
+
+def test_personalized_pagerank_favours_the_seeds():
+    graph = random_graph(2, directed=False, weighted=False)
+    matrix = GraphMatrix(graph)
+    scores = matrix.personalized_pagerank([0], tol=1e-10, max_iter=1000)
+    assert max(scores, key=scores.get) == 0
+    jump = np.zeros(len(graph.adjacency))
+    jump[list(graph.adjacency).index(0)] = 1.0
+    expected = reference_pagerank(graph, jump=jump)
+    for vertex, value in expected.items():
+        assert scores[vertex] == pytest.approx(value, abs=1e-7)
+
+
+def test_unweighted_matrix_ignores_weights():
+    graph = random_graph(3, directed=True, weighted=True)
+    matrix = GraphMatrix(graph, weighted=False)
+    assert set(matrix.weights.tolist()) == {1.0}
+    assert matrix.out_degrees().sum() == matrix.sources.size
+
+
+def test_degree_centrality():
+    graph = Graph(directed=True)
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c")
+    graph.add_edge("b", "c")
+    matrix = GraphMatrix(graph)
+    assert matrix.degree_centrality("out") == {"a": 1.0, "b": 0.5, "c": 0.0}
+    assert matrix.degree_centrality("in") == {"a": 0.0, "b": 0.5, "c": 1.0}
+    assert matrix.degree_centrality("both") == {"a": 1.0, "b": 1.0, "c": 1.0}
+    with pytest.raises(ValueError):
+        matrix.degree_centrality("sideways")
+
+
+def test_eigenvector_centrality_matches_numpy():
+    graph = random_graph(4, directed=False, weighted=False)
+    scores = GraphMatrix(graph).eigenvector_centrality(tol=1e-12, max_iter=10_000)
+    vertices, matrix = dense_matrix(graph)
+    values, vectors = np.linalg.eigh(matrix)
+    principal = np.abs(vectors[:, np.argmax(values)])
+    for vertex, value in zip(vertices, principal):
+        assert scores[vertex] == pytest.approx(value, abs=1e-5)
+
+
+def test_errors():
+    graph = Graph()
+    graph.add_vertex("a")
+    matrix = GraphMatrix(graph)
+    with pytest.raises(ValueError):
+        matrix.eigenvector_centrality()
+    with pytest.raises(ValueError):
+        matrix.pagerank(damping=1.5)
+    with pytest.raises(KeyError):
+        matrix.pagerank(personalization={"missing": 1})
+    with pytest.raises(ValueError):
+        matrix.personalized_pagerank([])
+    assert GraphMatrix(Graph()).pagerank() == {}
+    negative = Graph(directed=True)
+    negative.add_edge("a", "b", -1)
+    with pytest.raises(ValueError):
+        GraphMatrix(negative)
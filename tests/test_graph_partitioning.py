@@ -0,0 +1,135 @@
+"""Tests for the graph partitioners and the partitioned parallel BFS."""
+
+import math
+import random
+from collections import deque
+
+import pytest
+
+from Algorithms.Graphs.Python.Graph_Partitioning import (
+    PartitionedGraph, edge_cut, hash_partition, label_propagation_partition)
+from Data_Structures.Graphs.Python.Graphs import Graph
+
+
+def grid(side):
+    graph = Graph()
+    for v in range(side * side):
+        graph.add_vertex(v)
+    for x in range(side):
+        for y in range(side):
+            v = x * side + y
+            if x + 1 < side:
+                graph.add_edge(v, v + side)
+            if y + 1 < side:
+                graph.add_edge(v, v + 1)
+    return graph
+
+
+def random_graph(seed, directed=False, size=60, edges=120):
+    rng = random.Random(seed)
+    graph = Graph(directed)
+    for v in range(size):
+        graph.add_vertex(v)
+    for _ in range(edges):
+        u, v = rng.sample(range(size), 2)
+        graph.add_edge(u, v, rng.randint(1, 5))
+    return graph
+
+
+def bfs_depths(graph, start, max_depth=None):
+    depths, queue = {start: 0}, deque([start])
+    while queue:
+        v = queue.popleft()
+        if max_depth is not None and depths[v] >= max_depth:
+            continue
+        for entry in graph.get_neighbors(v):
+            neighbor = entry[0] if isinstance(entry, tuple) else entry
+            if neighbor not in depths:
+                depths[neighbor] = depths[v] + 1
+                queue.append(neighbor)
+    return depths
+
+
+def test_hash_partition_is_stable_and_in_range():
+    graph = grid(6)
+    parts = hash_partition(graph, 4)
+    assert set(parts) == set(graph.adjacency)
+    assert set(parts.values()) <= set(range(4))
+    assert hash_partition(graph, 4) == parts
+
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_label_propagation_respects_capacity(k):
+    graph = grid(10)
+    imbalance = 0.1
+    parts = label_propagation_partition(graph, k, imbalance=imbalance, seed=1)
+    capacity = math.ceil(len(parts) / k * (1 + imbalance))
+    sizes = [list(parts.values()).count(p) for p in range(k)]
+    assert max(sizes) <= capacity
+    assert sum(sizes) == 100
+
+
+def test_label_propagation_cuts_fewer_edges_than_hashing():
+    graph = grid(12)
+    hashed = edge_cut(graph, hash_partition(graph, 4))
+    propagated = edge_cut(graph, label_propagation_partition(graph, 4, seed=2))
+    assert propagated < hashed
+
+
+def test_label_propagation_is_reproducible():
+    graph = random_graph(3, directed=True)
+    assert label_propagation_partition(graph, 3, seed=7) == \
+        label_propagation_partition(graph, 3, seed=7)
+
+
+def test_edge_cut_counts_undirected_edges_once():
+    graph = Graph()
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "c")
+    graph.add_edge("c", "a")
+    assert edge_cut(graph, {"a": 0, "b": 0, "c": 1}) == 2
+    directed = Graph(directed=True)
+    directed.add_edge("a", "b")
+    directed.add_edge("b", "a")
+    assert edge_cut(directed, {"a": 0, "b": 1}) == 2
+
+
+@pytest.mark.parametrize("partitioner", [hash_partition, label_propagation_partition])
+def test_invalid_arguments(partitioner):
+    with pytest.raises(ValueError):
+        partitioner(grid(2), 0)
+    with pytest.raises(ValueError):
+        label_propagation_partition(grid(2), 2, imbalance=-0.1)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_parallel_bfs_matches_sequential_bfs(directed):
+    graph = random_graph(4, directed=directed)
+    parts = label_propagation_partition(graph, 3)
+    with PartitionedGraph(graph, parts) as partitioned:
+        for start in (0, 17):
+            depths, stats = partitioned.bfs(start)
+            assert depths == bfs_depths(graph, start)
+            assert list(depths.values()) == sorted(depths.values())
+            assert sum(level["visited"] for level in stats["levels"]) == len(depths)
+            assert stats["edge_cut"] == edge_cut(graph, parts)
+        depths, _ = partitioned.bfs(0, max_depth=2)
+        assert depths == bfs_depths(graph, 0, max_depth=2)
+
+
+def test_parallel_bfs_stats_on_a_grid():
+    graph = grid(8)
+    with PartitionedGraph(graph, hash_partition(graph, 2)) as partitioned:
+        depths, stats = partitioned.bfs(0)
+    assert depths[63] == 14
+    assert len(stats["levels"]) == 15
+    assert sum(level["vertices_sent"] for level in stats["levels"]) > 0
+
+
+def test_missing_parts_and_unknown_start_raise():
+    graph = grid(2)
+    with pytest.raises(KeyError):
+        PartitionedGraph(graph, {0: 0, 1: 0})
+    with PartitionedGraph(graph, {v: 0 for v in range(4)}) as partitioned:
+        with pytest.raises(KeyError):
+            partitioned.bfs("missing")
@@ -0,0 +1,146 @@
+"""Tests for SubgraphView, EdgeFilterView and ReversedView."""
+
+import random
+
+import pytest
+
+from Algorithms.Graphs.Python.Minimum_Spanning_Tree import kruskal_edges
+from Data_Structures import EdgeFilterView, Graph, ReversedView, SubgraphView
+
+
+def random_graph(seed, directed=False, weighted=True, size=20, edges=60):
+    rng = random.Random(seed)
+    graph = Graph(directed)
+    for v in range(size):
+        graph.add_vertex(v)
+    for _ in range(edges):
+        u, v = rng.sample(range(size), 2)
+        graph.add_edge(u, v, rng.randint(1, 9) if weighted else None)
+    return graph
+
+
+def target(entry):
+    return entry[0] if isinstance(entry, tuple) else entry
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_subgraph_matches_copied_subgraph(directed, weighted):
+    graph = random_graph(1, directed, weighted)
+    selected = [0, 3, 5, 7, 11, 19, 42]  # 42 isn't in the graph
+    view = SubgraphView(graph, selected)
+    assert view.get_vertices() == [0, 3, 5, 7, 11, 19]
+    assert not view.has_vertex(42) and not view.has_vertex(1)
+    for v in view.get_vertices():
+        expected = [e for e in graph.get_neighbors(v) if target(e) in selected]
+        assert list(view.get_neighbors(v)) == expected
+    assert list(view.get_neighbors(1)) == []
+    assert len(view) == 6
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_edge_filter_matches_predicate(weighted):
+    graph = random_graph(2, weighted=weighted)
+
+    def light(v1, v2, weight):
+        return (weight if weighted else v1 + v2) < 5
+
+    view = EdgeFilterView(graph, light)
+    assert view.get_vertices() == graph.get_vertices()
+    for v in graph.get_vertices():
+        expected = [e for e in graph.get_neighbors(v)
+                    if light(v, target(e), e[1] if weighted else None)]
+        assert view.get_neighbors(v) == expected
+
+
+def test_neighbor_sequences_are_lazy_and_list_like():
+    graph = Graph()
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(0, 3)
+    calls = []
+
+    def predicate(v1, v2, weight):
+        calls.append(v2)
+        return v2 != 2
+
+    neighbors = EdgeFilterView(graph, predicate).get_neighbors(0)
+    assert calls == []  # Nothing is filtered until the sequence is read
+    assert neighbors == [1, 3]
+    assert len(neighbors) == 2 and neighbors
+    assert neighbors[0] == 1 and neighbors[-1] == 3 and neighbors[:1] == [1]
+    assert list(reversed(neighbors)) == [3, 1]
+    assert 3 in neighbors and 2 not in neighbors
+    assert repr(neighbors) == "[1, 3]"
+    with pytest.raises(IndexError):
+        neighbors[2]
+    with pytest.raises(IndexError):
+        neighbors[-3]
+    assert not SubgraphView(graph, [1, 2]).get_neighbors(1)
+
+
+def test_views_see_later_changes_to_the_parent():
+    graph = Graph()
+    graph.add_edge("a", "b", 1)
+    subgraph = SubgraphView(graph, ["a", "b", "c"])
+    light = EdgeFilterView(graph, lambda v1, v2, w: w < 5)
+    neighbors = light.get_neighbors("a")
+    graph.add_edge("a", "c", 2)
+    graph.add_edge("a", "d", 9)
+    assert neighbors == [("b", 1), ("c", 2)]  # Read through at iteration time
+    assert subgraph.get_edges() == [("a", "b", 1), ("a", "c", 2)]
+    graph.remove_edge("a", "b")
+    assert light.get_neighbors("a") == [("c", 2)]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_reversed_view_is_the_transpose(weighted):
+    graph = random_graph(3, directed=True, weighted=weighted)
+    view = ReversedView(graph)
+    for v in graph.get_vertices():
+        for entry in graph.get_neighbors(v):
+            back = (v, entry[1]) if weighted else v
+            assert back in view.get_neighbors(target(entry))
+    assert len(view.get_edges()) == len(graph.get_edges())
+
+
+def test_reversed_view_needs_refresh_after_parent_changes():
+    graph = Graph(directed=True)
+    graph.add_edge("a", "b")
+    view = ReversedView(graph)
+    assert view.get_neighbors("b") == ["a"]
+    graph.add_edge("c", "b")
+    assert view.get_neighbors("b") == ["a"]  # Cached incoming index
+    view.refresh()
+    assert view.get_neighbors("b") == ["a", "c"]
+
+
+def test_reversed_view_of_undirected_graph_reads_through():
+    graph = Graph()
+    graph.add_edge(1, 2)
+    view = ReversedView(graph)
+    graph.add_edge(1, 3)
+    assert view.get_neighbors(1) == [2, 3]
+
+
+def test_stacked_views_and_to_graph():
+    graph = random_graph(4, directed=True)
+    view = ReversedView(SubgraphView(graph, range(10)))
+    copy = view.to_graph()
+    assert type(copy) is Graph and copy.directed
+    assert set(copy.get_vertices()) == set(range(10))
+    for v in range(10):
+        assert sorted(copy.get_neighbors(v)) == sorted(view.get_neighbors(v))
+        assert isinstance(copy.adjacency[v], list)
+
+
+def test_adjacency_mapping_and_algorithms_run_on_views():
+    graph = random_graph(5)
+    view = SubgraphView(EdgeFilterView(graph, lambda v1, v2, w: w < 7), range(12))
+    assert list(view.adjacency) == list(range(12))
+    assert 3 in view.adjacency and 15 not in view.adjacency
+    with pytest.raises(KeyError):
+        view.adjacency[15]
+    expected = sum(w for *_, w in kruskal_edges(view.to_graph()))
+    assert sum(w for *_, w in kruskal_edges(view)) == expected
+    assert "0:" in str(view)
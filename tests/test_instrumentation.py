@@ -0,0 +1,114 @@
+"""Tests for the opt-in instrumentation layer."""
+
+import pytest
+
+from Data_Structures.Array.Python.Array import Array
+from Data_Structures.Graphs.Python.Graphs import Graph
+from Data_Structures.Hash_Table.Python.Hash_Table import HashTable
+from Data_Structures.Linked_Lists.Python.Linked_Lists import LinkedList
+from Instrumentation.Python.Instrumentation import Instrumentation, LatencyHistogram
+
+
+def test_disabled_classes_run_their_original_methods():
+    original = LinkedList.append
+    instrumentation = Instrumentation()
+    with instrumentation.enabled(LinkedList):
+        assert instrumentation.is_enabled(LinkedList)
+        assert LinkedList.append is not original
+    assert LinkedList.append is original
+    assert not instrumentation.is_enabled(LinkedList)
+
+
+def test_inherited_methods_are_restored_by_removing_the_wrapper():
+    class Child(LinkedList):
+        pass
+
+    instrumentation = Instrumentation()
+    with instrumentation.enabled(Child):
+        assert "append" in Child.__dict__
+    assert "append" not in Child.__dict__
+    assert Child.append is LinkedList.append
+
+
+def test_calls_and_latencies_are_recorded():
+    instrumentation = Instrumentation()
+    linked_list = LinkedList()
+    with instrumentation.enabled(LinkedList):
+        for i in range(5):
+            linked_list.append(i)
+        assert linked_list.lookup(3) == 3
+    linked_list.append(5)  # Not counted once disabled
+    assert instrumentation.calls[("LinkedList", "append")] == 5
+    histogram = instrumentation.latencies[("LinkedList", "append")]
+    assert histogram.count == 5
+    assert instrumentation.counters[("LinkedList", "lookup", "nodes_traversed")] == 3
+
+
+def test_structure_counters():
+    instrumentation = Instrumentation()
+    array, graph = Array(), Graph()
+    table = HashTable(size=1)
+    with instrumentation.enabled(Array, Graph, HashTable):
+        for i in range(4):
+            array.push(i)
+        array.insert(1, 99)  # Shifts 3 elements
+        array.delete(0)      # Shifts 4 elements
+        graph.add_edge("a", "b")
+        graph.add_edge("a", "c")  # Scans the one existing edge of "a"
+        table.insert("x", 1)
+        table.insert("y", 2)      # One entry already in the only bucket
+    counters = instrumentation.counters
+    assert counters[("Array", "insert", "shifts")] == 3
+    assert counters[("Array", "delete", "shifts")] == 4
+    assert counters[("Graph", "add_edge", "edges_scanned")] == 1
+    assert counters[("HashTable", "insert", "chain_length")] == 1
+    assert instrumentation.bucket_hits["HashTable"][0] == 2
+
+
+def test_failing_probe_does_not_change_the_method():
+    def broken(*args, **kwargs):
+        raise RuntimeError("probe bug")
+
+    instrumentation = Instrumentation(probes={"LinkedList": {"append": broken}})
+    linked_list = LinkedList()
+    with instrumentation.enabled(LinkedList, methods=["append"]):
+        linked_list.append(1)
+    assert list(linked_list) == [1]
+    assert instrumentation.calls[("LinkedList", "append")] == 1
+
+
+def test_reset_clears_metrics_in_place():
+    instrumentation = Instrumentation()
+    with instrumentation.enabled(LinkedList, methods=["append"]):
+        LinkedList().append(1)
+        instrumentation.reset()
+        assert instrumentation.latencies[("LinkedList", "append")].count == 0
+        LinkedList().append(2)
+    assert instrumentation.calls[("LinkedList", "append")] == 1
+
+
+def test_histogram_quantiles():
+    histogram = LatencyHistogram(bounds=(1.0, 2.0, 3.0))
+    for seconds in (0.5, 1.5, 1.5, 2.5):
+        histogram.observe(seconds)
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(6.0)
+    assert 1.0 <= histogram.quantile(0.5) <= 2.0
+    assert histogram.quantile(0.99) <= 3.0
+
+
+def test_exports():
+    instrumentation = Instrumentation()
+    table = HashTable(size=4)
+    with instrumentation.enabled(HashTable, methods=["insert"]):
+        table.insert("k", "v")
+    report = instrumentation.to_dict()
+    entry = report["HashTable"]["methods"]["insert"]
+    assert entry["calls"] == 1
+    assert entry["latency"]["count"] == 1
+    assert report["HashTable"]["hot_buckets"][0]["hits"] == 1
+
+    text = instrumentation.to_prometheus(prefix="t")
+    assert 't_calls_total{structure="HashTable",method="insert"} 1' in text
+    assert 't_latency_seconds_bucket{structure="HashTable",method="insert",le="+Inf"} 1' in text
+    assert "# TYPE t_work_total counter" in text
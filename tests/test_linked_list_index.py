@@ -0,0 +1,125 @@
+"""Tests for the LinkedList PositionIndex and Cursor."""
+
+import random
+
+import pytest
+
+from Data_Structures.Linked_Lists.Python.Linked_Lists import LinkedList, PositionIndex
+
+
+def check_index(linked_list):
+    """Check that every block of the index starts at the right node."""
+    index = linked_list.index
+    assert index.length == linked_list.length == sum(index.sizes)
+    assert all(size > 0 for size in index.sizes)
+    node = linked_list.head
+    for start, size in zip(index.starts, index.sizes):
+        assert start is node
+        for _ in range(size):
+            node = node.next
+    assert node is None
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_random_operations_match_a_list(indexed):
+    rng = random.Random(27)
+    linked_list = LinkedList(indexed=indexed)
+    reference = []
+    for _ in range(3000):
+        action = rng.random()
+        if action < 0.45:
+            index = rng.randint(0, len(reference))
+            value = rng.randrange(1000)
+            linked_list.insert(index, value)
+            reference.insert(index, value)
+        elif action < 0.6 and reference:
+            assert linked_list.pop() == reference.pop()
+        elif action < 0.75 and reference:
+            assert linked_list.pop_first() == reference.pop(0)
+        elif reference:
+            index = rng.randrange(len(reference))
+            assert linked_list.lookup(index) == reference[index]
+        if indexed and rng.random() < 0.05:
+            check_index(linked_list)
+    assert linked_list.to_list() == reference
+    if indexed:
+        check_index(linked_list)
+
+
+def test_out_of_range_positions_raise():
+    linked_list = LinkedList(indexed=True)
+    linked_list.extend(range(5))
+    for index in (-1, 5):
+        with pytest.raises(IndexError):
+            linked_list.lookup(index)
+    with pytest.raises(IndexError):
+        linked_list.insert(6, "x")
+
+
+def test_index_rebuilds_as_the_list_grows_and_shrinks():
+    linked_list = LinkedList(indexed=True)
+    for i in range(5000):
+        linked_list.append(i)
+    assert linked_list.index.block_size >= 64
+    check_index(linked_list)
+    while linked_list.length > 10:
+        linked_list.pop()
+    assert linked_list.index.block_size == PositionIndex.MIN_BLOCK_SIZE
+    check_index(linked_list)
+
+
+def test_build_and_drop_index():
+    linked_list = LinkedList()
+    linked_list.extend(range(1000))
+    linked_list.build_index()
+    check_index(linked_list)
+    assert linked_list.lookup(777) == 777
+    linked_list.drop_index()
+    assert linked_list.index is None
+    assert linked_list.lookup(777) == 777
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_cursor_walks_reads_and_writes(indexed):
+    linked_list = LinkedList(indexed=indexed)
+    linked_list.extend(range(100))
+    cursor = linked_list.cursor(10)
+    assert cursor.get() == 10
+    cursor.advance(5)
+    assert (cursor.position, cursor.get()) == (15, 15)
+    cursor.set("fifteen")
+    assert linked_list.lookup(15) == "fifteen"
+    cursor.move_to(3)
+    assert cursor.get() == 3
+
+    cursor.insert_after("new")
+    assert cursor.get() == 3
+    assert linked_list.to_list()[3:6] == [3, "new", 4]
+    assert linked_list.length == 101
+
+    cursor.move_to(100)
+    assert not cursor.has_next()
+    cursor.insert_after("last")
+    assert linked_list.tail.data == "last"
+    if indexed:
+        check_index(linked_list)
+
+
+def test_cursor_follows_changes_made_elsewhere():
+    linked_list = LinkedList(indexed=True)
+    linked_list.extend(range(10))
+    cursor = linked_list.cursor(5)
+    linked_list.insert(0, "front")
+    assert cursor.get() == 4  # Same position, new element
+    linked_list.pop_first()
+    assert cursor.get() == 5
+
+
+def test_cursor_out_of_range_raises():
+    linked_list = LinkedList()
+    linked_list.extend(range(3))
+    with pytest.raises(IndexError):
+        linked_list.cursor(3)
+    cursor = linked_list.cursor(2)
+    with pytest.raises(IndexError):
+        cursor.advance()
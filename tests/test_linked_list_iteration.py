@@ -0,0 +1,119 @@
+"""Tests for LinkedList iteration, slicing and the streaming operations."""
+
+import random
+
+import pytest
+
+from Data_Structures import LinkedList
+
+
+def make_list(values, indexed=False):
+    linked_list = LinkedList(indexed=indexed)
+    linked_list.extend(values)
+    return linked_list
+
+
+def check_links(linked_list):
+    """Assert that the tail, the length and the index agree with the chain."""
+    node, last, count = linked_list.head, None, 0
+    while node:
+        last, node = node, node.next
+        count += 1
+    assert linked_list.tail is last
+    assert linked_list.length == count
+    if linked_list.index is not None:
+        for i in range(count):
+            assert linked_list._node_at(i) is linked_list._walk(linked_list.head, i)
+
+
+def test_iteration_and_reversed():
+    linked_list = make_list(range(1000))
+    assert list(linked_list) == list(range(1000))
+    assert list(reversed(linked_list)) == list(range(999, -1, -1))
+    assert list(reversed(LinkedList())) == []
+
+
+@pytest.mark.parametrize("key", [
+    slice(None), slice(3, 15), slice(None, None, 4), slice(17, 2, -3),
+    slice(None, None, -1), slice(-5, None), slice(5, 5), slice(30, 40),
+])
+def test_slices_match_list(key):
+    linked_list = make_list(range(20))
+    assert list(linked_list[key]) == list(range(20))[key]
+
+
+def test_negative_indices():
+    linked_list = make_list("abc")
+    assert linked_list[-1] == "c"
+    assert linked_list[-3] == "a"
+    with pytest.raises(IndexError):
+        linked_list[-4]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_extend_from_generator(indexed):
+    linked_list = make_list([0, 1], indexed=indexed)
+    linked_list.extend(i for i in range(2, 50))
+    assert list(linked_list) == list(range(50))
+    check_links(linked_list)
+
+
+def test_extend_leaves_list_unchanged_when_iterable_raises():
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    linked_list = make_list([0])
+    with pytest.raises(RuntimeError):
+        linked_list.extend(failing())
+    assert list(linked_list) == [0]
+    check_links(linked_list)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_concat_moves_all_nodes(indexed):
+    left = make_list(range(5), indexed=indexed)
+    right = make_list(range(5, 12), indexed=indexed)
+    right_head = right.head
+    left.concat(right)
+    assert list(left) == list(range(12))
+    assert left._walk(left.head, 5) is right_head
+    assert len(right) == 0 and right.head is None
+    check_links(left)
+    with pytest.raises(ValueError):
+        left.concat(left)
+
+
+@pytest.mark.parametrize("index", [0, 3, 5])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_splice(index, indexed):
+    target = make_list(range(5), indexed=indexed)
+    target.splice(index, make_list(["a", "b"]))
+    expected = list(range(5))
+    expected[index:index] = ["a", "b"]
+    assert list(target) == expected
+    check_links(target)
+    with pytest.raises(IndexError):
+        target.splice(99, make_list([1]))
+
+
+def test_merge_sorted_is_stable():
+    left = make_list([(1, "l"), (3, "l"), (5, "l")])
+    right = make_list([(1, "r"), (2, "r"), (5, "r"), (8, "r")])
+    left.merge_sorted(right, key=lambda pair: pair[0])
+    assert list(left) == [(1, "l"), (1, "r"), (2, "r"), (3, "l"),
+                          (5, "l"), (5, "r"), (8, "r")]
+    assert len(right) == 0
+    check_links(left)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_sort_matches_sorted(reverse, indexed):
+    rng = random.Random(7)
+    values = [(rng.randint(0, 20), i) for i in range(500)]
+    linked_list = make_list(values, indexed=indexed)
+    linked_list.sort(key=lambda pair: pair[0], reverse=reverse)
+    assert list(linked_list) == sorted(values, key=lambda pair: pair[0],
+                                       reverse=reverse)
+    check_links(linked_list)
@@ -0,0 +1,116 @@
+"""Tests for the memory-mapped MappedArray."""
+
+from array import array
+
+import pytest
+
+from Data_Structures import MappedArray
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "numbers.dsa"
+
+
+def test_push_get_set_pop(path):
+    with MappedArray(path, 'q', capacity=2) as numbers:
+        for i in range(10):  # Grows the file past its capacity
+            numbers.push(i * i)
+        assert len(numbers) == 10
+        assert numbers.get(3) == 9
+        numbers.set(3, -1)
+        assert numbers[3] == -1
+        assert numbers[-1] == 81
+        assert numbers.pop() == 81
+        assert list(numbers) == [0, 1, 4, -1, 16, 25, 36, 49, 64]
+        with pytest.raises(KeyError):
+            numbers.get(9)
+        with pytest.raises(IndexError):
+            numbers[9]
+
+
+def test_pop_from_empty_array_raises(path):
+    with MappedArray(path) as numbers:
+        with pytest.raises(KeyError):
+            numbers.pop()
+
+
+def test_reopen_keeps_the_elements(path):
+    with MappedArray(path, 'd') as numbers:
+        numbers.push_many([1.5, 2.5, 3.5])
+    size = path.stat().st_size
+    with MappedArray(path, 'd') as numbers:
+        assert list(numbers) == [1.5, 2.5, 3.5]
+        numbers.push(4.5)
+    assert path.stat().st_size > size
+    with pytest.raises(ValueError):
+        MappedArray(path, 'q')  # Different type code
+
+
+def test_rejects_other_files_and_bad_arguments(tmp_path):
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not an array" * 10)
+    with pytest.raises(ValueError):
+        MappedArray(other)
+    with pytest.raises(ValueError):
+        MappedArray(tmp_path / "a.dsa", typecode='u')
+    with pytest.raises(ValueError):
+        MappedArray(tmp_path / "b.dsa", capacity=0)
+
+
+def test_push_many_from_buffers_and_iterables(path):
+    with MappedArray(path, 'i', capacity=4) as numbers:
+        numbers.push_many(array('i', range(5)))
+        numbers.push_many(array('i', [5, 6]).tobytes())
+        numbers.push_many(x for x in range(7, 10))
+        assert list(numbers) == list(range(10))
+        with pytest.raises(ValueError):
+            numbers.push_many(b"\x00\x01\x02")
+
+
+def test_slices_are_zero_copy_views(path):
+    with MappedArray(path, 'q') as numbers:
+        numbers.push_many(range(10))
+        with numbers[2:5] as view:
+            view[0] = 100
+        assert numbers.get(2) == 100
+        assert numbers.view(8).tolist() == [8, 9]
+
+
+def test_growing_while_a_view_is_alive_raises(path):
+    with MappedArray(path, 'q', capacity=2) as numbers:
+        numbers.push_many([1, 2])
+        view = numbers[0:1]
+        with pytest.raises(BufferError):
+            numbers.push(3)
+        assert list(numbers) == [1, 2]  # Still usable
+        view.release()
+        numbers.push(3)
+        assert len(numbers) == 3
+
+
+@pytest.mark.parametrize("typecode", ['b', 'H', 'q', 'd'])
+def test_search(path, typecode):
+    with MappedArray(path, typecode) as numbers:
+        numbers.push_many([1, 2, 3, 2])
+        assert numbers.search(2) == 1
+        assert numbers.search(9) == -1
+        assert numbers.search(10 ** 30) == -1
+
+
+def test_search_ignores_misaligned_matches(path):
+    with MappedArray(path, 'H') as numbers:
+        numbers.push_many([0x0100, 0x0001])  # Bytes 00 01 01 00
+        assert numbers.search(0x0101) == -1
+
+
+def test_chunks_cover_the_array(path):
+    with MappedArray(path, 'q') as numbers:
+        numbers.push_many(range(1000))
+        starts = []
+        values = []
+        for start, chunk in numbers.chunks(chunk_size=300):
+            starts.append(start)
+            values.extend(chunk.tolist())
+        assert starts == [0, 300, 600, 900]
+        assert values == list(range(1000))
@@ -0,0 +1,84 @@
+"""Tests for the memory_usage reports and for running the modules as scripts."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from Data_Structures import ArrayStack, Graph, HashTable, LinkedList, LinkedListStack
+from Data_Structures._memory import MemoryUsage
+from Data_Structures.Array.Python.Array import Array
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = [
+    "Data_Structures/Stacks/Python/Stack_Array.py",
+    "Data_Structures/Stacks/Python/Stack_LinkedList.py",
+    "Data_Structures/Graphs/Python/Graphs.py",
+    "Data_Structures/Array/Python/Array.py",
+    "Data_Structures/Linked_Lists/Python/Linked_Lists.py",
+    "Data_Structures/Hash_Table/Python/Hash_Table.py",
+]
+
+
+def fill(structure, values):
+    """Add values to any of the measured structures."""
+    if isinstance(structure, Graph):
+        for i, value in enumerate(values):
+            structure.add_edge(value, i, i)
+    elif isinstance(structure, HashTable):
+        for i, value in enumerate(values):
+            structure.insert(i, value)
+    elif isinstance(structure, LinkedList):
+        structure.extend(values)
+    else:
+        for value in values:
+            structure.push(value)
+    return structure
+
+
+STRUCTURES = [ArrayStack, LinkedListStack, Graph, Array, LinkedList, HashTable]
+
+
+@pytest.mark.parametrize("cls", STRUCTURES)
+def test_report_is_the_shared_memory_usage_class(cls):
+    usage = cls().memory_usage()
+    assert type(usage) is MemoryUsage  # Not a second copy imported by path
+    assert usage.name == cls.__name__
+    assert usage.total_bytes == usage.overhead_bytes + usage.payload_bytes
+
+
+@pytest.mark.parametrize("cls", STRUCTURES)
+def test_payload_grows_with_the_elements(cls):
+    empty = cls().memory_usage()
+    values = [f"value {i}" * 3 for i in range(50)]
+    full = fill(cls(), values).memory_usage()
+    assert full.payload_bytes >= sum(sys.getsizeof(v) for v in values)
+    assert full.overhead_bytes > empty.overhead_bytes
+    assert str(full).startswith(f"{cls.__name__} memory usage (deep)")
+
+
+@pytest.mark.parametrize("cls", STRUCTURES)
+def test_deep_includes_what_elements_reference(cls):
+    values = [tuple(f"item {i}-{j}" for j in range(5)) for i in range(20)]
+    structure = fill(cls(), values)
+    deep = structure.memory_usage()
+    shallow = structure.memory_usage(deep=False)
+    assert deep.payload_bytes > shallow.payload_bytes
+    assert deep.overhead_bytes == shallow.overhead_bytes
+
+
+def test_shared_elements_are_counted_once():
+    shared = "x" * 1000
+    once = fill(LinkedList(), [shared]).memory_usage().payload_bytes
+    many = fill(LinkedList(), [shared] * 10).memory_usage().payload_bytes
+    assert many == once
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_modules_run_as_scripts(script, tmp_path):
+    # From an unrelated directory, so only the module's own path setup applies
+    result = subprocess.run([sys.executable, str(ROOT / script)], cwd=tmp_path,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout
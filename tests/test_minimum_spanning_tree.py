@@ -0,0 +1,134 @@
+"""Tests for UnionFind and the Kruskal and Prim minimum spanning trees."""
+
+import random
+from operator import itemgetter
+
+import pytest
+
+from Algorithms.Graphs.Python import Minimum_Spanning_Tree as mst
+from Algorithms.Graphs.Python.Minimum_Spanning_Tree import (
+    kruskal, kruskal_edges, prim, prim_edges)
+from Algorithms.Sorting.Python.External_Merge_Sort import external_sort
+from Data_Structures.Graphs.Python.Graphs import Graph
+from Data_Structures.Union_Find.Python.Union_Find import UnionFind
+
+
+def random_graph(seed, vertices=30, edges=80):
+    rng = random.Random(seed)
+    graph = Graph()
+    for v in range(vertices):
+        graph.add_vertex(v)
+    for _ in range(edges):
+        u, v = rng.sample(range(vertices), 2)
+        graph.add_edge(u, v, rng.randint(1, 50))
+    return graph
+
+
+def components(graph):
+    """Number of connected components, found with a UnionFind."""
+    forest = UnionFind(graph.adjacency)
+    for u, neighbors in graph.adjacency.items():
+        for v, _ in neighbors:
+            forest.union(u, v)
+    return forest.count
+
+
+def total(edges):
+    return sum(weight for _, _, weight in edges)
+
+
+def test_union_find_basics():
+    forest = UnionFind("abcd")
+    assert forest.count == 4
+    assert forest.union("a", "b")
+    assert not forest.union("b", "a")
+    assert forest.connected("a", "b")
+    assert not forest.connected("a", "c")
+    forest.union("c", "d")
+    forest.union("a", "d")
+    assert forest.count == 1
+    assert forest.find("c") == forest.find("b")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_kruskal_and_prim_agree(seed):
+    graph = random_graph(seed)
+    kruskal_tree = list(kruskal_edges(graph))
+    prim_tree = list(prim_edges(graph))
+    assert total(kruskal_tree) == total(prim_tree)
+    forest_size = len(graph.adjacency) - components(graph)
+    assert len(kruskal_tree) == len(prim_tree) == forest_size
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_kruskal_is_minimal_by_exchange(seed):
+    # Every non-tree edge must be at least as heavy as the heaviest edge on
+    # the tree path between its endpoints (the cycle property)
+    graph = random_graph(seed, vertices=12, edges=30)
+    tree = kruskal(graph)
+    for u, neighbors in graph.adjacency.items():
+        for v, weight in neighbors:
+            path_max = _max_on_path(tree, u, v)
+            assert path_max is not None and path_max <= weight
+
+
+def _max_on_path(tree, source, target):
+    stack, seen = [(source, 0)], {source}
+    while stack:
+        vertex, heaviest = stack.pop()
+        if vertex == target:
+            return heaviest
+        for neighbor, weight in tree.adjacency[vertex]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append((neighbor, max(heaviest, weight)))
+    return None
+
+
+def test_disconnected_graph_gives_a_forest():
+    graph = Graph()
+    graph.add_edge("a", "b", 1)
+    graph.add_edge("b", "c", 2)
+    graph.add_edge("a", "c", 3)
+    graph.add_edge("x", "y", 5)
+    graph.add_vertex("lonely")
+    for tree in (kruskal(graph), prim(graph)):
+        assert set(tree.adjacency) == set(graph.adjacency)
+        assert components(tree) == 3
+    assert sorted(total([e]) for e in kruskal_edges(graph)) == [1, 2, 5]
+
+
+def test_directed_graph_is_rejected():
+    graph = Graph(directed=True)
+    graph.add_edge(1, 2, 1)
+    with pytest.raises(ValueError):
+        list(kruskal_edges(graph))
+    with pytest.raises(ValueError):
+        prim(graph)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_edge_streams_match_the_graph(seed):
+    graph = random_graph(seed)
+    edges = [(u, v, w) for u, neighbors in graph.adjacency.items()
+             for v, w in neighbors if u < v]
+    random.Random(seed).shuffle(edges)
+    expected = total(kruskal_edges(graph))
+    assert total(kruskal_edges(iter(edges))) == expected
+    presorted = sorted(edges, key=itemgetter(2))
+    assert total(kruskal_edges(iter(presorted), presorted=True)) == expected
+
+
+def test_unsorted_stream_is_sorted_externally(monkeypatch):
+    calls = []
+
+    def small_runs(iterable, key=None):
+        calls.append(key)
+        return external_sort(iterable, key=key, run_size=3)  # Spills to disk
+
+    monkeypatch.setattr(mst, "external_sort", small_runs)
+    edges = [("a", "b", 4), ("b", "c", 1), ("a", "c", 2), ("c", "d", 7),
+             ("b", "d", 3), ("a", "d", 9)]
+    assert list(kruskal_edges(edges)) == [("b", "c", 1), ("a", "c", 2),
+                                          ("b", "d", 3)]
+    assert len(calls) == 1
@@ -0,0 +1,82 @@
+"""Tests for the __slots__ nodes and the NodePool free list."""
+
+import pytest
+
+from Data_Structures.Linked_Lists.Python.Linked_Lists import LinkedList, Node, NodePool
+from Data_Structures.Stacks.Python import Stack_LinkedList
+
+
+def test_nodes_have_no_instance_dict():
+    for node in (Node(1), Stack_LinkedList.Node(1)):
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+
+
+def test_acquire_allocates_then_reuses():
+    pool = NodePool()
+    first = pool.acquire("a")
+    assert (first.data, first.next, pool.allocated, pool.reused) == ("a", None, 1, 0)
+
+    pool.release(first)
+    assert len(pool) == 1 and first.data is None
+    second = pool.acquire("b")
+    assert second is first
+    assert (second.data, second.next, pool.allocated, pool.reused, len(pool)) == ("b", None, 1, 1, 0)
+
+
+def test_max_size_discards_extra_nodes():
+    pool = NodePool(max_size=2)
+    for node in [Node(i) for i in range(5)]:
+        pool.release(node)
+    assert len(pool) == 2
+
+
+def test_release_chain_returns_every_node():
+    pool = NodePool()
+    head = Node(0)
+    head.next = Node(1)
+    head.next.next = Node(2)
+    pool.release_chain(head)
+    assert len(pool) == 3
+
+
+def test_node_class_is_used_for_new_nodes():
+    pool = NodePool(node_class=Stack_LinkedList.Node)
+    assert type(pool.acquire(1)) is Stack_LinkedList.Node
+
+
+def test_linked_list_recycles_removed_nodes():
+    pool = NodePool()
+    linked_list = LinkedList(pool=pool)
+    for round_number in range(3):
+        for i in range(100):
+            linked_list.append(i)
+        assert linked_list.to_list() == list(range(100))
+        for i in range(50):
+            assert linked_list.pop_first() == i
+        linked_list.clear()
+    assert pool.allocated == 100
+    assert pool.reused == 200
+
+
+def test_pool_is_shared_between_lists():
+    pool = NodePool()
+    first, second = LinkedList(pool=pool), LinkedList(pool=pool)
+    first.extend(range(10))
+    first.clear()
+    second.extend(range(10))
+    assert pool.allocated == 10 and pool.reused == 10
+    assert second.to_list() == list(range(10))
+
+
+def test_stack_uses_the_shared_pool():
+    assert Stack_LinkedList.NodePool is NodePool
+    stack = Stack_LinkedList.Stack(pool=NodePool(node_class=Stack_LinkedList.Node))
+    for round_number in range(2):
+        for i in range(20):
+            stack.push(i)
+        assert [stack.pop() for _ in range(20)] == list(range(19, -1, -1))
+    assert stack.pool.allocated == 20
+    assert stack.pool.reused == 20
+    assert stack.is_empty()
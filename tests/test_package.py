@@ -0,0 +1,73 @@
+"""Tests for the Data_Structures namespace and its lazy loading."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import Data_Structures as ds
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_python(code, **env):
+    """Run code in a fresh interpreter and return its stripped stdout."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, **env}, check=True)
+    return completed.stdout.strip()
+
+
+@pytest.mark.parametrize("name", sorted(ds._EXPORTS))
+def test_every_export_resolves(name):
+    if name == "GraphMatrix" and importlib.util.find_spec("numpy") is None:
+        pytest.skip("GraphMatrix requires NumPy")
+    value = getattr(ds, name)
+    assert isinstance(value, type)
+    assert name in dir(ds)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        ds.NotAStructure
+
+
+def test_array_is_the_class_not_the_subpackage():
+    assert isinstance(ds.Array, type)
+
+
+def test_importing_the_package_loads_no_structure():
+    loaded = run_python(
+        "import sys, Data_Structures\n"
+        "print(sorted(m for m in sys.modules if m.startswith('Data_Structures.')"
+        " and m.count('.') > 2))")
+    assert loaded == "[]"
+
+
+def test_using_one_structure_loads_only_its_module():
+    loaded = run_python(
+        "import sys, Data_Structures as ds\n"
+        "ds.SegmentedStack()\n"
+        "print(sorted(m for m in sys.modules if m.startswith('Data_Structures.')"
+        " and m.count('.') > 2))")
+    assert loaded == "['Data_Structures.Stacks.Python.Stack_Segmented']"
+
+
+def test_accelerated_class_loads_only_its_own_module():
+    loaded = run_python(
+        "import sys, Data_Structures as ds\n"
+        "ds.HashTable()\n"
+        "print(sorted(m for m in sys.modules if m.startswith('Data_Structures.')"
+        " and m.count('.') > 2))")
+    assert loaded == "['Data_Structures.Hash_Table.Python.Hash_Table']"
+
+
+def test_pure_python_can_be_forced():
+    output = run_python(
+        "import Data_Structures as ds\n"
+        "print(ds.ACCELERATED, ds.LinkedList.__module__)",
+        DSA_PURE_PYTHON="1")
+    assert output == "False Data_Structures.Linked_Lists.Python.Linked_Lists"
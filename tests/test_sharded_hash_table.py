@@ -0,0 +1,141 @@
+"""Tests for ConsistentHashRing and ShardedHashTable."""
+
+import threading
+from multiprocessing import Pipe
+from multiprocessing.connection import Client
+
+import pytest
+
+from Data_Structures import ConsistentHashRing, ShardedHashTable
+from Data_Structures.Hash_Table.Python.Sharded_Hash_Table import key_hash, serve
+
+KEYS = [f"key-{i}" for i in range(3000)]
+
+
+def in_arc(position, start, end):
+    """True if start < position <= end on the ring, wrapping around."""
+    if start < end:
+        return start < position <= end
+    return position > start or position <= end
+
+
+def test_key_hash_is_deterministic_and_equal_keys_agree():
+    assert key_hash("abc") == key_hash("abc")
+    assert key_hash(("a", 1)) == key_hash(("a", 1.0))
+    assert key_hash(1) == key_hash(1.0) == key_hash(True)
+    assert key_hash("abc") != key_hash(b"abd")
+
+
+def test_ring_spreads_keys_over_nodes():
+    ring = ConsistentHashRing(virtual_nodes=128)
+    for node in "ABCD":
+        ring.add_node(node)
+    counts = {node: 0 for node in "ABCD"}
+    for key in KEYS:
+        counts[ring.node_for(key)] += 1
+    assert min(counts.values()) > len(KEYS) / 4 * 0.6
+    assert list(ring) == list("ABCD")
+    assert len(ring) == 4 and "A" in ring
+
+
+def test_adding_a_node_moves_exactly_the_reported_arcs():
+    ring = ConsistentHashRing(virtual_nodes=32)
+    for node in "ABC":
+        ring.add_node(node)
+    before = {key: ring.node_for(key) for key in KEYS}
+    moved = ring.add_node("D")
+    for key in KEYS:
+        owner = ring.node_for(key)
+        position = key_hash(key)
+        in_moved = any(in_arc(position, start, end) for start, end in moved.get(before[key], []))
+        assert (owner != before[key]) == in_moved
+        assert owner in (before[key], "D")
+
+
+def test_removing_a_node_restores_the_previous_owners():
+    ring = ConsistentHashRing(virtual_nodes=16)
+    for node in "ABC":
+        ring.add_node(node)
+    before = {key: ring.node_for(key) for key in KEYS}
+    ring.add_node("D")
+    ring.remove_node("D")
+    assert {key: ring.node_for(key) for key in KEYS} == before
+
+
+def test_ring_errors():
+    ring = ConsistentHashRing()
+    with pytest.raises(LookupError):
+        ring.node_for("x")
+    ring.add_node("A")
+    with pytest.raises(ValueError):
+        ring.add_node("A")
+    with pytest.raises(KeyError):
+        ring.remove_node("B")
+    with pytest.raises(ValueError):
+        ConsistentHashRing(virtual_nodes=0)
+
+
+@pytest.fixture(scope="module")
+def table():
+    with ShardedHashTable(shards=3, virtual_nodes=32, buckets=64) as table:
+        yield table
+
+
+def test_operations_and_batches(table):
+    table.insert("a", 1)
+    assert table.get("a") == 1
+    assert table.contains("a")
+    table.delete("a")
+    assert not table.contains("a")
+    with pytest.raises(KeyError):
+        table.get("a")
+    with pytest.raises(KeyError):
+        table.delete("a")
+
+    table.insert_many((key, i) for i, key in enumerate(KEYS[:500]))
+    assert table.get_many(KEYS[:500]) == list(range(500))
+    assert table.get_many(["missing", KEYS[0]], default=-1) == [-1, 0]
+    assert len(table) == 500
+
+
+def test_adding_and_removing_shards_keeps_every_key(table):
+    table.insert_many((key, key.upper()) for key in KEYS)
+    moved = table.add_shard("extra")
+    assert 0 < moved < len(KEYS)
+    assert table.shard_sizes()["extra"] == moved
+    assert table.get_many(KEYS) == [key.upper() for key in KEYS]
+    assert table.remove_shard("extra") == moved
+    assert "extra" not in table.shards
+    assert table.get_many(KEYS) == [key.upper() for key in KEYS]
+    with pytest.raises(ValueError):
+        table.add_shard(table.shards[0])
+    with pytest.raises(KeyError):
+        table.remove_shard("missing")
+
+
+def test_external_server_can_be_added():
+    authkey = b"test-key"
+    receiver, sender = Pipe(duplex=False)
+    server = threading.Thread(target=serve, kwargs={"authkey": authkey, "ready": sender},
+                              daemon=True)
+    server.start()
+    address = receiver.recv()
+    try:
+        with ShardedHashTable(shards=1) as table:
+            table.insert_many((key, 1) for key in KEYS[:200])
+            moved = table.add_shard("remote", address=address, authkey=authkey)
+            assert table.shard_sizes()["remote"] == moved > 0
+            assert table.get_many(KEYS[:200]) == [1] * 200
+    finally:
+        with Client(address, authkey=authkey) as client:
+            client.send(("shutdown", None))
+            client.recv()
+        server.join(timeout=5)
+    assert not server.is_alive()
+
+
+def test_serve_requires_an_authkey():
+    with pytest.raises(ValueError):
+        serve(authkey=None)
+    with pytest.raises(ValueError):
+        ShardedHashTable(shards=0)
@@ -0,0 +1,145 @@
+"""Tests for ConcurrentStack and AsyncStack."""
+
+import asyncio
+import threading
+
+import pytest
+
+from Data_Structures import AsyncStack, ConcurrentStack
+
+
+def test_lifo_order_and_batches():
+    stack = ConcurrentStack()
+    stack.push(1)
+    stack.push_many([2, 3, 4])
+    assert stack.peek() == 4
+    assert stack.pop_many(2) == [4, 3]
+    assert stack.pop() == 2
+    assert stack.steal() == [1]
+    assert stack.is_empty()
+
+
+def test_steal_takes_from_the_bottom():
+    stack = ConcurrentStack()
+    stack.push_many(range(5))
+    assert stack.steal(2) == [0, 1]
+    assert stack.pop() == 4
+    assert stack.steal(10) == [2, 3]
+    assert stack.steal() == []
+
+
+def test_timeouts_and_non_blocking_calls():
+    stack = ConcurrentStack(capacity=1)
+    with pytest.raises(IndexError):
+        stack.pop(timeout=0.01)
+    with pytest.raises(IndexError):
+        stack.pop(block=False)
+    stack.push("x")
+    with pytest.raises(OverflowError):
+        stack.push("y", timeout=0.01)
+    with pytest.raises(OverflowError):
+        stack.push("y", block=False)
+
+
+def test_invalid_capacity_and_batch():
+    with pytest.raises(ValueError):
+        ConcurrentStack(capacity=0)
+    with pytest.raises(ValueError):
+        ConcurrentStack(capacity=2).push_many([1, 2, 3])
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_pop_many_non_positive_returns_immediately(n):
+    stack = ConcurrentStack()
+    assert stack.pop_many(n) == []  # Would block forever if it waited
+
+
+def test_producers_and_consumers_move_every_item():
+    stack = ConcurrentStack(capacity=4)
+    results = []
+    results_lock = threading.Lock()
+
+    def producer(start):
+        for i in range(start, start + 200):
+            stack.push(i)
+
+    def batch_producer(start):
+        for i in range(start, start + 200, 2):
+            stack.push_many([i, i + 1])
+
+    def consumer():
+        taken = 0
+        while taken < 200:
+            items = stack.pop_many(3, timeout=5)
+            taken += len(items)
+            with results_lock:
+                results.extend(items)
+
+    threads = [threading.Thread(target=producer, args=(0,)),
+               threading.Thread(target=batch_producer, args=(200,)),
+               threading.Thread(target=consumer),
+               threading.Thread(target=consumer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert sorted(results) == list(range(400))
+
+
+def test_pop_wakes_a_waiting_batch_push():
+    stack = ConcurrentStack(capacity=2)
+    stack.push_many([1, 2])
+    done = threading.Event()
+
+    def pusher():
+        stack.push_many(["a", "b"], timeout=5)
+        done.set()
+
+    thread = threading.Thread(target=pusher)
+    thread.start()
+    stack.pop()
+    stack.pop()
+    thread.join(timeout=5)
+    assert done.is_set()
+    assert stack.pop_many(2) == ["b", "a"]
+
+
+def test_async_stack_can_be_created_outside_the_loop():
+    stack = AsyncStack(capacity=2)  # No running loop yet
+
+    async def main():
+        consumer = asyncio.create_task(stack.pop_many(5))
+        await stack.push_many([1, 2])
+        first = await consumer
+        await stack.push(3)
+        return first, await stack.pop()
+
+    assert asyncio.run(main()) == ([2, 1], 3)
+
+
+def test_async_timeouts_and_pop_many_zero():
+    async def main():
+        stack = AsyncStack(capacity=1)
+        assert await stack.pop_many(0) == []
+        with pytest.raises(IndexError):
+            await stack.pop(timeout=0.01)
+        await stack.push("x")
+        with pytest.raises(OverflowError):
+            await stack.push("y", timeout=0.01)
+        assert stack.peek() == "x"
+
+    asyncio.run(main())
+
+
+def test_async_batch_push_waits_for_room():
+    async def main():
+        stack = AsyncStack(capacity=2)
+        await stack.push_many([1, 2])
+        pusher = asyncio.create_task(stack.push_many(["a", "b"], timeout=5))
+        await asyncio.sleep(0)
+        assert await stack.pop() == 2
+        assert await stack.pop() == 1
+        await pusher
+        return await stack.pop_many(2)
+
+    assert asyncio.run(main()) == ["b", "a"]
@@ -0,0 +1,67 @@
+"""Tests for SegmentedStack."""
+
+import random
+
+import pytest
+
+from Data_Structures import SegmentedStack
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_random_operations_match_list(chunk_size):
+    rng = random.Random(chunk_size)
+    stack, expected = SegmentedStack(chunk_size=chunk_size), []
+    for step in range(2000):
+        if expected and rng.random() < 0.45:
+            assert stack.pop() == expected.pop()
+        else:
+            stack.push(step)
+            expected.append(step)
+        assert stack.get_size() == len(expected)
+        assert stack.peek() == (expected[-1] if expected else None)
+    assert list(stack) == expected[::-1]
+
+
+def test_pop_from_empty_stack_raises():
+    stack = SegmentedStack(chunk_size=2)
+    with pytest.raises(IndexError):
+        stack.pop()
+    stack.push(1)
+    stack.pop()
+    with pytest.raises(IndexError):
+        stack.pop()
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SegmentedStack(chunk_size=0)
+
+
+def test_spare_chunk_is_reused_across_a_boundary():
+    stack = SegmentedStack(chunk_size=2)
+    stack.push(1)
+    stack.push(2)
+    stack.push(3)  # Opens a second chunk
+    second = stack._chunk
+    stack.pop()
+    stack.pop()  # Moves down and keeps the empty chunk as the spare
+    assert stack._spare is second
+    stack.push(2)
+    stack.push(3)
+    assert stack._chunk is second
+    assert stack._spare is None
+
+
+def test_popped_items_are_not_referenced():
+    stack = SegmentedStack(chunk_size=4)
+    stack.push(object())
+    stack.pop()
+    assert stack._chunk.items == [None] * 4
+
+
+def test_str():
+    stack = SegmentedStack(chunk_size=2)
+    assert str(stack) == "Empty Stack"
+    for item in "abc":
+        stack.push(item)
+    assert str(stack) == "TOP -> c -> b -> a -> None"
@@ -0,0 +1,67 @@
+"""Tests for TypedStack."""
+
+from array import array
+
+import pytest
+
+from Data_Structures import TypedStack
+
+
+def test_push_pop_and_peek():
+    stack = TypedStack('q', [1, 2])
+    stack.push(3)
+    assert stack.peek() == 3
+    assert stack.pop() == 3
+    assert len(stack) == stack.get_size() == 2
+    assert stack.typecode == 'q'
+    stack.clear()
+    assert stack.is_empty()
+    assert stack.peek() is None
+    with pytest.raises(IndexError):
+        stack.pop()
+
+
+def test_batches_keep_the_last_item_on_top():
+    stack = TypedStack('d')
+    stack.push_many([1.5, 2.5, 3.5])
+    assert stack.peek_n(2) == array('d', [3.5, 2.5])
+    assert stack.pop_many(2) == array('d', [3.5, 2.5])
+    assert stack.pop_many(0) == array('d')
+    assert list(stack.stack) == [1.5]
+    with pytest.raises(IndexError):
+        stack.pop_many(2)
+    with pytest.raises(IndexError):
+        stack.peek_n(2)
+
+
+def test_push_many_accepts_raw_bytes():
+    source = array('i', [7, 8, 9])
+    stack = TypedStack('i')
+    stack.push_many(source.tobytes())
+    stack.push_many(memoryview(source))
+    assert list(stack.stack) == [7, 8, 9, 7, 8, 9]
+
+
+def test_values_are_checked_against_the_typecode():
+    stack = TypedStack('b')
+    with pytest.raises(OverflowError):
+        stack.push(1000)
+    with pytest.raises(TypeError):
+        stack.push("x")
+
+
+def test_memoryview_shares_the_buffer():
+    stack = TypedStack('q', [1, 2, 3])
+    view = stack.memoryview()
+    assert view.format == 'q'
+    assert view.tolist() == [1, 2, 3]
+    with pytest.raises(BufferError):
+        stack.push(4)  # Can't resize while a view is exported
+    view.release()
+    stack.push(4)
+    assert bytes(memoryview(stack.stack)) == array('q', [1, 2, 3, 4]).tobytes()
+
+
+def test_str():
+    assert str(TypedStack()) == "Empty Stack"
+    assert str(TypedStack('q', [1, 2])) == "TOP -> 2 -> 1 -> None"
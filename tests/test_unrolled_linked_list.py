@@ -0,0 +1,126 @@
+"""Tests for UnrolledLinkedList: block invariant, operations and iteration."""
+
+import math
+import random
+
+import pytest
+
+from Data_Structures import UnrolledLinkedList
+
+
+def check_nodes(unrolled):
+    """Assert the links, the length and the half-full invariant."""
+    nodes = []
+    node, prev = unrolled.head, None
+    while node:
+        assert node.prev is prev
+        nodes.append(node)
+        prev, node = node, node.next
+    assert unrolled.tail is prev
+    assert sum(len(n.elements) for n in nodes) == len(unrolled)
+    for n in nodes:
+        assert 0 < len(n.elements) <= unrolled.capacity
+    for n in nodes[:-1]:
+        assert len(n.elements) >= unrolled.capacity // 2
+
+
+@pytest.mark.parametrize("capacity", [2, 3, 4, 16])
+def test_random_operations_match_list(capacity):
+    rng = random.Random(capacity)
+    unrolled, expected = UnrolledLinkedList(capacity=capacity), []
+    for step in range(3000):
+        op = rng.choice(["append", "prepend", "insert", "pop", "pop_first",
+                         "reverse"])
+        if op == "append":
+            unrolled.append(step)
+            expected.append(step)
+        elif op == "prepend":
+            unrolled.prepend(step)
+            expected.insert(0, step)
+        elif op == "insert":
+            index = rng.randint(0, len(expected))
+            unrolled.insert(index, step)
+            expected.insert(index, step)
+        elif op == "reverse" and rng.random() < 0.1:
+            unrolled.reverse()
+            expected.reverse()
+        elif expected and op == "pop":
+            assert unrolled.pop() == expected.pop()
+        elif expected and op == "pop_first":
+            assert unrolled.pop_first() == expected.pop(0)
+        check_nodes(unrolled)
+    assert unrolled.to_list() == expected
+    assert [unrolled.lookup(i) for i in range(len(expected))] == expected
+
+
+def test_appends_fill_nodes_completely():
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(10))
+    node, sizes = unrolled.head, []
+    while node:
+        sizes.append(len(node.elements))
+        node = node.next
+    assert sizes == [4, 4, 2]
+
+
+def test_pop_unlinks_the_tail_node():
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(5))
+    old_tail = unrolled.tail
+    assert unrolled.pop() == 4
+    assert unrolled.tail is not old_tail
+    assert unrolled.tail.next is None
+    check_nodes(unrolled)
+
+
+def test_pop_from_empty_list_raises():
+    unrolled = UnrolledLinkedList()
+    with pytest.raises(IndexError):
+        unrolled.pop()
+    with pytest.raises(IndexError):
+        unrolled.pop_first()
+
+
+def test_capacity_below_two_is_rejected():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(capacity=1)
+
+
+def test_iteration_and_reversed():
+    unrolled = UnrolledLinkedList(capacity=3)
+    unrolled.extend(range(20))
+    assert list(unrolled) == list(range(20))
+    assert list(reversed(unrolled)) == list(range(19, -1, -1))
+
+
+@pytest.mark.parametrize("key", [
+    slice(None), slice(3, 15), slice(None, None, 4), slice(17, 2, -3),
+    slice(None, None, -1), slice(-5, None), slice(5, 5), slice(30, 40),
+])
+def test_slices_match_list(key):
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(20))
+    assert list(unrolled[key]) == list(range(20))[key]
+
+
+def test_integer_indexing():
+    unrolled = UnrolledLinkedList(capacity=4)
+    unrolled.extend(range(10))
+    assert unrolled[0] == 0
+    assert unrolled[-1] == 9
+    assert unrolled[-10] == 0
+    with pytest.raises(IndexError):
+        unrolled[10]
+    with pytest.raises(IndexError):
+        unrolled[-11]
+    with pytest.raises(TypeError):
+        unrolled["0"]
+
+
+def test_find_compares_with_equality():
+    nan = math.nan
+    unrolled = UnrolledLinkedList(capacity=2)
+    unrolled.extend([1, 2, nan, 3.0])
+    assert unrolled.find(3) == 3
+    assert unrolled.find(nan) == -1  # No identity shortcut, like LinkedList
+    assert unrolled.find(99) == -1